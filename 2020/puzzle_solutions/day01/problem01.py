@@ -1,9 +1,21 @@
+from pathlib import Path
+
 import numpy as np
-# import the data
-infile = np.genfromtxt("inputs/2020/day1.txt", dtype=int)
-# produce an array of 2020-the input
-search_arr = (infile-2020)*-1
-intersects = np.intersect1d(infile, search_arr)
-# product of the intersects
-prod = np.prod(intersects)
-print("Answer: ", intersects, " which sum to ", np.sum(intersects), " and product of these is ", prod)
\ No newline at end of file
+
+INPUT_FILE = Path(__file__).resolve().parents[2] / "inputs" / "day1.txt"
+
+
+def main(input_file=INPUT_FILE):
+    # import the data
+    infile = np.genfromtxt(input_file, dtype=int)
+    # produce an array of 2020-the input
+    search_arr = (infile-2020)*-1
+    intersects = np.intersect1d(infile, search_arr)
+    # product of the intersects
+    prod = np.prod(intersects)
+    print("Answer: ", intersects, " which sum to ", np.sum(intersects), " and product of these is ", prod)
+    return prod
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,6 @@
-# Import the data as a list
-infile = open("inputs/2020/day4.txt", 'r') 
-Lines = [line.strip() for line in infile.readlines()] 
+from pathlib import Path
 
-# Init variables
-passport_data = {}
-database = []
-invalid = 0
-valid = 0
+INPUT_FILE = Path(__file__).resolve().parents[2] / "inputs" / "day4.txt"
 
 # Structure and populate the database
 # byr (Birth Year)
@@ -18,17 +12,35 @@ valid = 0
 # pid (Passport ID)
 # cid (Country ID)
 keys = ("byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid") #, "cid"} - We are excluding this one for the purpose of the question, naughty elf!
-for line in Lines:
-    if line != '':
-        a = [l.split(':') for l in line.split(' ')]
-        for item in a:
-            passport_data[item[0]] = item[1]
-    if line == '' or ((line == Lines[-1]) and (line != '')):
-        if set(keys) <= passport_data.keys():
-            valid+=1
-        else:
-            invalid+=1
-        database.append(passport_data.copy())
-        passport_data.clear()
-
-print("Valid passports: ", valid, "\nInvalid passports: ", invalid, "\nTotal passports: ", valid + invalid, "\nTotal database size: ", len(database))
\ No newline at end of file
+
+
+def main(input_file=INPUT_FILE):
+    # Import the data as a list
+    with open(input_file, 'r') as infile:
+        Lines = [line.strip() for line in infile.readlines()]
+
+    # Init variables
+    passport_data = {}
+    database = []
+    invalid = 0
+    valid = 0
+
+    for line in Lines:
+        if line != '':
+            a = [l.split(':') for l in line.split(' ')]
+            for item in a:
+                passport_data[item[0]] = item[1]
+        if line == '' or ((line == Lines[-1]) and (line != '')):
+            if set(keys) <= passport_data.keys():
+                valid+=1
+            else:
+                invalid+=1
+            database.append(passport_data.copy())
+            passport_data.clear()
+
+    print("Valid passports: ", valid, "\nInvalid passports: ", invalid, "\nTotal passports: ", valid + invalid, "\nTotal database size: ", len(database))
+    return valid
+
+
+if __name__ == "__main__":
+    main()
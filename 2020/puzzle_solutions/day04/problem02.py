@@ -1,13 +1,7 @@
 import re
-# Import the data as a list
-infile = open("inputs/2020/day4.txt", 'r') 
-Lines = [line.strip() for line in infile.readlines()] 
+from pathlib import Path
 
-# Init variables
-passport_data = {}
-database = []
-invalid = 0
-valid = 0
+INPUT_FILE = Path(__file__).resolve().parents[2] / "inputs" / "day4.txt"
 
 # Structure and populate the database
 # byr (Birth Year)
@@ -57,20 +51,35 @@ def validate(inp: dict):
         if not valid:
             break
     return valid
-        
-        
 
-for line in Lines:
-    if line != '':
-        a = [l.split(':') for l in line.split(' ')]
-        for item in a:
-            passport_data[item[0]] = item[1]
-    if line == '' or ((line == Lines[-1]) and (line != '')):
-        if fields.keys() <= passport_data.keys() and validate(passport_data):
-            valid+=1
-        else:
-            invalid+=1
-        database.append(passport_data.copy())
-        passport_data.clear()
 
-print("Valid passports: ", valid, "\nInvalid passports: ", invalid, "\nTotal passports: ", valid + invalid, "\nTotal database size: ", len(database))
\ No newline at end of file
+def main(input_file=INPUT_FILE):
+    # Import the data as a list
+    with open(input_file, 'r') as infile:
+        Lines = [line.strip() for line in infile.readlines()]
+
+    # Init variables
+    passport_data = {}
+    database = []
+    invalid = 0
+    valid = 0
+
+    for line in Lines:
+        if line != '':
+            a = [l.split(':') for l in line.split(' ')]
+            for item in a:
+                passport_data[item[0]] = item[1]
+        if line == '' or ((line == Lines[-1]) and (line != '')):
+            if fields.keys() <= passport_data.keys() and validate(passport_data):
+                valid+=1
+            else:
+                invalid+=1
+            database.append(passport_data.copy())
+            passport_data.clear()
+
+    print("Valid passports: ", valid, "\nInvalid passports: ", invalid, "\nTotal passports: ", valid + invalid, "\nTotal database size: ", len(database))
+    return valid
+
+
+if __name__ == "__main__":
+    main()
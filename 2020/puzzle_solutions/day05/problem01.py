@@ -1,27 +1,37 @@
 import math
+from pathlib import Path
 
-# Import the data as a list
-infile = open("inputs/2020/day5.txt", 'r') 
-Lines = [line.strip() for line in infile.readlines()] 
+INPUT_FILE = Path(__file__).resolve().parents[2] / "inputs" / "day5.txt"
 
-seat_ids = []
 
-for seat in Lines:
-    row = list(range(0, 128, 1))
-    col = list(range(0, 8, 1))
+def main(input_file=INPUT_FILE):
+    # Import the data as a list
+    with open(input_file, 'r') as infile:
+        Lines = [line.strip() for line in infile.readlines()]
 
-    for char in seat:
-        if char == 'F':
-            row = row[0:math.floor(len(row)/2)]
-        elif char == 'B':
-            row = row[math.ceil(len(row)/2):]
-        elif char == 'R':
-            col = col[math.ceil(len(col)/2):]
-        elif char == 'L':
-            col = col[0:math.floor(len(col)/2)]
+    seat_ids = []
 
-    seat_id = row[0] * 8 + col[0]
-    print("Boarding Pass: ", seat, "Seat ID: ", seat_id)
-    seat_ids.append(seat_id)
+    for seat in Lines:
+        row = list(range(0, 128, 1))
+        col = list(range(0, 8, 1))
 
-print("Max seat ID: ", max(seat_ids), "Min seat ID: ", min(seat_ids))
\ No newline at end of file
+        for char in seat:
+            if char == 'F':
+                row = row[0:math.floor(len(row)/2)]
+            elif char == 'B':
+                row = row[math.ceil(len(row)/2):]
+            elif char == 'R':
+                col = col[math.ceil(len(col)/2):]
+            elif char == 'L':
+                col = col[0:math.floor(len(col)/2)]
+
+        seat_id = row[0] * 8 + col[0]
+        print("Boarding Pass: ", seat, "Seat ID: ", seat_id)
+        seat_ids.append(seat_id)
+
+    print("Max seat ID: ", max(seat_ids), "Min seat ID: ", min(seat_ids))
+    return max(seat_ids)
+
+
+if __name__ == "__main__":
+    main()
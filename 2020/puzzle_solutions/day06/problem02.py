@@ -1,24 +1,34 @@
 import collections
+from pathlib import Path
 
-# Import the data as a list
-infile = open("inputs/2020/day6.txt", 'r') 
-Lines = [line.strip() for line in infile.readlines()] 
+INPUT_FILE = Path(__file__).resolve().parents[2] / "inputs" / "day6.txt"
 
-groups = {1:[]}
 
-i = 1
-for line in Lines:
-    if line != '':
-        groups[i].append(line)
-    elif line == '':
-        i+=1
-        groups[i] = []
+def main(input_file=INPUT_FILE):
+    # Import the data as a list
+    with open(input_file, 'r') as infile:
+        Lines = [line.strip() for line in infile.readlines()]
 
-summed = 0
-for g in groups.values():
-    g_combined = ''.join(g)
-    freq = collections.Counter(g_combined)
-    duplicate_chars = [f for f in freq if freq[f] == len(g)]
-    summed+=len(duplicate_chars)
+    groups = {1:[]}
 
-print("Sum of duplicate counts: ", summed)
\ No newline at end of file
+    i = 1
+    for line in Lines:
+        if line != '':
+            groups[i].append(line)
+        elif line == '':
+            i+=1
+            groups[i] = []
+
+    summed = 0
+    for g in groups.values():
+        g_combined = ''.join(g)
+        freq = collections.Counter(g_combined)
+        duplicate_chars = [f for f in freq if freq[f] == len(g)]
+        summed+=len(duplicate_chars)
+
+    print("Sum of duplicate counts: ", summed)
+    return summed
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,49 @@
 import re
-import numpy as np
+from pathlib import Path
 
-# Import the data as a list
-infile = open("inputs/2020/day7.txt", 'r') 
-Lines = [line.strip() for line in infile.readlines()] 
+INPUT_FILE = Path(__file__).resolve().parents[2] / "inputs" / "day7.txt"
 
-bag_dict = {}
 
-for l in Lines:
-    tmp = [a.strip() for a in l.replace('bags','').replace('bag', '').replace('contain', ',').replace('.', '').split(',')]
-    bags = {}
-    for bag in tmp[1:]:
-        num = re.search(r'\d+', bag)
-        if num != None:
-            bags[re.sub(r'[^A-Za-z ]+', '', bag).strip().lower()] = int(num.group())
-    if len(bags.values()) > 0:
-        bag_dict[tmp[0].lower()] = bags
+def parse_bags(Lines: list):
+    bag_dict = {}
 
-print("Bags inside the shiny gold bag: ", bag_dict['shiny gold'])
+    for l in Lines:
+        tmp = [a.strip() for a in l.replace('bags','').replace('bag', '').replace('contain', ',').replace('.', '').split(',')]
+        bags = {}
+        for bag in tmp[1:]:
+            num = re.search(r'\d+', bag)
+            if num != None:
+                bags[re.sub(r'[^A-Za-z ]+', '', bag).strip().lower()] = int(num.group())
+        if len(bags.values()) > 0:
+            bag_dict[tmp[0].lower()] = bags
+    return bag_dict
 
-def returnSubBagsCount(bag_list: dict):
+
+def returnSubBagsCount(bag_list: dict, bag_dict: dict):
     sub_bags = 0
     for (bag,num) in bag_list.items():
         if bag in bag_dict.keys():
-            sub_bags += (num * returnSubBagsCount(bag_dict[bag])) + num
-        else:  
+            sub_bags += (num * returnSubBagsCount(bag_dict[bag], bag_dict)) + num
+        else:
             # If it is not in the dict then there are no sub bags, count just the number of those bags and return
             sub_bags += num
     return sub_bags
 
-count = returnSubBagsCount(bag_dict['shiny gold']) 
-        
 
-print("Number of bags in a shiny gold bag: ", count)
+def main(input_file=INPUT_FILE):
+    # Import the data as a list
+    with open(input_file, 'r') as infile:
+        Lines = [line.strip() for line in infile.readlines()]
+
+    bag_dict = parse_bags(Lines)
+
+    print("Bags inside the shiny gold bag: ", bag_dict['shiny gold'])
+
+    count = returnSubBagsCount(bag_dict['shiny gold'], bag_dict)
+
+    print("Number of bags in a shiny gold bag: ", count)
+    return count
+
+
+if __name__ == "__main__":
+    main()
@@ -8,23 +8,32 @@ import json
 # and save it to a file in the inputs folder.
 # It will also save a HTML copy of the puzzle page to the inputs folder.
 
-config = json.load(open("config.json", "r"))
+CONFIG_FILE = Path(__file__).resolve().parent / "config.json"
+
+
+def load_config(config_file: Path = CONFIG_FILE) -> dict:
+    # This used to be loaded at import time, it is now only read when a scraper
+    # is created so importing utils does not need a config.json
+    with open(config_file, "r") as f:
+        config = json.load(f)
+    if "cookie_file" not in config:
+        config["cookie_file"] = "C:\\Users\\Admin\\AppData\\Local\\Google\\Chrome\\User Data\\Profile 1\\Network\\Cookies"
+    return config
 
-if "cookie_file" not in config:
-    config["cookie_file"] = "C:\\Users\\Admin\\AppData\\Local\\Google\\Chrome\\User Data\\Profile 1\\Network\\Cookies"
 
 class PuzzleScraper:
     def __init__(self, year, day):
         self.year = year
         self.day = day
+        config = load_config()
         self.session_cookie = browser_cookie3.chrome(
             domain_name=".adventofcode.com",
             cookie_file=config["cookie_file"],
         )
         self.puzzle_page_url = f"https://adventofcode.com/{year}/day/{day}"
         self.puzzle_input_url = f"https://adventofcode.com/{year}/day/{day}/input"
-        self.puzzle_page_file = Path(f"inputs/{year}/day{day}.html")
-        self.puzzle_input_file = Path(f"inputs/{year}/day{day}.txt")
+        self.puzzle_page_file = Path(__file__).resolve().parent / "inputs" / f"day{day}.html"
+        self.puzzle_input_file = Path(__file__).resolve().parent / "inputs" / f"day{day}.txt"
         if not self.puzzle_page_file.parent.exists():
             self.puzzle_page_file.parent.mkdir(parents=True)
         if not self.puzzle_input_file.parent.exists():
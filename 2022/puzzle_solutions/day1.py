@@ -10,12 +10,7 @@ the most calories.
 
 from pathlib import Path
 
-input_file = Path("inputs/2022/day1.txt")
-if not input_file.exists():
-    print(
-        f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
-    )
-    exit()
+input_file = Path(__file__).resolve().parent.parent / "inputs" / "day1.txt"
 
 # Part 1
 # The solution to part 1 is to calculate which elf is carrying the most calories
@@ -71,5 +66,10 @@ def part2(sum_calories=None, input_file=input_file):
 
 
 if __name__ == "__main__":
+    if not input_file.exists():
+        print(
+            f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
+        )
+        exit()
     sum_calories = part1(input_file)
     part2(sum_calories=sum_calories, input_file=input_file)
@@ -1,8 +1,12 @@
 import sys
+from pathlib import Path
 
-sys.path.append(".")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import utils
 import re
+import numpy as np
+
+SCREEN_WIDTH = 40
 
 
 def cycle(
@@ -103,25 +107,76 @@ def draw_CRT(CRT: list):
     return output
 
 
+def compile_program(instructions: list):
+    """
+    Compiles the program into the change in X at the end of every cycle, noop
+    takes one cycle and changes nothing, addx takes two and adds its value at
+    the end of the second. The instructions are only parsed this once.
+    """
+    # Written out as one delta per cycle "noop" is "0" and "addx 15" is "0 15",
+    # so swapping the names for 0 turns the program into the tape itself
+    tape = " ".join(instructions).replace("noop", "0").replace("addx", "0")
+    return np.fromstring(tape, dtype=np.int64, sep=" ")
+
+
+def register_timeline(deltas: np.ndarray, X: int = 1):
+    """
+    Returns the value of X during every cycle, timeline[i] is X during cycle
+    i + 1, X only changes once a cycle has finished.
+    """
+    timeline = np.empty(len(deltas), dtype=np.int64)
+    if len(deltas):
+        timeline[0] = X
+        np.cumsum(deltas[:-1], out=timeline[1:])
+        timeline[1:] += X
+    return timeline
+
+
+def signal_strengths(timeline: np.ndarray, first: int = 20, every: int = 40):
+    """
+    Returns the signal strength, cycle number * X, during cycle 20, 60, 100, ...
+    """
+    cycles = np.arange(first, len(timeline) + 1, every)
+    return cycles * timeline[cycles - 1]
+
+
+def render_CRT(timeline: np.ndarray, width: int = SCREEN_WIDTH):
+    """
+    Returns the screen as a bool image with a row for every width cycles. A
+    pixel is lit when the sprite, X +/-1, covers the column being drawn.
+    """
+    rows = len(timeline) // width
+    columns = np.arange(width)
+    return np.abs(timeline[: rows * width].reshape(rows, width) - columns) <= 1
+
+
+def draw_image(image: np.ndarray):
+    # The same characters as draw_CRT, one string per row of the image
+    pixels = np.where(image, "██", "░░")
+    return "".join("".join(row) + "\n" for row in pixels)
+
+
 if __name__ == "__main__":
     # Part 1
     input_file = utils.get_input(day=10, year=2022)
     with open(input_file, "r") as f:
         input_data = f.read()
         instructions = input_data.splitlines()
-        # print(f"Instructions: {instructions}")
         # If the last line is blank, remove it
         instructions = instructions[:-1] if instructions[-1] == "" else instructions
-        x, cycle_num, signals, CRT = run_program(instructions, verbose=True)
-        print(f"Part 1: X={x}, cycle={cycle_num}, signals={signals}")
-        part_1_wanted_signals = [20, 60, 100, 140, 180, 220]
-        part_1_wanted_signals_idx = [int(a / 20) - 1 for a in part_1_wanted_signals]
-        print(f"Part 1 wanted signals: {part_1_wanted_signals}")
-        part_1_sum_signal = sum([signals[a] for a in part_1_wanted_signals_idx])
-        print(f"Part 1: signal strength = {part_1_sum_signal}")
+        # The program is compiled once and every cycle is worked out together,
+        # run_program(instructions, verbose=True) still steps through it
+        # printing the sprite at each cycle
+        deltas = compile_program(instructions)
+        timeline = register_timeline(deltas)
+        x = int(timeline[-1] + deltas[-1])
+        print(f"Part 1: X={x}, cycle={len(timeline)}")
+        # Cycles 20, 60, ..., 220 for a 240 cycle program
+        signals = signal_strengths(timeline)
+        print(f"Part 1: signal strength = {int(signals.sum())}")
         # Part 2
-        CRT_text = draw_CRT(CRT)
+        CRT_text = draw_image(render_CRT(timeline))
         print(f"Part 2: CRT =\n{CRT_text}")
         # Save to file
-        with open("outputs/2022/day10_part2_CRT.txt", "wb") as f:
-            f.write(CRT_text.encode("utf-8"))
\ No newline at end of file
+        with open(utils.OUTPUT_FOLDER / "day10_part2_CRT.txt", "wb") as f:
+            f.write(CRT_text.encode("utf-8"))
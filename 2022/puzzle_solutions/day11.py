@@ -1,5 +1,6 @@
 import sys
-sys.path.append(".")
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import utils
 import re
 import time
@@ -8,6 +9,7 @@ import time
 import ast
 import operator as op
 import math
+from collections import deque
 
 # supported operators
 operators = {ast.Add: op.add, ast.Sub: op.sub, ast.Mult: op.mul,
@@ -149,6 +151,124 @@ def do_the_rounds(monkeys: dict, rounds: int = 20, verbose: bool = False, divide
     return monkeys
 
     
+# Compiled monkeys
+# Looking at this again with fresh eyes, every inspection above rebuilds the
+# operation string and parses it with ast, reparses the test with int() and then
+# removes the item from a list (searching the list each time). The operations only
+# ever take three forms (old + n, old * n and old * old) so each monkey can be
+# compiled once into a tuple of plain ints and the items kept in deques.
+OP_ADD, OP_MUL, OP_SQUARE = 0, 1, 2
+
+
+def compile_monkeys(monkeys: dict):
+    """
+    Compile the parsed monkeys into a list of
+    (op_code, operand, divisor, if_true, if_false) tuples plus the starting items
+    """
+    rules = []
+    items = []
+    for monkey_num in sorted(monkeys):
+        monkey = monkeys[monkey_num]
+        left, operator_, right = monkey["operation"].split()
+        if left != "old":
+            raise ValueError(f"Unsupported operation {monkey['operation']}")
+        if right == "old":
+            op_code, operand = (OP_SQUARE, 0) if operator_ == "*" else (OP_MUL, 2)
+        elif operator_ == "+":
+            op_code, operand = OP_ADD, int(right)
+        elif operator_ == "*":
+            op_code, operand = OP_MUL, int(right)
+        else:
+            raise ValueError(f"Unsupported operation {monkey['operation']}")
+        rules.append(
+            (op_code, operand, int(monkey["test"]), int(monkey["if_true"]), int(monkey["if_false"]))
+        )
+        items.append(list(monkey["items"]))
+    return rules, items
+
+
+def apply_operation(op_code: int, operand: int, worry: int):
+    if op_code == OP_ADD:
+        return worry + operand
+    if op_code == OP_MUL:
+        return worry * operand
+    return worry * worry
+
+
+def run_compiled(rules: list, items: list, rounds: int = 20, divide_by: int = 3):
+    """
+    The same simulation as do_the_rounds on the compiled monkeys, returns the
+    number of inspections made by each monkey.
+    """
+    queues = [deque(monkey_items) for monkey_items in items]
+    inspections = [0] * len(rules)
+    common_modulo = math.prod(rule[2] for rule in rules)
+    for _ in range(rounds):
+        for monkey_num, (op_code, operand, divisor, if_true, if_false) in enumerate(rules):
+            queue = queues[monkey_num]
+            inspections[monkey_num] += len(queue)
+            while queue:
+                worry = apply_operation(op_code, operand, queue.popleft())
+                if divide_by != 0:
+                    worry //= divide_by
+                else:
+                    worry %= common_modulo
+                queues[if_true if worry % divisor == 0 else if_false].append(worry)
+    return inspections
+
+
+def run_per_item(rules: list, items: list, rounds: int = 10000):
+    """
+    Part 2 only (no dividing by 3), the items never affect each other so each one
+    can be followed on its own. Its state at the start of a round is just
+    (monkey, worry % common modulo), so once a state repeats the item is in a
+    cycle and the remaining rounds can be counted in bulk.
+    """
+    common_modulo = math.prod(rule[2] for rule in rules)
+    inspections = [0] * len(rules)
+    for start_monkey, monkey_items in enumerate(items):
+        for worry in monkey_items:
+            monkey_num = start_monkey
+            seen = {}
+            # The monkeys that inspected the item in each round so far
+            history = []
+            round_ = 0
+            while round_ < rounds:
+                state = (monkey_num, worry)
+                if state in seen:
+                    cycle_start = seen[state]
+                    cycle = history[cycle_start:]
+                    full_cycles, remainder = divmod(rounds - round_, len(cycle))
+                    for visited in cycle:
+                        for m in visited:
+                            inspections[m] += full_cycles
+                    for visited in cycle[:remainder]:
+                        for m in visited:
+                            inspections[m] += 1
+                    break
+                seen[state] = round_
+                visited = []
+                # Keep going while the item is thrown to a monkey later in the round
+                while True:
+                    op_code, operand, divisor, if_true, if_false = rules[monkey_num]
+                    visited.append(monkey_num)
+                    worry = apply_operation(op_code, operand, worry) % common_modulo
+                    target = if_true if worry % divisor == 0 else if_false
+                    if target < monkey_num:
+                        monkey_num = target
+                        break
+                    monkey_num = target
+                for m in visited:
+                    inspections[m] += 1
+                history.append(visited)
+                round_ += 1
+    return inspections
+
+
+def monkey_business_level(inspections: list, num: int = 2):
+    return math.prod(sorted(inspections, reverse=True)[:num])
+
+
 if __name__ == "__main__":
     """
     Input is in the form:
@@ -169,26 +289,21 @@ if __name__ == "__main__":
         # Part 1
         monkeys = do_the_rounds(monkeys=monkeys, rounds=20)
         most_active = get_most_active_monkeys(monkeys)
-        monkey_business_level = 1
+        business_level = 1
         for i,m in enumerate(most_active, 1):
             print(f"Monkey {m} was the {i} most active with {monkeys[m]['num_inspections']} inspections")
-            monkey_business_level *= monkeys[m]["num_inspections"]
-        print(f"The Monkey Business Level is {monkey_business_level}")
+            business_level *= monkeys[m]["num_inspections"]
+        print(f"The Monkey Business Level is {business_level}")
         print(f"Part 1 took {(time.time() - start_time):.2f} seconds")
         # Part 2
-        # This part is the same as part 1 but divide_by is 1 and the rounds is 10000
-        # There could be problems with bigint here! And it's a lot of iterations so
-        # the initial approach would be sloooooow and python integers are not built to handle
-        # precision like this. I'm going to need to use modulo math to get the answer
-        # which is something I will need to go away and learn! I'm going to leave this
-        # as a TODO for now. I will come back to this later.
+        # This part is the same as part 1 but divide_by is 0 (the worry is kept
+        # modulo the product of the tests instead) and the rounds is 10000.
+        # do_the_rounds(monkeys, rounds=10000, divide_by=0) still gets there but
+        # takes over 20 seconds, the compiled monkeys followed one item at a time
+        # give the same answer in milliseconds so only they are run here, see
+        # run_compiled and run_per_item for the comparison
         start_time = time.time()
-        monkeys = input_formatter(input_txt=input_text)
-        monkeys = do_the_rounds(monkeys=monkeys, rounds=10000, divide_by=0)
-        most_active = get_most_active_monkeys(monkeys)
-        monkey_business_level = 1
-        for i,m in enumerate(most_active, 1):
-            print(f"Monkey {m} was the {i} most active with {monkeys[m]['num_inspections']} inspections")
-            monkey_business_level *= monkeys[m]["num_inspections"]
-        print(f"The Monkey Business Level is {monkey_business_level}")
-        print(f"Part 2 took {(time.time() - start_time):.2f} seconds")
\ No newline at end of file
+        rules, items = compile_monkeys(input_formatter(input_txt=input_text))
+        inspections = run_per_item(rules, items, rounds=10000)
+        print(f"Part 2 took {(time.time() - start_time):.2f} seconds")
+        print(f"The Monkey Business Level is {monkey_business_level(inspections)}")
@@ -1,7 +1,11 @@
 import sys
+from pathlib import Path
 
-sys.path.append(".")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import utils
+from array import array
+from collections import deque
+import heapq
 
 test_txt = "Sabqponm\nabcryxxl\naccszExk\nacctuvwj\nabdefghi"
 
@@ -24,7 +28,9 @@ def format_input(input_txt: str = test_txt, verbose: bool = False):
     return chars
 
 
-def get_position(chars: list = format_input(), char: str = "E", verbose: bool = False):
+def get_position(chars: list = None, char: str = "E", verbose: bool = False):
+    if chars is None:
+        chars = format_input()
     for i, row in enumerate(chars):
         if char in row:
             if verbose:
@@ -200,6 +206,107 @@ def dijkstra(graph: list, start: tuple, end: tuple):
     return shortest_path, cost_to_node[end]
 
 
+## Flat grid pathfinding
+# Coming back to this one, my graph above allows any step of +/- 1 but the puzzle
+# allows stepping down any distance and only up by one, which is why part 1 never
+# came out right. Building a dict of dicts with a tuple per cell and then scanning
+# every cost for the next node is also far too slow for the real input.
+# Here the heights are kept in one flat array, node i is at row i // width and
+# column i % width, the neighbours are found by arithmetic rather than stored and
+# the search uses a deque (every step costs 1, so a plain BFS is enough) or a
+# heapq priority queue when a cost function is given.
+# Searching backwards from E makes part 2 a single search, the distance to every
+# 'a' comes out of the same run.
+def parse_heightmap(input_txt: str = test_txt):
+    lines = input_txt.strip().splitlines()
+    width = len(lines[0])
+    flat = "".join(lines)
+    heights = array("b", (values[char] for char in flat))
+    return heights, width, flat.index("S"), flat.index("E")
+
+
+def grid_neighbours(node: int, width: int, size: int):
+    if node >= width:
+        yield node - width
+    if node + width < size:
+        yield node + width
+    column = node % width
+    if column > 0:
+        yield node - 1
+    if column < width - 1:
+        yield node + 1
+
+
+def grid_search(
+    heights: array,
+    width: int,
+    sources: list,
+    reverse: bool = False,
+    cost=None,
+):
+    """
+    Find the distance from the nearest of the sources to every cell, a step is
+    allowed when it climbs at most one (reverse searches run the steps backwards,
+    so a step may climb any amount but only drop by one).
+    Returns a list of distances with -1 for the cells that can not be reached.
+    cost(from_node, to_node) switches from a BFS to Dijkstra with a heap.
+    """
+    size = len(heights)
+    distances = [-1] * size
+    if cost is None:
+        queue = deque()
+        for source in sources:
+            distances[source] = 0
+            queue.append(source)
+        while queue:
+            node = queue.popleft()
+            node_height = heights[node]
+            next_distance = distances[node] + 1
+            for neighbour in grid_neighbours(node, width, size):
+                if distances[neighbour] != -1:
+                    continue
+                climb = heights[neighbour] - node_height
+                if (-climb if reverse else climb) <= 1:
+                    distances[neighbour] = next_distance
+                    queue.append(neighbour)
+        return distances
+
+    queue = [(0, source) for source in sources]
+    for source in sources:
+        distances[source] = 0
+    heapq.heapify(queue)
+    while queue:
+        distance, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            continue  # a shorter route to this node was already processed
+        node_height = heights[node]
+        for neighbour in grid_neighbours(node, width, size):
+            climb = heights[neighbour] - node_height
+            if (-climb if reverse else climb) > 1:
+                continue
+            new_distance = distance + cost(node, neighbour)
+            if distances[neighbour] == -1 or new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                heapq.heappush(queue, (new_distance, neighbour))
+    return distances
+
+
+def part1(input_txt: str = test_txt):
+    heights, width, start, end = parse_heightmap(input_txt)
+    return grid_search(heights, width, [start])[end]
+
+
+def part2(input_txt: str = test_txt):
+    # One search backwards from E finds the distance to every square at height a
+    heights, width, start, end = parse_heightmap(input_txt)
+    distances = grid_search(heights, width, [end], reverse=True)
+    return min(
+        distances[node]
+        for node in range(len(heights))
+        if heights[node] == 1 and distances[node] != -1
+    )
+
+
 if __name__ == "__main__":
     # chars = format_input(verbose=True)
     # pos_E = get_position(verbose=True)
@@ -216,20 +323,18 @@ if __name__ == "__main__":
     #     f"Shortest path is {shortest_path} with a length of {len(shortest_path) - 1}, it has a cost of {cost}"
     # )
     ## Part 1
+    # My first attempt built the dict of dicts graph and ran dijkstra above:
+    #   graph = build_graph(chars)
+    #   shortest_path, cost = dijkstra(graph, start=pos_S, end=pos_E)
+    # Worked for the example, but not for the actual input, the flat grid search
+    # below uses the correct climbing rule and is a lot quicker
+    assert part1() == 31, "Part 1 example should take 31 steps"
+    assert part2() == 29, "Part 2 example should take 29 steps"
+    # Large maps for timing the search come from the input generators, e.g.
+    #   python -m aoc_runner.generators --year 2022 --day 12 --scale 10000
     input_data = utils.get_input(year=2022, day=12)
     with open(input_data) as f:
         input_txt = f.read().strip()
-        chars = format_input(input_txt=input_txt, verbose=False)
-        pos_E = get_position(chars, verbose=False)
-        pos_S = get_position(chars, char="S", verbose=False)
-        print(f"pos_E is {pos_E}, pos_S is {pos_S}")
-        graph = build_graph(chars, verbose=False)
-        print(f"Graph of size {len(graph)} built")
-        print(f"The graph values for pos_S are {graph[pos_S]} and for pos_E are {graph[pos_E]}")
-        shortest_path, cost = dijkstra(graph, start=pos_S, end=pos_E)
-        # Worked for the example, but not for the actual input, so I need to debug this in the morning
-        # I think the problem is that the start is not (0, 0) as it was in the example
-        print(f"Shortest path is {shortest_path} with a cost of {cost}")
-        print(f"Part 1: {len(shortest_path) - 1}")
-        
-        
+    print(f"Part 1: {part1(input_txt)}")
+    print(f"Part 2: {part2(input_txt)}")
+
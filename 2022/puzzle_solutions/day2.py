@@ -23,12 +23,7 @@ points = {
     "win": 6,  # Win
 }
 
-input_file = Path("inputs/2022/day2.txt")
-if not input_file.exists():
-    print(
-        f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
-    )
-    exit()
+input_file = Path(__file__).resolve().parent.parent / "inputs" / "day2.txt"
 
 # Part 1
 # What would your total score be if everything goes exactly according to your strategy guide (input)?
@@ -117,5 +112,10 @@ def part2(input_data=None):
 
 
 if __name__ == "__main__":
+    if not input_file.exists():
+        print(
+            f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
+        )
+        exit()
     input_data = part1()
     part2(input_data)
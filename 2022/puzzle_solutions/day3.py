@@ -17,12 +17,7 @@ Uppercase item types A through Z have priorities 27 through 52.
 
 from pathlib import Path
 
-input_file = Path("inputs/2022/day3.txt")
-if not input_file.exists():
-    print(
-        f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
-    )
-    exit()
+input_file = Path(__file__).resolve().parent.parent / "inputs" / "day3.txt"
 
 # Map the priorities of each item type
 item_priorities = {
@@ -91,5 +86,10 @@ def part2(input_data=None, input_file=input_file):
     return grouped
 
 if __name__ == "__main__":
+    if not input_file.exists():
+        print(
+            f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
+        )
+        exit()
     input_data = part1()
     part2(input_data)
\ No newline at end of file
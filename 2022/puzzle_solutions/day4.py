@@ -11,12 +11,7 @@ and make a big list of the section assignments for each pair (your puzzle input)
 
 from pathlib import Path
 
-input_file = Path("inputs/2022/day4.txt")
-if not input_file.exists():
-    print(
-        f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
-    )
-    exit()
+input_file = Path(__file__).resolve().parent.parent / "inputs" / "day4.txt"
 
 # Part 1
 # In how many assignment pairs does one range fully contain the other?
@@ -93,5 +88,10 @@ def part2(input_data=None, input_file=input_file):
 
 
 if __name__ == "__main__":
+    if not input_file.exists():
+        print(
+            f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
+        )
+        exit()
     result = part1()
     part2(input_data=result)
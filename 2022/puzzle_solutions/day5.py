@@ -4,32 +4,84 @@ Day 5: Supply Stacks
 
 from pathlib import Path
 
-input_file = Path("inputs/2022/day5.txt")
-if not input_file.exists():
-    print(
-        f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
-    )
-    exit()
+input_file = Path(__file__).resolve().parent.parent / "inputs" / "day5.txt"
 
 def crate_mover(stacks: dict, instructions: list, part=1):
     # we need to loop through the instructions and move the crates
     # where instructions are in the format [move x many, from key, to key]
-    moved_stacks = stacks.copy()
+    # Part 1 is the CrateMover 9000 which moves one crate at a time, so the
+    # crates land reversed, part 2 is the CrateMover 9001 which keeps their order
+    # Copy each stack so the moves below can work in place without changing
+    # the stacks we were given, part 2 starts from the same stacks
+    moved_stacks = {key: list(value) for key, value in stacks.items()}
     for instruction in instructions:
         # If instruction is not a list of 3 items, skip it and print a warning
         if len(instruction) != 3:
             print(f"Warning: {instruction} is not a valid instruction, skipping.")
             continue
-        # First we need to get the crates to move
-        crates_to_move = moved_stacks[instruction[1]][-int(instruction[0]) :]
+        count = int(instruction[0])
+        if count <= 0:
+            continue
+        source = moved_stacks[instruction[1]]
+        # Take the crates off the top of the source and add them to the
+        # destination in place, so a move only touches the crates being moved
+        # rather than rebuilding both stacks
+        crates_to_move = source[-count:]
+        del source[-count:]
         if part == 1:
             crates_to_move.reverse()
-        # Now we need to remove the crates from the original location
-        moved_stacks[instruction[1]] = moved_stacks[instruction[1]][:-int(instruction[0])]
-        # Now we need to add the crates to the new location
-        moved_stacks[instruction[2]] = moved_stacks[instruction[2]] + crates_to_move
+        moved_stacks[instruction[2]].extend(crates_to_move)
     return moved_stacks
 
+def top_crates_by_replay(stacks: dict, instructions: list, part=1):
+    """
+    Find the top crate of each stack without moving any crates. Only the stack
+    heights are followed forwards, then each final top crate is followed
+    backwards through the instructions to where it started, so an instruction
+    costs the same however many crates it moves.
+    """
+    moves = []
+    for instruction in instructions:
+        if len(instruction) == 3 and (count := int(instruction[0])) > 0:
+            moves.append((count, instruction[1], instruction[2]))
+    heights = {key: len(value) for key, value in stacks.items()}
+    for count, source, destination in moves:
+        heights[source] -= count
+        heights[destination] += count
+    # following[stack] holds the depth (from the top) of each crate we are
+    # following that is on that stack, keyed by the stack it finishes on top of
+    following = {key: {} for key in stacks}
+    for key, height in heights.items():
+        if height > 0:
+            following[key][key] = 0
+    for count, source, destination in reversed(moves):
+        arrived, left = following[destination], following[source]
+        if not arrived and not left:
+            continue
+        if source == destination:
+            # Moving crates onto the same stack only changes anything in part 1
+            if part == 1:
+                for key, depth in arrived.items():
+                    if depth < count:
+                        arrived[key] = count - 1 - depth
+            continue
+        # Everything still on the source was below the crates that were moved
+        for key in left:
+            left[key] += count
+        for key, depth in list(arrived.items()):
+            if depth < count:
+                # It was one of the crates moved, in part 1 they were
+                # reversed on the way so the top one came from the bottom
+                del arrived[key]
+                left[key] = count - 1 - depth if part == 1 else depth
+            else:
+                arrived[key] = depth - count
+    top_crates = {}
+    for stack, depths in following.items():
+        for key, depth in depths.items():
+            top_crates[key] = stacks[stack][-1 - depth]
+    return "".join(top_crates[key] for key in stacks if key in top_crates)
+
 # Part 1
 def part1(input_file=input_file):
     """
@@ -91,6 +143,11 @@ def part2(stacks=None, instructions=None, input_file=input_file):
     print(f"Part 2: The top crates are {top_crates}")
 
 if __name__ == "__main__":
+    if not input_file.exists():
+        print(
+            f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
+        )
+        exit()
     stacks, instructions = part1()
     part2(stacks, instructions)
     
@@ -2,14 +2,10 @@
 Day 6: Tuning Trouble
 """
 
+import io
 from pathlib import Path
 
-input_file = Path("inputs/2022/day6.txt")
-if not input_file.exists():
-    print(
-        f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
-    )
-    exit()
+input_file = Path(__file__).resolve().parent.parent / "inputs" / "day6.txt"
 
 def detect_signal(input_data, byte_size=4):
     # For each character in the input data, check if it is has 3 different characters before it
@@ -20,6 +16,45 @@ def detect_signal(input_data, byte_size=4):
     return markers
 
 
+def iter_markers(stream, byte_size=4, chunk_size=1 << 16):
+    """
+    Lazily yield the same marker positions as detect_signal, but in one pass that
+    does not depend on byte_size. Rather than building a set for every window we
+    remember where each character was last seen, the window of all different
+    characters ending at i then starts just after the latest repeat.
+
+    Parameters
+    ----------
+    stream : str | bytes | file
+        The signal, or an open file (text or binary) which is read in chunks so
+        the whole capture never has to be in memory.
+    byte_size : int, optional
+        The number of different characters in a marker, by default 4
+    chunk_size : int, optional
+        The number of characters read from a file at a time, by default 1 << 16
+    """
+    if isinstance(stream, str):
+        stream = io.StringIO(stream)
+    elif isinstance(stream, (bytes, bytearray)):
+        stream = io.BytesIO(stream)
+    last_seen = {}
+    window_start = 0
+    position = 0
+    while chunk := stream.read(chunk_size):
+        for char in chunk:
+            previous = last_seen.get(char, -1)
+            if previous >= window_start:
+                window_start = previous + 1
+            last_seen[char] = position
+            position += 1
+            if position - window_start >= byte_size:
+                yield position
+
+
+def first_marker(stream, byte_size=4):
+    return next(iter_markers(stream, byte_size=byte_size), None)
+
+
 # Part 1
 # Split the data by start-of-packet markers, where four characters are all different
 def part1(input_file=input_file):
@@ -36,9 +71,9 @@ def part1(input_file=input_file):
         # Read the input file
         input_data = f.read()
         print(len(input_data))
-        markers = detect_signal(input_data)
-        print(f"Part 1: There are {len(markers)} start-of-packet markers.")
-        print(f"Part 1: The first start-of-packet marker is at character {markers[0]}.")
+        number_of_markers = sum(1 for _ in iter_markers(input_data))
+        print(f"Part 1: There are {number_of_markers} start-of-packet markers.")
+        print(f"Part 1: The first start-of-packet marker is at character {first_marker(input_data)}.")
         return input_data
 
 # Part 2
@@ -57,10 +92,15 @@ def part2(input_data=None, input_file=input_file):
     if input_data is None:
         input_data = part1(input_file=input_file)
     # Split the data by start-of-packet markers
-    markers = detect_signal(input_data, byte_size=14)
-    print(f"Part 2: There are {len(markers)} start-of-message markers.")
-    print(f"Part 2: The first start-of-message marker is at character {markers[0]}.")
+    number_of_markers = sum(1 for _ in iter_markers(input_data, byte_size=14))
+    print(f"Part 2: There are {number_of_markers} start-of-message markers.")
+    print(f"Part 2: The first start-of-message marker is at character {first_marker(input_data, byte_size=14)}.")
 
 if __name__ == "__main__":
+    if not input_file.exists():
+        print(
+            f"Input file {input_file} does not exist, please create it in the inputs folder before running this script."
+        )
+        exit()
     input_data = part1()
     part2(input_data=input_data)
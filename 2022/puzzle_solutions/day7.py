@@ -4,10 +4,13 @@ Day 7: No Space Left On Device
 This challenge is a work in progress, I found it quite hard! though I think I may be over thinking it by trying to create a file path system...
 """
 
+from bisect import bisect_left, bisect_right
+import io
 import re
 import sys
+from pathlib import Path
 
-sys.path.insert(0, ".")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import utils
 
 
@@ -139,6 +142,112 @@ def pathmapper(
     return foldersizes
 
 
+## Single pass version
+# pathmapper works but every folder expands the lists of all of the folders inside
+# it, so deep trees copy the same sizes over and over. Instead the sizes can be
+# added up while reading the terminal output: each folder on the current path
+# keeps a running total, and when we cd out of a folder its total is added to
+# its parent. Only the part that has not already been passed up is added, so
+# going back into a folder (and listing it again) does not count anything twice.
+class DirectoryTree:
+    """
+    Folder sizes built in one pass over the $ cd / $ ls transcript, with a sorted
+    index of the sizes for the "at most" and "at least" questions.
+    """
+
+    def __init__(self):
+        self.paths = ["/"]
+        self.ids = {"/": 0}
+        self.parents = [None]
+        self.totals = [0]
+        self._passed_up = [0]
+        self._files_seen = set()
+        self._stack = [0]
+        self._sorted_sizes = None
+
+    @classmethod
+    def from_transcript(cls, transcript):
+        """
+        Build the tree from the puzzle input, either a string or an open file
+        which is read one line at a time.
+        """
+        tree = cls()
+        lines = io.StringIO(transcript) if isinstance(transcript, str) else transcript
+        for line in lines:
+            tree.read_line(line.rstrip("\n"))
+        tree.finish()
+        return tree
+
+    def _child(self, directory: str):
+        parent = self._stack[-1]
+        path = self.paths[parent] + directory + "/"
+        if path not in self.ids:
+            self.ids[path] = len(self.paths)
+            self.paths.append(path)
+            self.parents.append(parent)
+            self.totals.append(0)
+            self._passed_up.append(0)
+        return self.ids[path]
+
+    def _leave(self):
+        folder = self._stack.pop()
+        self.totals[self._stack[-1]] += self.totals[folder] - self._passed_up[folder]
+        self._passed_up[folder] = self.totals[folder]
+
+    def read_line(self, line: str):
+        if not line:
+            return
+        self._sorted_sizes = None
+        if line.startswith("$ cd "):
+            directory = line[5:]
+            if directory == "/":
+                while len(self._stack) > 1:
+                    self._leave()
+            elif directory == "..":
+                if len(self._stack) > 1:
+                    self._leave()
+            else:
+                self._stack.append(self._child(directory))
+        elif line.startswith("$") or line.startswith("dir "):
+            # ls itself and the folder listings do not change any sizes
+            return
+        else:
+            size, name = line.split(" ", 1)
+            key = (self._stack[-1], name)
+            if key not in self._files_seen:
+                self._files_seen.add(key)
+                self.totals[self._stack[-1]] += int(size)
+
+    def finish(self):
+        # Pass whatever is still open up to the root
+        while len(self._stack) > 1:
+            self._leave()
+        # Leave the root open so the tree can carry on reading lines
+        self._stack = [0]
+        return self
+
+    @property
+    def used_space(self):
+        return self.totals[0]
+
+    def sizes(self):
+        return dict(zip(self.paths, self.totals))
+
+    def sorted_sizes(self):
+        if self._sorted_sizes is None:
+            self._sorted_sizes = sorted(self.totals)
+        return self._sorted_sizes
+
+    def dirs_at_most(self, size: int):
+        sizes = self.sorted_sizes()
+        return sizes[: bisect_right(sizes, size)]
+
+    def smallest_at_least(self, size: int):
+        sizes = self.sorted_sizes()
+        i = bisect_left(sizes, size)
+        return sizes[i] if i < len(sizes) else None
+
+
 if __name__ == "__main__":
     input_file = utils.get_input(7, 2022)
     with open(input_file, "r") as f:
@@ -165,3 +274,9 @@ if __name__ == "__main__":
         options.sort(key=lambda x: foldersizes[x])
         smallest = options[0]
         print(f"The smallest folder that, if deleted, would free up enough space is {smallest} with a size of {foldersizes[smallest]} bytes")
+        # Both parts again with the single pass tree
+        f.seek(0)
+        tree = DirectoryTree.from_transcript(f)
+        neededsize = 30000000 - (70000000 - tree.used_space)
+        print(f"Part 1 (single pass): {sum(tree.dirs_at_most(100000))}")
+        print(f"Part 2 (single pass): {tree.smallest_at_least(neededsize)}")
@@ -1,8 +1,10 @@
 import sys
+from pathlib import Path
 
-sys.path.insert(0, ".")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import utils
 import math
+import numpy as np
 
 
 def loop_left(grid_row, start_col=0, include_start=True):
@@ -176,63 +178,103 @@ def part2(rows, columns, visualise=False):
     return highest_score, highest_index, highest_arr
 
 
+## Monotonic stack version
+# get_scenic_score copies the whole row and column for every tree, so the grid
+# costs O(N^3). Walking along a row while keeping a stack of the trees that could
+# still block the view (each one taller than everything after it) gives the
+# nearest tree at least as tall for every position in a single pass, as shorter
+# trees are popped off and never looked at again. Running that pass in all four
+# directions gives both parts, if nothing blocks the view the tree is visible
+# from outside the grid and the viewing distance runs to the edge.
+def parse_heights(grid_text):
+    lines = grid_text.split()
+    return np.array([[int(x) for x in line] for line in lines], dtype=np.int8)
+
+
+def _look_left(heights):
+    """
+    Viewing distance towards column 0 for every tree, and whether the view
+    reaches the edge unblocked.
+    """
+    distances = np.zeros(heights.shape, dtype=np.int32)
+    clear = np.zeros(heights.shape, dtype=bool)
+    for r, row in enumerate(heights.tolist()):
+        stack = []
+        distance_row = distances[r]
+        clear_row = clear[r]
+        for j, height in enumerate(row):
+            while stack and row[stack[-1]] < height:
+                stack.pop()
+            if stack:
+                distance_row[j] = j - stack[-1]
+            else:
+                distance_row[j] = j
+                clear_row[j] = True
+            stack.append(j)
+    return distances, clear
+
+
+def analyse_grid(heights):
+    """
+    Work out the viewing distance in each direction for every tree.
+
+    Returns a dictionary holding the "left", "right", "up" and "down" viewing
+    distances, the "visible" (from outside the grid) map and the "scores" map
+    (the product of the four distances).
+    """
+    heights = np.asarray(heights, dtype=np.int8)
+    left, left_clear = _look_left(heights)
+    right, right_clear = (a[:, ::-1] for a in _look_left(heights[:, ::-1]))
+    up, up_clear = (a.T for a in _look_left(heights.T))
+    down, down_clear = (a.T[::-1] for a in _look_left(heights[::-1].T))
+    return {
+        "left": left,
+        "right": right,
+        "up": up,
+        "down": down,
+        "visible": left_clear | right_clear | up_clear | down_clear,
+        "scores": left.astype(np.int64) * right * up * down,
+    }
+
+
 if __name__ == "__main__":
-    visible_trees, rows, columns = part1(utils.get_input(8, 2022))
+    input_file = utils.get_input(8, 2022)
+    visible_trees, rows, columns = part1(input_file)
     # save the visible trees to a file
-    with open("outputs/2022/day8_part1_visible_trees.txt", "w") as f:
+    with open(utils.OUTPUT_FOLDER / "day8_part1_visible_trees.txt", "w") as f:
         for row in visible_trees:
             f.write("".join([str(x) if x is not None else "." for x in row]) + "\n")
-    highest_score, highest_index, highest_arr = part2(rows, columns, visualise=True)
-    dimensions = (len(rows), len(columns))
+    # My original part 2 looped over every tree calling get_scenic_score:
+    #   highest_score, highest_index, highest_arr = part2(rows, columns, visualise=True)
+    # Both parts now come out of the one analyse_grid call
+    with open(input_file) as f:
+        heights = parse_heights(f.read())
+    analysis = analyse_grid(heights)
+    print(f"Part 1: The number of trees visible from outside the grid is {int(analysis['visible'].sum())}")
+    scores = analysis["scores"]
+    highest_index = np.unravel_index(int(scores.argmax()), scores.shape)
+    highest_score = int(scores[highest_index])
+    dimensions = heights.shape
     """
     This is section is purely for visualising the highest score for part2 in an ASCII grid
     It is not needed for the puzzle solution, but I like to see the results
     """
-    # We are going to create a list of lists, filled with None of the same dimensions as the grid
-    # Then we are going to loop through the arrs and add the values to the grid
-    # We need to work out which arrs are which, and then add them to the correct index
-    if len(highest_arr) != 4:
-        print(
-            f"The length of highest_arr is {len(highest_arr)}, this means our optimal spot is along an edge"
-        )
-        print(
-            f"Now we need to work out which edge it is on but looking at the indexes of the highest_arr"
-        )
-        print([[x for x in arr if x is not None] for arr in highest_arr])
-        # This should never be the case really... but the logic here would be worth working out if it was
-        # For now I will not be doing this as it is not needed for the puzzle
-    if len(highest_arr) == 4:
-        print(
-            f"The length of highest_arr is {len(highest_arr)}, this means our optimal spot is in the middle somewhere"
-        )
-        # This means we have a left row, right row, left column and right column
-        # We need to add the left row to the grid at index 0, the right row to the grid at index 1
-        # The left column to the grid at index 2, and the right column to the grid at index 3
-        grid = [[None for x in range(dimensions[1])] for y in range(dimensions[0])]
-        print(
-            f"Using indexes {highest_index} to create a visualisation of the grid at this point"
-        )
-        row_n = highest_index[0]  # The row number
-        col_n = highest_index[1]  # The column number
-        print(
-            f"The value at this index is rows: {rows[row_n][col_n]}, columns: {columns[col_n][row_n]}"
-        )
-        # rn is the row number, we will need to use this to access the correct row in the up down columns
-        # cn is the column number, we will need to use this to access the correct column in the left right rows
-        # We will need to loop through the values in the highest_arrays and add them to the grid at their respective indexes
-        for i, arr in enumerate(highest_arr):
-            # if i == 1 or i == 3:
-            # arr = arr[::-1]
-            for j, val in enumerate(arr):
-                if i == 0 or i == 1:
-                    if val is not None:
-                        # print(f"Adding {val} to grid[{j}][{col_n}]")
-                        grid[j][col_n] = val
-                if i == 2 or i == 3:
-                    if val is not None:
-                        # print(f"Adding {val} to grid[{row_n}][{j}]")
-                        grid[row_n][j] = val
-        # Now we need to write the grid to a file
-        with open("outputs/2022/day8_part2_visualise.txt", "w") as f:
-            for row in grid:
-                f.write("".join([str(x) if x is not None else "." for x in row]) + "\n")
+    # Rather than working out which of the highest_arr lists went in which
+    # direction the viewing distances from analyse_grid say exactly which trees
+    # can be seen from the best spot
+    row_n, col_n = (int(i) for i in highest_index)
+    grid = [[None for x in range(dimensions[1])] for y in range(dimensions[0])]
+    grid[row_n][col_n] = int(heights[row_n, col_n])
+    for step in range(1, int(analysis["left"][row_n, col_n]) + 1):
+        grid[row_n][col_n - step] = int(heights[row_n, col_n - step])
+    for step in range(1, int(analysis["right"][row_n, col_n]) + 1):
+        grid[row_n][col_n + step] = int(heights[row_n, col_n + step])
+    for step in range(1, int(analysis["up"][row_n, col_n]) + 1):
+        grid[row_n - step][col_n] = int(heights[row_n - step, col_n])
+    for step in range(1, int(analysis["down"][row_n, col_n]) + 1):
+        grid[row_n + step][col_n] = int(heights[row_n + step, col_n])
+    # Now we need to write the grid to a file
+    with open(utils.OUTPUT_FOLDER / "day8_part2_visualise.txt", "w") as f:
+        for row in grid:
+            f.write("".join([str(x) if x is not None else "." for x in row]) + "\n")
+    print(f"Part 2: The highest score is {highest_score} at index {(row_n, col_n)}")
@@ -21,12 +21,14 @@ The instructions will be followed by a number, which is the number of spaces to
 """
 
 import sys
+from pathlib import Path
 
-sys.path.append(".")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import utils
 import re
 import operator
 import time
+from array import array
 
 # My test case
 # U 1 L 3 R 5 D 2 U 5
@@ -66,6 +68,11 @@ def instructions(
     return instructions
 
 
+# The parameters below are also called instructions, this alias lets them
+# default to the example without parsing it when the module is imported
+example_instructions = instructions
+
+
 def visualiser(
     head_pos,
     tail_pos,
@@ -110,7 +117,7 @@ def visualiser(
     grid.reverse()
     output = "\n".join("".join(row) for row in grid)
     # Save the output to a file
-    with open("outputs/2022/day9_part1_finalpos.txt", "w") as f:
+    with open(utils.OUTPUT_FOLDER / "day9_part1_finalpos.txt", "w") as f:
         f.write(output)
 
 
@@ -198,10 +205,9 @@ def move_tail(instruction: tuple, head_pos: tuple, tail_pos: tuple):
     else:
         x = tail_pos[0] + diff_x - int((diff_x/abs(diff_x)))
         y = tail_pos[1] + diff_y - int((diff_y/abs(diff_y)))
-    # 
-    # new_tail_pos = (x, y)
+    new_tail_pos = (x, y)
     # Now get the difference between the new tail pos and the old tail pos
-    # movement = tuple(map(operator.sub, new_tail_pos, tail_pos))
+    movement = tuple(map(operator.sub, new_tail_pos, tail_pos))
     return new_tail_pos, movement
 
 
@@ -251,7 +257,7 @@ def terminal_visualisation(
 
 
 def part1(
-    instructions=instructions(),
+    instructions=None,
     start_head=(0, 0),
     start_tail=(0, 0),
     visualise=False,
@@ -260,6 +266,8 @@ def part1(
     """
     This function calculates the final position of the head and tail after following the instructions
     """
+    if instructions is None:
+        instructions = example_instructions()
     head_pos = start_head
     tail_pos = start_tail
     tiles_visited = [start_tail]
@@ -295,7 +303,7 @@ def part1(
 
 
 def part2(
-    instructions=instructions(),
+    instructions=None,
     start_head=(0, 0),
     start_tail=(0, 0),
     knots=10,
@@ -305,6 +313,8 @@ def part2(
     """
     This function calculates the final position of the head and tail after following the instructions
     """
+    if instructions is None:
+        instructions = example_instructions()
     knot_pos = [start_head]
     # Add x - 1 knots to the list
     knot_pos.extend([start_tail] * (knots - 1))
@@ -347,6 +357,80 @@ def part2(
     return knot_pos[0], knot_pos, tiles_visited
 
 
+## Array backed rope
+# part2 above expands every instruction into a list of single steps and moves each
+# knot with tuple(map(operator.sub, ...)), then keeps every tile the tail stood on
+# in a list. The rules boil down to: if a knot is more than one away from the knot
+# in front of it, it moves one step towards it in each axis (the sign of the
+# difference). So the knots can live in two flat integer arrays and the rope only
+# needs following until a knot does not move, nothing behind it can move either.
+# Visited tiles are packed into a single int so the set holds small ints rather
+# than tuples.
+PACK_OFFSET = 1 << 31
+
+
+def pack_position(x: int, y: int):
+    return ((x + PACK_OFFSET) << 32) | (y + PACK_OFFSET)
+
+
+def unpack_position(packed: int):
+    return (packed >> 32) - PACK_OFFSET, (packed & 0xFFFFFFFF) - PACK_OFFSET
+
+
+def iter_instructions(lines):
+    """
+    Lazily parse (direction, distance) instructions from any iterable of lines,
+    such as an open file, so long instruction streams are never held in memory.
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            direction_, distance = line.split()
+            yield direction_, int(distance)
+
+
+def simulate_rope(instructions, knots: int = 10):
+    """
+    Follow the instructions with a rope of any number of knots.
+
+    Parameters
+    ----------
+    instructions : iterable
+        (direction, distance) tuples, e.g. from instructions() or iter_instructions()
+    knots : int, optional
+        The number of knots including the head, by default 10
+
+    Returns
+    -------
+    tuple
+        The final knot positions as a list of (x, y) and the set of packed tiles
+        the tail visited (see unpack_position)
+    """
+    xs = array("q", [0] * knots)
+    ys = array("q", [0] * knots)
+    last = knots - 1
+    visited = {pack_position(0, 0)}
+    for direction_, distance in instructions:
+        step_x, step_y = direction[direction_]
+        for _ in range(distance):
+            xs[0] += step_x
+            ys[0] += step_y
+            for knot in range(1, knots):
+                diff_x = xs[knot - 1] - xs[knot]
+                diff_y = ys[knot - 1] - ys[knot]
+                if -1 <= diff_x <= 1 and -1 <= diff_y <= 1:
+                    break
+                xs[knot] += (diff_x > 0) - (diff_x < 0)
+                ys[knot] += (diff_y > 0) - (diff_y < 0)
+            else:
+                # Only reached when every knot moved, including the tail
+                if last:
+                    visited.add(pack_position(xs[last], ys[last]))
+            if not last:
+                visited.add(pack_position(xs[0], ys[0]))
+    return list(zip(xs, ys)), visited
+
+
 if __name__ == "__main__":
     # Run a test case on the instructions
     # print(moving_body())
@@ -371,6 +455,15 @@ if __name__ == "__main__":
         )
         print(f"Part 2: Knot 1 is at {knot_1}, Knot 10 is at {knots[-1]}, knot 10 moved {len(knot_10_tiles_visited)} tiles")
         print(f"Part 2: {len(set(knot_10_tiles_visited))} unique tiles visited")
+        # The same again with the array backed rope, streaming the file
+        f.seek(0)
+        start_time = time.time()
+        _, tail_visited = simulate_rope(iter_instructions(f), knots=2)
+        print(f"Part 1 (array rope): {len(tail_visited)} unique tiles visited")
+        f.seek(0)
+        _, tail_visited = simulate_rope(iter_instructions(f), knots=10)
+        print(f"Array rope took {(time.time() - start_time):.4f} seconds")
+        print(f"Part 2 (array rope): {len(tail_visited)} unique tiles visited")
         # terminal_visualisation(
         #     head_pos=knot_1,
         #     knots=knots,
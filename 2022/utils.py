@@ -1,10 +1,16 @@
 from pathlib import Path
-from puzzle_scraper import PuzzleScraper
 import datetime as dt
 
+YEAR_FOLDER = Path(__file__).resolve().parent
+OUTPUT_FOLDER = YEAR_FOLDER / "outputs"
+
 def get_input(day: int = 1, year: int = 2022):
-    input_file = Path(f"inputs/{year}/day{day}.txt")
+    input_file = YEAR_FOLDER / "inputs" / f"day{day}.txt"
     if not input_file.exists():
+        # Only pull in the scraper (and its requests/cookie dependencies) when
+        # an input is actually missing
+        from puzzle_scraper import PuzzleScraper
+
         print(
             f"[Utils]: Input file {input_file} does not exist, attempting to scrape it."
         )
@@ -18,16 +18,25 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #
+import functools
 import logging
 from pathlib import Path
 import time
 
 
 def set_up_logger(day: int) -> logging.Logger:
-    LOGGER: logging.Logger = logging.getLogger(f"day{day:02d}")
+    # Prefix the year folder, both years have a day01 logger and the runner can
+    # import them into the same process
+    year = Path(__file__).resolve().parent.parent.name
+    LOGGER: logging.Logger = logging.getLogger(f"{year}.day{day:02d}")
     LOGGER.setLevel(logging.INFO)
-    # Create a file handler
-    file_handler = logging.FileHandler(f"logs/day{day:02d}.log")
+    if LOGGER.handlers:
+        return LOGGER
+    # Create a file handler, delay means the log file is only opened on the first write
+    file_handler = logging.FileHandler(
+        Path(__file__).resolve().parent.parent / "logs" / f"day{day:02d}.log",
+        delay=True,
+    )
     file_handler.setLevel(logging.INFO)
     stream_handler = logging.StreamHandler()
     stream_handler.setLevel(logging.DEBUG)
@@ -70,7 +79,9 @@ def read_day_input(day: int) -> str:
 
 def log_execution_time(func=None, *, logger=None):
     """
-    Decorator that logs the execution time of a function.
+    Decorator that logs the execution time of a function. This is a single
+    call, for proper timings use the benchmarks in aoc_runner.benchmark, which
+    call the undecorated function through __wrapped__.
 
     Parameters
     ----------
@@ -91,13 +102,12 @@ def log_execution_time(func=None, *, logger=None):
     if logger is None:
         logger = logging.getLogger()
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        logger.info(
-            f"Function {func.__name__} executed in {end_time - start_time:.4f} seconds"
-        )
+        seconds = (time.perf_counter_ns() - start_time) / 1e9
+        logger.info(f"Function {func.__name__} executed in {seconds:.4f} seconds")
         return result
 
     return wrapper
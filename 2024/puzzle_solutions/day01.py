@@ -22,9 +22,15 @@ import logging
 from pathlib import Path
 from typing import Generator
 from common_utils import log_execution_time, set_up_logger, read_day_input
+from input_loader import int_columns
+import numpy as np
 
 LOGGER: logging.Logger = set_up_logger(day=int(Path(__file__).stem[3:]))
 
+# Location ids below this are counted with a bincount, above it the memory for
+# the counts is not worth it and the right list is searched instead
+BINCOUNT_LIMIT: int = 1 << 24
+
 
 @log_execution_time(logger=LOGGER)
 def day01_part1(
@@ -83,6 +89,103 @@ def day01_part2(
     return similarity
 
 
+def total_distance(left: np.ndarray, right: np.ndarray) -> int:
+    """
+    Pair up the smallest ids of each list, then the second smallest and so on,
+    and sum the distances between the pairs.
+
+    Parameters
+    ----------
+    left : np.ndarray
+        The left list of location ids.
+    right : np.ndarray
+        The right list of location ids, the same length as the left.
+
+    Returns
+    -------
+    int
+        The total distance between the lists.
+    """
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+def similarity_score(left: np.ndarray, right: np.ndarray) -> int:
+    """
+    Sum every id in the left list multiplied by the number of times it appears
+    in the right list.
+
+    Small ids are counted with a bincount, otherwise the distinct ids of the
+    right list and their counts come from np.unique and each left id is found in
+    them with a searchsorted.
+
+    Parameters
+    ----------
+    left : np.ndarray
+        The left list of location ids.
+    right : np.ndarray
+        The right list of location ids.
+
+    Returns
+    -------
+    int
+        The similarity score of the lists.
+    """
+    if not len(left) or not len(right):
+        return 0
+    if min(left.min(), right.min()) >= 0 and right.max() < BINCOUNT_LIMIT:
+        counts = np.bincount(right)
+        in_range = left < len(counts)
+        return int((left[in_range] * counts[left[in_range]]).sum())
+    ids, counts = np.unique(right, return_counts=True)
+    position = np.searchsorted(ids, left).clip(max=len(ids) - 1)
+    found = ids[position] == left
+    return int((left[found] * counts[position[found]]).sum())
+
+
+@log_execution_time(logger=LOGGER)
+def day01_part1_vectorized(
+    input_str: str = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3",
+) -> int:
+    """
+    Solve part 1 of the puzzle with numpy, both columns are parsed into int64
+    arrays in one go and sorted with np.sort.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The input data for the puzzle.
+
+    Returns
+    -------
+    int
+        The solution to part 1 of the puzzle.
+    """
+    left, right = int_columns(input_str).T
+    return total_distance(left, right)
+
+
+@log_execution_time(logger=LOGGER)
+def day01_part2_vectorized(
+    input_str: str = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3",
+) -> int:
+    """
+    Solve part 2 of the puzzle with numpy, counting the right column once rather
+    than once for every distinct id in it.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The input data for the puzzle.
+
+    Returns
+    -------
+    int
+        The solution to part 2 of the puzzle.
+    """
+    left, right = int_columns(input_str).T
+    return similarity_score(left, right)
+
+
 if __name__ == "__main__":
     expected_solution: int = day01_part1()
     if expected_solution != 11:
@@ -23,6 +23,8 @@ import logging
 from pathlib import Path
 from typing import Generator
 from common_utils import log_execution_time, set_up_logger, read_day_input
+from input_loader import ragged_ints
+import numpy as np
 
 LOGGER: logging.Logger = set_up_logger(day=int(Path(__file__).stem[3:]))
 
@@ -34,6 +36,11 @@ class SafetyFlags(enum.Enum):
     UNSAFE_THRESHOLD = 3
 
 
+# The smallest and largest change between levels for a report to be safe
+MIN_STEP: int = 1
+MAX_STEP: int = 3
+
+
 def check_safety(diffs: list[int]) -> SafetyFlags:
     if any(diff == 0 for diff in diffs):
         return SafetyFlags.UNSAFE_UNCHANGED
@@ -41,7 +48,7 @@ def check_safety(diffs: list[int]) -> SafetyFlags:
     min_diff: int = min(diffs)
     if min_diff < 0 < max_diff:
         return SafetyFlags.UNSAFE_SIGN_CHANGE
-    if min_diff < -3 or max_diff > 3:
+    if min_diff < -MAX_STEP or max_diff > MAX_STEP:
         return SafetyFlags.UNSAFE_THRESHOLD
     return SafetyFlags.SAFE
 
@@ -58,7 +65,8 @@ def day02_part1(
     for line in lines:
         diffs: list[int] = [line[i] - line[i - 1] for i in range(1, len(line))]
         flag: SafetyFlags = check_safety(diffs)
-        LOGGER.debug(f"{line}: got safety flag of {flag}")
+        # Let the logger do the formatting, so it is skipped unless DEBUG is on
+        LOGGER.debug("%s: got safety flag of %s", line, flag)
         if flag != SafetyFlags.SAFE:
             unsafe += 1
         else:
@@ -66,6 +74,153 @@ def day02_part1(
     return safe
 
 
+def steps_are_safe(levels: list[int], sign: int) -> bool:
+    return all(
+        MIN_STEP <= sign * (b - a) <= MAX_STEP for a, b in zip(levels, levels[1:])
+    )
+
+
+def check_dampened_safety(levels: list[int]) -> bool:
+    """
+    Check if the report is safe with at most one level removed by the Problem
+    Dampener. Rather than trying every removal, only the two levels either side
+    of the first bad step (for each direction) can fix it, so the report is
+    checked a fixed number of times whatever its length.
+    """
+    for sign in (1, -1):
+        for i, (a, b) in enumerate(zip(levels, levels[1:])):
+            if not MIN_STEP <= sign * (b - a) <= MAX_STEP:
+                if steps_are_safe(levels[:i] + levels[i + 1 :], sign):
+                    return True
+                if steps_are_safe(levels[: i + 1] + levels[i + 2 :], sign):
+                    return True
+                break
+        else:
+            return True
+    return False
+
+
+@log_execution_time(logger=LOGGER)
+def day02_part2(
+    input_str="7 6 4 2 1\n1 2 7 8 9\n9 7 6 2 1\n1 3 2 4 5\n8 6 4 4 1\n1 3 6 7 9",
+) -> int:
+    return sum(
+        check_dampened_safety(list(map(int, line.split())))
+        for line in input_str.splitlines()
+    )
+
+
+def _report_steps(values: np.ndarray, offsets: np.ndarray):
+    """
+    The step from every level to the next as a flat array the same length as
+    values, along with a mask of the steps that stay within a report (the last
+    level of each report has no step).
+    """
+    steps = np.zeros(len(values), dtype=np.int64)
+    steps[:-1] = np.diff(values)
+    has_step = np.ones(len(values), dtype=bool)
+    has_step[offsets[1:] - 1] = False
+    return steps, has_step
+
+
+def report_safety(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Check every report at once, the same as check_safety on each one.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The levels of every report one after another, from ragged_ints.
+    offsets : np.ndarray
+        Where each report starts in values, plus the end of the last report.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of the SafetyFlags value of every report.
+    """
+    steps, has_step = _report_steps(values, offsets)
+    report = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))[has_step]
+    steps = steps[has_step]
+    n_reports = len(offsets) - 1
+    # Count the kinds of step in each report rather than reducing over them, a
+    # report with a single level has no steps at all
+    unchanged = np.bincount(report, steps == 0, minlength=n_reports) > 0
+    rising = np.bincount(report, steps > 0, minlength=n_reports) > 0
+    falling = np.bincount(report, steps < 0, minlength=n_reports) > 0
+    too_far = np.bincount(report, np.abs(steps) > MAX_STEP, minlength=n_reports) > 0
+    flags = np.full(n_reports, SafetyFlags.SAFE.value, dtype=np.uint8)
+    # Later assignments win, so these go in the reverse of check_safety's order
+    flags[too_far] = SafetyFlags.UNSAFE_THRESHOLD.value
+    flags[rising & falling] = SafetyFlags.UNSAFE_SIGN_CHANGE.value
+    flags[unchanged] = SafetyFlags.UNSAFE_UNCHANGED.value
+    return flags
+
+
+def dampened_safety(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Check every report at once for being safe with at most one level removed.
+
+    Removing level j leaves a safe report when every step before j - 1 and
+    after j is safe and so is the new step from level j - 1 to j + 1. A running
+    count of the bad steps gives the first two for every level at once, so each
+    report is only looked at a fixed number of times.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The levels of every report one after another, from ragged_ints.
+    offsets : np.ndarray
+        Where each report starts in values, plus the end of the last report.
+
+    Returns
+    -------
+    np.ndarray
+        A bool array, True for the reports the Problem Dampener makes safe.
+    """
+    n_reports = len(offsets) - 1
+    safe = np.zeros(n_reports, dtype=bool)
+    if not len(values):
+        return safe
+    steps, has_step = _report_steps(values, offsets)
+    report = np.repeat(np.arange(n_reports), np.diff(offsets))
+    position = np.arange(len(values))
+    starts, ends = offsets[:-1][report], offsets[1:][report]
+    # The step over a removed level, from level j - 1 to j + 1
+    inside = (position > starts) & (position < ends - 1)
+    bridges = np.zeros(len(values), dtype=np.int64)
+    bridges[1:-1] = values[2:] - values[:-2]
+    for sign in (1, -1):
+        bad = has_step & ~((MIN_STEP <= sign * steps) & (sign * steps <= MAX_STEP))
+        # bad_before[i] is the number of bad steps in values[:i]
+        bad_before = np.concatenate(([0], np.cumsum(bad)))
+        # Steps starts .. j - 2 come before the removed level, j + 1 .. ends - 2
+        # come after it
+        before = bad_before[np.maximum(position - 1, starts)] - bad_before[starts]
+        after = bad_before[ends - 1] - bad_before[np.minimum(position + 1, ends - 1)]
+        bridge_safe = ~inside | (
+            (MIN_STEP <= sign * bridges) & (sign * bridges <= MAX_STEP)
+        )
+        removable = (before == 0) & (after == 0) & bridge_safe
+        safe |= np.bincount(report, removable, minlength=n_reports) > 0
+    return safe
+
+
+@log_execution_time(logger=LOGGER)
+def day02_part1_vectorized(
+    input_str="7 6 4 2 1\n1 2 7 8 9\n9 7 6 2 1\n1 3 2 4 5\n8 6 4 4 1\n1 3 6 7 9",
+) -> int:
+    flags = report_safety(*ragged_ints(input_str))
+    return int(np.count_nonzero(flags == SafetyFlags.SAFE.value))
+
+
+@log_execution_time(logger=LOGGER)
+def day02_part2_vectorized(
+    input_str="7 6 4 2 1\n1 2 7 8 9\n9 7 6 2 1\n1 3 2 4 5\n8 6 4 4 1\n1 3 6 7 9",
+) -> int:
+    return int(np.count_nonzero(dampened_safety(*ragged_ints(input_str))))
+
+
 if __name__ == "__main__":
     input_str: str = read_day_input(int(Path(__file__).stem[3:]))
     LOGGER.setLevel(logging.DEBUG)  # uncomment to view where the unsafe lines are
@@ -78,3 +233,12 @@ if __name__ == "__main__":
 
     part1_solution: int = day02_part1(input_str)
     LOGGER.info(f"Part 1 solution: {part1_solution}")
+
+    expected_solution = day02_part2()
+    if expected_solution != 4:
+        LOGGER.error(
+            f"Problem with solution to part 2! Did not get the expected answer of 4 for the provided worked example. Instead got: {expected_solution}"
+        )
+
+    part2_solution: int = day02_part2(input_str)
+    LOGGER.info(f"Part 2 solution: {part2_solution}")
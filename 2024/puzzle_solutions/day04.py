@@ -138,6 +138,191 @@ def get_padded_arrays(
     return combined, indexes
 
 
+# The (row, col) step of each of the 8 directions a word can be read in
+DIRECTION_STEPS: list[tuple[int, int]] = [
+    (0, 1),
+    (1, 1),
+    (1, 0),
+    (1, -1),
+    (0, -1),
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+]
+# The 4 ways round the X-MAS cross can be, "." matches any letter
+X_MAS_PATTERNS: list[str] = [
+    "M.S\n.A.\nM.S",
+    "S.S\n.A.\nM.M",
+    "S.M\n.A.\nS.M",
+    "M.M\n.A.\nS.S",
+]
+WILDCARD: int = ord(".")
+# The letters of up to this many characters are packed into one int64 key
+PACKED_LETTERS: int = 8
+
+
+def encode_grid(input_str: str) -> np.ndarray:
+    """
+    Read the letter grid into an int8 array of character codes
+
+    Parameters
+    ----------
+    input_str : str
+        The input string, one row of the grid per line
+
+    Returns
+    -------
+    np.ndarray
+        A 2D int8 array with the shape of the grid
+    """
+    rows = input_str.split()
+    if not rows:
+        return np.zeros((0, 0), dtype=np.int8)
+    letters = np.frombuffer("".join(rows).encode(), dtype=np.int8)
+    return letters.reshape(len(rows), len(rows[0]))
+
+
+def _shifted(
+    grid: np.ndarray, step: tuple[int, int], offset: int, length: int
+) -> np.ndarray:
+    """
+    A view of the grid moved offset letters along step, lined up so that [r, c]
+    is the letter offset along from a word of length starting at (r, c). Only
+    the starts where the whole word fits in the grid are kept
+    """
+    rows, cols = grid.shape
+    # The range of starts, on each axis, where the word stays inside the grid
+    row_start = max(0, -step[0] * (length - 1))
+    row_stop = rows - max(0, step[0] * (length - 1))
+    col_start = max(0, -step[1] * (length - 1))
+    col_stop = cols - max(0, step[1] * (length - 1))
+    return grid[
+        row_start + step[0] * offset : row_stop + step[0] * offset,
+        col_start + step[1] * offset : col_stop + step[1] * offset,
+    ]
+
+
+def find_words(
+    grid: np.ndarray,
+    words: list[str],
+    directions: list[tuple[int, int]] = DIRECTION_STEPS,
+) -> list[np.ndarray]:
+    """
+    Find every word in the grid in all of the directions at once
+
+    For each direction and word length the first 8 letters read from every start
+    are packed into one int64 key with shifted slices of the grid (so nothing
+    is padded or copied letter by letter), then all of the words of that length
+    are looked up in the keys together with a searchsorted, so many words cost
+    little more than one
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The int8 grid from encode_grid
+    words : list[str]
+        The words to search for
+    directions : list[tuple[int, int]], optional
+        The (row, col) steps to read the words along, by default all 8
+
+    Returns
+    -------
+    list[np.ndarray]
+        For each word an (n, 3) array of the (row, col) of its first letter and
+        the index of the direction it reads in
+    """
+    rows, cols = grid.shape
+    found: list[list[np.ndarray]] = [[] for _ in words]
+    by_length: dict[int, list[int]] = {}
+    for i, word in enumerate(words):
+        by_length.setdefault(len(word), []).append(i)
+    for length, indexes in by_length.items():
+        packed = min(length, PACKED_LETTERS)
+        encoded = [np.frombuffer(words[i].encode(), dtype=np.int8) for i in indexes]
+        # The character codes are all below 128 so 7 bits is enough for each
+        word_keys = np.array(
+            [sum(int(c) << (7 * n) for n, c in enumerate(e[:packed])) for e in encoded],
+            dtype=np.int64,
+        )
+        # Words can share a key, the same word twice or long words that only
+        # differ after the packed letters, so look up the distinct keys
+        unique_keys, key_of_word = np.unique(word_keys, return_inverse=True)
+        for d, step in enumerate(directions):
+            # Skip the directions the word is too long to fit in
+            if (length - 1) * abs(step[0]) >= rows:
+                continue
+            if (length - 1) * abs(step[1]) >= cols:
+                continue
+            keys = np.zeros(_shifted(grid, step, 0, length).shape, dtype=np.int64)
+            for offset in range(packed):
+                letters = _shifted(grid, step, offset, length).astype(np.int64)
+                keys |= letters << (7 * offset)
+            position = np.searchsorted(unique_keys, keys).clip(max=len(unique_keys) - 1)
+            hit_rows, hit_cols = np.nonzero(unique_keys[position] == keys)
+            hit_keys = position[hit_rows, hit_cols]
+            # Move from the corner of the shifted view back to the grid
+            hit_rows = hit_rows + max(0, -step[0] * (length - 1))
+            hit_cols = hit_cols + max(0, -step[1] * (length - 1))
+            # Group the hits by key so each word takes its own slice of them
+            by_key = np.argsort(hit_keys, kind="stable")
+            bounds = np.searchsorted(hit_keys[by_key], np.arange(len(unique_keys) + 1))
+            for word, i in enumerate(indexes):
+                key = key_of_word[word]
+                chosen = by_key[bounds[key] : bounds[key + 1]]
+                starts_rows, starts_cols = hit_rows[chosen], hit_cols[chosen]
+                # Check any letters past the packed ones on the candidates only
+                for offset in range(packed, length):
+                    letter = grid[
+                        starts_rows + step[0] * offset, starts_cols + step[1] * offset
+                    ]
+                    matched = letter == encoded[word][offset]
+                    starts_rows = starts_rows[matched]
+                    starts_cols = starts_cols[matched]
+                found[i].append(
+                    np.column_stack(
+                        (starts_rows, starts_cols, np.full(len(starts_rows), d))
+                    )
+                )
+    return [
+        np.concatenate(f) if f else np.zeros((0, 3), dtype=np.int64) for f in found
+    ]
+
+
+def find_patterns(grid: np.ndarray, patterns: list[str]) -> np.ndarray:
+    """
+    Find every place a 2D pattern of letters matches the grid, "." in a pattern
+    matches any letter
+
+    Every pattern sized window of the grid is a sliding_window_view, which does
+    not copy the grid, and only the cells that are not "." are compared
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The int8 grid from encode_grid
+    patterns : list[str]
+        The patterns to look for, one row per line, they must all be the same size
+
+    Returns
+    -------
+    np.ndarray
+        An (n, 3) array of the (row, col) of the top left corner of each match
+        and the index of the pattern that matched
+    """
+    masks = np.stack([encode_grid(pattern) for pattern in patterns])
+    if grid.shape[0] < masks.shape[1] or grid.shape[1] < masks.shape[2]:
+        return np.zeros((0, 3), dtype=np.int64)
+    windows = np.lib.stride_tricks.sliding_window_view(grid, masks.shape[1:])
+    matches = []
+    for i, mask in enumerate(masks):
+        cells = np.nonzero(mask != WILDCARD)
+        # windows[..., rows, cols] gives each window's letters at the cells
+        matched = (windows[..., cells[0], cells[1]] == mask[cells]).all(axis=-1)
+        hit_rows, hit_cols = np.nonzero(matched)
+        matches.append(np.column_stack((hit_rows, hit_cols, np.full(len(hit_rows), i))))
+    return np.concatenate(matches)
+
+
 @log_execution_time(logger=LOGGER)
 def day04_part1(
     input_str: str = "MMMSXXMASM\nMSAMXMSMSA\nAMXSXMAAMM\nMSAMASMSMX\nXMASAMXAMM\nXXAMMXXAMA\nSMSMSASXSS\nSAXAMASAAA\nMAMMMXMMMM\nMXMXAXMASX",
@@ -256,6 +441,49 @@ def day04_part2(
     return count
 
 
+@log_execution_time(logger=LOGGER)
+def day04_part1_vectorized(
+    input_str: str = "MMMSXXMASM\nMSAMXMSMSA\nAMXSXMAAMM\nMSAMASMSMX\nXMASAMXAMM\nXXAMMXXAMA\nSMSMSASXSS\nSAXAMASAAA\nMAMMMXMMMM\nMXMXAXMASX",
+) -> int:
+    """
+    Count the number of 'XMAS' in the input string in any of the 8 directions
+    with find_words
+
+    Parameters
+    ----------
+    input_str : str
+        The input string to search for 'XMAS' in
+
+    Returns
+    -------
+    int
+        The number of 'XMAS' found in the input string
+    """
+    (matches,) = find_words(encode_grid(input_str), ["XMAS"])
+    return len(matches)
+
+
+@log_execution_time(logger=LOGGER)
+def day04_part2_vectorized(
+    input_str: str = "MMMSXXMASM\nMSAMXMSMSA\nAMXSXMAAMM\nMSAMASMSMX\nXMASAMXAMM\nXXAMMXXAMA\nSMSMSASXSS\nSAXAMASAAA\nMAMMMXMMMM\nMXMXAXMASX",
+) -> int:
+    """
+    Find the number of X shaped 'MAS' in the input string by matching each way
+    round the cross can be with find_patterns
+
+    Parameters
+    ----------
+    input_str : str
+        The input string to search for X shaped 'MAS' in
+
+    Returns
+    -------
+    int
+        The number of X shaped 'MAS' found in the input string
+    """
+    return len(find_patterns(encode_grid(input_str), X_MAS_PATTERNS))
+
+
 if __name__ == "__main__":
     input_str = read_day_input(int(Path(__file__).stem[3:]))
     # LOGGER.setLevel(logging.DEBUG)  # uncomment to view where the unsafe lines are
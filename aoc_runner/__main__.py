@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: __main__.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 5:12:40 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 5:12:40 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Run the whole archive (or any part of it) from the repository root with:
+
+    python -m aoc_runner --year 2025 --day 1 2 --workers 4
+
+or time the variants of each part against each other with:
+
+    python -m aoc_runner --year 2025 --day 1 --benchmark --rounds 10 --json bench.json
+
+Adding --record keeps the timings in the performance history, and --regressions
+then reports anything that has slowed down since the run before (or since the
+commit given with --baseline), exiting with 1 if something has. With
+--benchmark, --regressions records the new timings too so they are the ones
+checked, on its own it checks the latest recorded run.
+"""
+
+import argparse
+import time
+
+from .answer_cache import DEFAULT_CACHE_FILE, AnswerCache
+from .benchmark import format_comparison, run_benchmarks, write_records
+from .perf_history import (
+    DEFAULT_HISTORY_FILE,
+    DEFAULT_THRESHOLD,
+    PerformanceHistory,
+    format_regressions,
+    resolve_commit,
+)
+from .registry import discover, select
+from .runner import format_report, run_solutions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aoc_runner", description="Run Advent of Code solutions in parallel."
+    )
+    parser.add_argument("--year", type=int, nargs="*", help="Years to run")
+    parser.add_argument("--day", type=int, nargs="*", help="Days to run")
+    parser.add_argument("--part", type=int, nargs="*", help="Parts to run")
+    parser.add_argument("--name", help="Regex the solution name must match")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Process pool size (default: CPUs)"
+    )
+    parser.add_argument(
+        "--examples",
+        action="store_true",
+        help="Run the worked example defaults instead of the puzzle inputs",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the matching solutions and exit"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run everything rather than reusing answers from the answer cache",
+    )
+    parser.add_argument(
+        "--clear-cache", action="store_true", help="Empty the answer cache first"
+    )
+    parser.add_argument(
+        "--cache-file", default=DEFAULT_CACHE_FILE, help="The answer cache database"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time each solution over several rounds and rank the variants",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Timed rounds per benchmark"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed calls before each benchmark"
+    )
+    parser.add_argument("--json", help="Write the benchmark records to this file")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Add the benchmark timings to the performance history, implied by "
+        "--regressions",
+    )
+    parser.add_argument(
+        "--regressions",
+        action="store_true",
+        help="Report solutions slower than their baseline in the performance history",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="The slow down allowed before it counts as a regression (0.1 = 10%%)",
+    )
+    parser.add_argument(
+        "--baseline", help="Compare with this commit rather than the previous run"
+    )
+    parser.add_argument(
+        "--history-file",
+        default=DEFAULT_HISTORY_FILE,
+        help="The performance history database",
+    )
+    args = parser.parse_args(argv)
+
+    specs = select(discover(), args.year, args.day, args.part, args.name)
+    if args.list:
+        for spec in specs:
+            print(f"{spec.key} ({spec.kind})")
+        return 0
+
+    if args.benchmark or args.regressions:
+        failed = False
+        run_id = None
+        with PerformanceHistory(args.history_file) as history:
+            if args.benchmark:
+                results = run_benchmarks(
+                    specs,
+                    rounds=args.rounds,
+                    warmup=args.warmup,
+                    use_examples=args.examples,
+                )
+                print(format_comparison(results))
+                if args.json:
+                    write_records(results, args.json)
+                # The regressions are checked on the run just timed, so it has
+                # to be in the history
+                if args.record or args.regressions:
+                    run_id = history.record(results, use_examples=args.examples)
+                failed = any(r.status == "error" for r in results)
+            if args.regressions:
+                baseline = args.baseline and resolve_commit(args.baseline)
+                regressions = history.regressions(args.threshold, baseline, run_id)
+                print(format_regressions(regressions, args.threshold))
+                failed = failed or bool(regressions)
+        return 1 if failed else 0
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else AnswerCache(args.cache_file)
+    try:
+        if cache is not None and args.clear_cache:
+            cache.clear()
+        results = run_solutions(
+            specs, max_workers=args.workers, use_examples=args.examples, cache=cache
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    print(format_report(results, wall_time=time.perf_counter() - start))
+    return 1 if any(r.status == "error" for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
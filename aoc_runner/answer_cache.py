@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: answer_cache.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 7:12:05 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 7:12:05 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+An on disk cache of answers so re-running the archive only recomputes the days
+that have actually changed. Every answer is keyed by
+
+    (year, day, part, name, sha256 of the input, sha256 of the code)
+
+The code hash is built from the ast of the solution file with the other
+dayNN_partN functions removed, so editing part 2 does not throw away part 1 but
+editing a shared helper does. Comments and formatting are not part of the ast
+so tidying a file up does not invalidate anything either. Any repository module
+the solution imports (common_utils, utils, ...) is hashed in the same way and
+folded in, following their imports too.
+
+Entries live in a small sqlite database and are evicted least recently used
+first once either the entry count or the total answer size goes over the cap.
+"""
+
+import ast
+import hashlib
+from pathlib import Path
+import sqlite3
+import time
+
+try:
+    from .registry import PART_FUNCTION_PATTERN, REPO_ROOT, SolutionSpec
+except (ImportError, ValueError):
+    from registry import PART_FUNCTION_PATTERN, REPO_ROOT, SolutionSpec
+
+DEFAULT_CACHE_FILE: Path = REPO_ROOT / ".aoc_cache" / "answers.sqlite3"
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+EXAMPLE_INPUT_HASH = "examples"
+
+
+def hash_text(text: str | bytes) -> str:
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    return hashlib.sha256(text).hexdigest()
+
+
+def _is_main_block(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def _local_imports(tree: ast.Module, path: Path, search_folders: list[Path]) -> list[Path]:
+    """
+    Find the repository files imported anywhere in the tree, third party and
+    standard library imports do not resolve to a file here and are ignored.
+    """
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    found = []
+    for name in names:
+        first = name.split(".")[0]
+        for folder in [path.parent, *search_folders]:
+            candidate = folder / f"{first}.py"
+            if candidate.exists() and candidate != path:
+                found.append(candidate)
+                break
+    return found
+
+
+def code_hash(spec: SolutionSpec) -> str:
+    """
+    Hash the code a solution depends on without importing it.
+
+    Parameters
+    ----------
+    spec : SolutionSpec
+        The solution to hash.
+
+    Returns
+    -------
+    str
+        A sha256 hex digest that changes whenever the solution, a helper it
+        shares with the other parts, or a repository module it imports changes.
+    """
+    search_folders = [spec.year_root]
+    digest = hashlib.sha256()
+    seen: set[Path] = set()
+    to_hash = [spec.path]
+    while to_hash:
+        path = to_hash.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        if path == spec.path and spec.kind == "function":
+            # The other parts and the __main__ block cannot change this answer
+            tree.body = [
+                node
+                for node in tree.body
+                if not _is_main_block(node)
+                and not (
+                    isinstance(node, ast.FunctionDef)
+                    and PART_FUNCTION_PATTERN.match(node.name)
+                    and node.name != spec.name
+                )
+            ]
+        digest.update(str(path.relative_to(spec.year_root.parent)).encode("utf-8"))
+        digest.update(ast.dump(tree).encode("utf-8"))
+        to_hash.extend(_local_imports(tree, path, search_folders))
+    return digest.hexdigest()
+
+
+def input_hash(spec: SolutionSpec, use_examples: bool = False) -> str:
+    """
+    Hash the input a solution will be run on, the worked examples live in the
+    code so they share a fixed placeholder.
+    """
+    if use_examples and spec.kind == "function":
+        return EXAMPLE_INPUT_HASH
+    if spec.input_path is None:
+        return hash_text(b"")
+    return hash_text(spec.input_path.read_bytes())
+
+
+def cache_key(spec: SolutionSpec, use_examples: bool = False) -> str:
+    return hash_text(
+        "|".join(
+            (
+                str(spec.year),
+                str(spec.day),
+                str(spec.part),
+                spec.name,
+                input_hash(spec, use_examples),
+                code_hash(spec),
+            )
+        )
+    )
+
+
+class AnswerCache:
+    """
+    A least recently used answer store backed by sqlite.
+
+    Parameters
+    ----------
+    cache_file : Path, optional
+        The database file, created along with its folder if it is missing.
+    max_entries : int, optional
+        The most answers to keep.
+    max_bytes : int, optional
+        The most answer text to keep, in bytes.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path = DEFAULT_CACHE_FILE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_file = Path(cache_file)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.cache_file)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS answers (
+                key TEXT PRIMARY KEY,
+                solution TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                seconds REAL NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """
+        Look up an answer, returning it with the time it originally took to
+        solve, or None on a miss.
+        """
+        row = self._connection.execute(
+            "SELECT answer, seconds FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._connection.execute(
+            "UPDATE answers SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        self._connection.commit()
+        return row[0], row[1]
+
+    def put(self, key: str, solution: str, answer: str, seconds: float):
+        size = len(answer.encode("utf-8"))
+        self._connection.execute(
+            "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+            (key, solution, answer, seconds, size, time.time()),
+        )
+        self._evict()
+        self._connection.commit()
+
+    def clear(self):
+        self._connection.execute("DELETE FROM answers")
+        self._connection.commit()
+
+    def _evict(self):
+        count, total = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM answers"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM answers ORDER BY last_used ASC, rowid ASC"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        self._connection.executemany("DELETE FROM answers WHERE key = ?", evicted)
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: benchmark.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 11:58:14 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 11:58:14 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Proper timings rather than the single time.time() call in log_execution_time.
+Every solution gets some warmup calls and then a number of timed rounds with
+perf_counter_ns, summarised as min / median / p95. It works like the fixture
+from pytest-benchmark:
+
+    bench = Benchmark(rounds=10)
+    answer = bench(day01_part1_vectorized, input_str)
+    bench.stats.median
+
+run_benchmarks does the same for registered solutions, and format_comparison
+ranks the variants of each part (day01_part1_for_loop_method against
+day01_part1_vectorized, ...) side by side. The results can be written out as
+JSON records keyed by year / day / part / implementation.
+
+The benchmarks run one at a time in this process, running them across the
+process pool like the runner does would only have them fighting for the cores.
+"""
+
+import contextlib
+from dataclasses import dataclass, field
+import inspect
+import io
+import json
+import math
+import os
+from pathlib import Path
+import runpy
+import statistics
+import sys
+import time
+
+try:
+    from .registry import SolutionSpec
+    from .runner import _last_line, load_module
+except (ImportError, ValueError):
+    from registry import SolutionSpec
+    from runner import _last_line, load_module
+
+
+@dataclass
+class BenchmarkStats:
+    """
+    The timings of every round of one benchmark.
+
+    Attributes
+    ----------
+    times_ns : list[int]
+        The time each timed round took in nanoseconds.
+    warmup : int
+        The number of untimed calls made first.
+    """
+
+    times_ns: list[int] = field(default_factory=list)
+    warmup: int = 0
+
+    @property
+    def rounds(self) -> int:
+        return len(self.times_ns)
+
+    @property
+    def min(self) -> float:
+        return min(self.times_ns) / 1e9
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times_ns) / 1e9
+
+    @property
+    def p95(self) -> float:
+        # Nearest rank, so with only a few rounds this is the slowest one
+        ordered = sorted(self.times_ns)
+        return ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)] / 1e9
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times_ns) / 1e9
+
+    def as_dict(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "warmup": self.warmup,
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "mean": self.mean,
+        }
+
+
+class Benchmark:
+    """
+    Time a callable over several rounds after some warmup calls.
+
+    Parameters
+    ----------
+    rounds : int, optional
+        The number of timed calls, by default 5
+    warmup : int, optional
+        The number of calls made before timing starts, by default 1
+    """
+
+    def __init__(self, rounds: int = 5, warmup: int = 1):
+        if rounds < 1:
+            raise ValueError("At least one timed round is needed")
+        self.rounds = rounds
+        self.warmup = warmup
+        self.stats: BenchmarkStats | None = None
+
+    def __call__(self, func, *args, **kwargs):
+        """
+        Benchmark func(*args, **kwargs) and return the result of the last call,
+        the timings are left in self.stats.
+        """
+        # Time the function itself, not the logging done by log_execution_time
+        func = inspect.unwrap(func)
+        for _ in range(self.warmup):
+            func(*args, **kwargs)
+        times_ns = []
+        for _ in range(self.rounds):
+            start = time.perf_counter_ns()
+            result = func(*args, **kwargs)
+            times_ns.append(time.perf_counter_ns() - start)
+        self.stats = BenchmarkStats(times_ns, self.warmup)
+        return result
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The outcome of benchmarking a single registered solution.
+
+    Attributes
+    ----------
+    spec : SolutionSpec
+        The solution that was benchmarked.
+    status : str
+        "ok", "error" or "skipped".
+    answer : str | None
+        The answer from the last round.
+    stats : BenchmarkStats | None
+        The timings, None unless the status is "ok".
+    error : str | None
+        The error message if the solution failed or was skipped.
+    """
+
+    spec: SolutionSpec
+    status: str
+    answer: str | None = None
+    stats: BenchmarkStats | None = None
+    error: str | None = None
+
+    def to_record(self) -> dict:
+        """
+        The result as a JSON serialisable record.
+        """
+        record = {
+            "year": self.spec.year,
+            "day": self.spec.day,
+            "part": self.spec.part,
+            "implementation": self.spec.name,
+            "status": self.status,
+            "answer": self.answer,
+        }
+        if self.stats is not None:
+            record.update(self.stats.as_dict())
+        if self.error is not None:
+            record["error"] = self.error
+        return record
+
+
+@contextlib.contextmanager
+def _solution_context(spec: SolutionSpec):
+    # The same environment execute gives a solution in runner.py
+    previous_cwd = os.getcwd()
+    try:
+        os.chdir(spec.year_root)
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        os.chdir(previous_cwd)
+
+
+def _target(spec: SolutionSpec, use_examples: bool, input_str: str | None = None):
+    """
+    The callable and arguments to time for a solution, None if it cannot run.
+    """
+    if spec.kind == "script":
+        if input_str is not None:
+            return None
+        if str(spec.path.parent) not in sys.path:
+            sys.path.insert(0, str(spec.path.parent))
+
+        def run_script():
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                runpy.run_path(str(spec.path), run_name="__main__")
+            return _last_line(stdout.getvalue())
+
+        return run_script, ()
+    args = ()
+    if input_str is not None:
+        args = (input_str,)
+    elif not use_examples:
+        if spec.input_path is None:
+            return None
+        args = (spec.input_path.read_text(),)
+    return getattr(load_module(spec.path), spec.name), args
+
+
+def benchmark_solution(
+    spec: SolutionSpec,
+    rounds: int = 5,
+    warmup: int = 1,
+    use_examples: bool = False,
+    input_str: str | None = None,
+) -> BenchmarkResult:
+    """
+    Benchmark a single registered solution.
+
+    Parameters
+    ----------
+    spec : SolutionSpec
+        The solution to benchmark.
+    rounds : int, optional
+        The number of timed calls, by default 5
+    warmup : int, optional
+        The number of untimed calls made first, by default 1
+    use_examples : bool, optional
+        Time the worked example defaults instead of the puzzle input, by default
+        False
+    input_str : str | None, optional
+        Time the solution on this input instead, e.g. a generated one. Scripts
+        always read their own input file so they are skipped.
+
+    Returns
+    -------
+    BenchmarkResult
+        The timings, errors are captured rather than raised like in the runner.
+    """
+    try:
+        with _solution_context(spec):
+            target = _target(spec, use_examples, input_str)
+            if target is None:
+                error = (
+                    "Scripts read their own input file"
+                    if input_str is not None
+                    else f"No input file for day {spec.day}"
+                )
+                return BenchmarkResult(spec, "skipped", error=error)
+            func, args = target
+            bench = Benchmark(rounds=rounds, warmup=warmup)
+            answer = bench(func, *args)
+    except BaseException as e:  # SystemExit from the older scripts too
+        if isinstance(e, KeyboardInterrupt):
+            raise
+        return BenchmarkResult(spec, "error", error=f"{type(e).__name__}: {e}")
+    return BenchmarkResult(spec, "ok", str(answer), bench.stats)
+
+
+def run_benchmarks(
+    specs: list[SolutionSpec],
+    rounds: int = 5,
+    warmup: int = 1,
+    use_examples: bool = False,
+    input_str: str | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Benchmark each of the solutions in turn, see benchmark_solution.
+    """
+    return [
+        benchmark_solution(spec, rounds, warmup, use_examples, input_str)
+        for spec in specs
+    ]
+
+
+def compare(results: list[BenchmarkResult]) -> dict[tuple, list[BenchmarkResult]]:
+    """
+    Group the results by (year, day, part) with the fastest median first.
+
+    Parameters
+    ----------
+    results : list[BenchmarkResult]
+        The benchmark results.
+
+    Returns
+    -------
+    dict[tuple, list[BenchmarkResult]]
+        The ranked variants of each part, results without timings come last.
+    """
+    groups: dict[tuple, list[BenchmarkResult]] = {}
+    for result in results:
+        key = (result.spec.year, result.spec.day, result.spec.part)
+        groups.setdefault(key, []).append(result)
+    for group in groups.values():
+        group.sort(key=lambda r: math.inf if r.stats is None else r.stats.median)
+    return groups
+
+
+def format_comparison(results: list[BenchmarkResult]) -> str:
+    """
+    Build a plain text table ranking the variants of every part.
+
+    Parameters
+    ----------
+    results : list[BenchmarkResult]
+        The benchmark results.
+
+    Returns
+    -------
+    str
+        The report, each variant is shown with its timings and how many times
+        slower its median is than the fastest variant of the same part.
+    """
+    name_width = max([len(r.spec.name) for r in results] + [4])
+    header = (
+        f"{'year':>4} {'day':>3} {'part':>4} {'rank':>4} {'name':<{name_width}} "
+        f"{'min':>10} {'median':>10} {'p95':>10} {'vs best':>8}  answer"
+    )
+    lines = [header, "-" * len(header)]
+    for (year, day, part), group in compare(results).items():
+        part = "-" if part is None else str(part)
+        best = group[0].stats.median if group[0].stats is not None else None
+        for rank, r in enumerate(group, start=1):
+            if r.stats is None:
+                lines.append(
+                    f"{year:>4} {day:>3} {part:>4} {'':>4} {r.spec.name:<{name_width}} "
+                    f"{r.status:>10}  {r.error}"
+                )
+                continue
+            relative = r.stats.median / best if best else 1.0
+            lines.append(
+                f"{year:>4} {day:>3} {part:>4} {rank:>4} {r.spec.name:<{name_width}} "
+                f"{r.stats.min:>10.6f} {r.stats.median:>10.6f} {r.stats.p95:>10.6f} "
+                f"{relative:>7.2f}x  {r.answer}"
+            )
+    return "\n".join(lines)
+
+
+def write_records(results: list[BenchmarkResult], path: Path | str) -> None:
+    """
+    Write the results to a JSON file as a list of records.
+    """
+    with open(path, "w") as f:
+        json.dump([r.to_record() for r in results], f, indent=2)
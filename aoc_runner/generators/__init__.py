@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: __init__.py
+Project: advent-of-code
+File Created: Sunday, 18th October 2026 12:00:21 am
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Sunday, 18th October 2026 12:00:21 am
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+The worked examples are tiny, so a solution that is quadratic in the input looks
+just as quick as a linear one until it meets a real input, and even the real
+inputs are too small to show it clearly. These generators make seeded, valid
+inputs for every implemented day at any scale:
+
+    generated = generate(2025, 5, scale=1000, seed=1)
+    generated.text          # the puzzle input
+    generated.answers       # {1: ..., 2: ...} from the reference oracle
+
+The scale multiplies the size of the worked example, the number of lines,
+ranges or instructions, or the area of a grid. Each day has a generator, which
+only makes the input, and an oracle, which solves it independently of the code
+in puzzle_solutions with the most obvious correct method. Where the only oracle
+would be as slow as the solutions themselves that part is left out of answers.
+
+    python -m aoc_runner.generators --year 2025 --day 3 --scale 1000 --check
+
+writes the input and checks every registered solution of the day against the
+oracle, see __main__.py.
+"""
+
+from dataclasses import dataclass, field
+import json
+import math
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+Answer = int | str
+GeneratorFunction = Callable[[np.random.Generator, int], str]
+OracleFunction = Callable[[str], dict[int, Answer]]
+
+GENERATORS: dict[tuple[int, int], GeneratorFunction] = {}
+ORACLES: dict[tuple[int, int], OracleFunction] = {}
+
+
+def generator(year: int, day: int):
+    """
+    Register a function making the input of a day from a numpy Generator and
+    the scale.
+    """
+
+    def register(func: GeneratorFunction) -> GeneratorFunction:
+        GENERATORS[(year, day)] = func
+        return func
+
+    return register
+
+
+def oracle(year: int, day: int):
+    """
+    Register a function solving the input of a day, returning the answers keyed
+    by part.
+    """
+
+    def register(func: OracleFunction) -> OracleFunction:
+        ORACLES[(year, day)] = func
+        return func
+
+    return register
+
+
+def count(base: int, scale: int) -> int:
+    """
+    The number of lines (or ranges, reports, ...) for a scale.
+    """
+    return max(1, base * scale)
+
+
+def side(base: int, scale: int) -> int:
+    """
+    The side of a grid for a scale, the area grows with the scale.
+    """
+    return max(1, round(base * math.sqrt(scale)))
+
+
+@dataclass
+class GeneratedInput:
+    """
+    A generated puzzle input along with its reference answers.
+
+    Attributes
+    ----------
+    year : int
+        The puzzle year.
+    day : int
+        The puzzle day.
+    scale : int
+        The multiple of the worked example size.
+    seed : int
+        The seed it was generated from.
+    text : str
+        The puzzle input.
+    answers : dict[int, Answer]
+        The oracle answers keyed by part, parts without a cheap oracle are
+        missing.
+    """
+
+    year: int
+    day: int
+    scale: int
+    seed: int
+    text: str
+    answers: dict[int, Answer] = field(default_factory=dict)
+
+    @property
+    def file_name(self) -> str:
+        # The older years did not zero pad the day, see SolutionSpec.input_path
+        return f"day{self.day}.txt" if self.year < 2024 else f"day{self.day:02d}.txt"
+
+    def write(self, folder: Path | str) -> Path:
+        """
+        Write the input into folder/<year>/inputs along with a json file of
+        the answers, returning the path of the input.
+        """
+        inputs = Path(folder) / str(self.year) / "inputs"
+        inputs.mkdir(parents=True, exist_ok=True)
+        input_file = inputs / self.file_name
+        input_file.write_text(self.text)
+        input_file.with_suffix(".json").write_text(
+            json.dumps(
+                {
+                    "year": self.year,
+                    "day": self.day,
+                    "scale": self.scale,
+                    "seed": self.seed,
+                    "answers": self.answers,
+                },
+                indent=2,
+            )
+        )
+        return input_file
+
+
+def available(
+    years: list[int] | None = None, days: list[int] | None = None
+) -> list[tuple[int, int]]:
+    """
+    The (year, day) of every generator, filtered like registry.select.
+    """
+    return sorted(
+        (year, day)
+        for year, day in GENERATORS
+        if (not years or year in years) and (not days or day in days)
+    )
+
+
+def generate(
+    year: int, day: int, scale: int = 1, seed: int = 0, answers: bool = True
+) -> GeneratedInput:
+    """
+    Generate the input of a day.
+
+    Parameters
+    ----------
+    year : int
+        The puzzle year.
+    day : int
+        The puzzle day.
+    scale : int, optional
+        The multiple of the worked example size, by default 1
+    seed : int, optional
+        The seed, the same seed and scale always give the same input, by
+        default 0
+    answers : bool, optional
+        Run the oracle for the reference answers, by default True
+
+    Returns
+    -------
+    GeneratedInput
+        The input and its answers.
+
+    Raises
+    ------
+    ValueError
+        If the scale is less than 1.
+    KeyError
+        If there is no generator for the day.
+    """
+    if scale < 1:
+        raise ValueError("The scale must be at least 1")
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No generator for {year} day {day}")
+    text = GENERATORS[(year, day)](np.random.default_rng(seed), scale)
+    solved = ORACLES[(year, day)](text) if answers and (year, day) in ORACLES else {}
+    return GeneratedInput(year, day, scale, seed, text, solved)
+
+
+# The year modules register themselves with the decorators above
+from . import y2022, y2024, y2025  # noqa: E402,F401
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: __main__.py
+Project: advent-of-code
+File Created: Sunday, 18th October 2026 12:00:21 am
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Sunday, 18th October 2026 12:00:21 am
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Write generated inputs (and their answers) to .aoc_cache/generated with:
+
+    python -m aoc_runner.generators --year 2025 --day 1 2 --scale 1000 --seed 7
+
+Adding --check also benchmarks every registered solution of each day on the
+generated input and compares the answers with the oracle, exiting with 1 if
+any are wrong. Only the function style solutions can be checked this way, the
+2022 scripts read their own input files.
+"""
+
+import argparse
+from pathlib import Path
+
+from ..benchmark import BenchmarkResult, format_comparison, run_benchmarks
+from ..registry import REPO_ROOT, discover, select
+from . import available, generate
+
+DEFAULT_OUTPUT_FOLDER: Path = REPO_ROOT / ".aoc_cache" / "generated"
+
+
+def mismatches(results: list[BenchmarkResult], answers: dict) -> list[str]:
+    """
+    Describe every result whose answer does not match the oracle.
+    """
+    return [
+        f"{r.spec.key}: got {r.answer}, expected {answers[r.spec.part]}"
+        for r in results
+        if r.status == "ok"
+        and r.spec.part in answers
+        and r.answer != str(answers[r.spec.part])
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aoc_runner.generators",
+        description="Generate large puzzle inputs with reference answers.",
+    )
+    parser.add_argument("--year", type=int, nargs="*", help="Years to generate")
+    parser.add_argument("--day", type=int, nargs="*", help="Days to generate")
+    parser.add_argument(
+        "--scale", type=int, default=1, help="Multiple of the worked example size"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="The random seed")
+    parser.add_argument(
+        "--out", default=DEFAULT_OUTPUT_FOLDER, help="Where to write the inputs"
+    )
+    parser.add_argument(
+        "--no-answers", action="store_true", help="Skip the reference oracles"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Benchmark the solutions on the inputs and check their answers",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=1, help="Timed rounds per solution"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=0, help="Untimed calls before each solution"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the days with generators and exit"
+    )
+    args = parser.parse_args(argv)
+
+    days = available(args.year, args.day)
+    if args.list:
+        for year, day in days:
+            print(f"{year}/{day:02d}")
+        return 0
+
+    specs = discover() if args.check else []
+    failed = False
+    for year, day in days:
+        generated = generate(year, day, args.scale, args.seed, not args.no_answers)
+        path = generated.write(args.out)
+        print(
+            f"{year}/{day:02d} scale {args.scale} seed {args.seed}: "
+            f"{len(generated.text):,} characters -> {path}"
+        )
+        for part, answer in generated.answers.items():
+            print(f"  part {part}: {answer}")
+        if not args.check:
+            continue
+        results = run_benchmarks(
+            select(specs, [year], [day]),
+            rounds=args.rounds,
+            warmup=args.warmup,
+            input_str=generated.text,
+        )
+        if results:
+            print(format_comparison(results))
+        wrong = mismatches(results, generated.answers)
+        for line in wrong:
+            print(f"  WRONG {line}")
+        failed = failed or bool(wrong) or any(r.status == "error" for r in results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
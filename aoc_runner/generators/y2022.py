@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: y2022.py
+Project: advent-of-code
+File Created: Sunday, 18th October 2026 12:00:21 am
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Sunday, 18th October 2026 12:00:21 am
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Generators and oracles for the 2022 puzzles. The 2022 scripts always read their
+own inputs/dayN.txt, so these inputs have to be written out and copied over them
+rather than checked directly.
+"""
+
+from collections import Counter, deque
+import heapq
+import re
+import string
+
+import numpy as np
+
+from . import count, generator, oracle, side
+
+MOVE_PATTERN = re.compile(r"move (\d+) from (\d+) to (\d+)")
+ALPHABET = np.array(list(string.ascii_lowercase))
+
+
+def _lines(rows) -> str:
+    return "\n".join(rows) + "\n"
+
+
+@generator(2022, 1)
+def day01(rng: np.random.Generator, scale: int) -> str:
+    elves = [
+        "\n".join(map(str, rng.integers(1000, 70000, rng.integers(1, 16)).tolist()))
+        for _ in range(count(5, scale))
+    ]
+    return "\n\n".join(elves) + "\n"
+
+
+@oracle(2022, 1)
+def day01_answers(text: str) -> dict[int, int]:
+    totals = [sum(map(int, elf.split())) for elf in text.strip().split("\n\n")]
+    return {1: max(totals), 2: sum(heapq.nlargest(3, totals))}
+
+
+@generator(2022, 2)
+def day02(rng: np.random.Generator, scale: int) -> str:
+    n = count(3, scale)
+    return _lines(
+        f"{a} {b}"
+        for a, b in zip(rng.choice(list("ABC"), n), rng.choice(list("XYZ"), n))
+    )
+
+
+@oracle(2022, 2)
+def day02_answers(text: str) -> dict[int, int]:
+    part1 = part2 = 0
+    for line in text.splitlines():
+        theirs, column = "ABC".index(line[0]), "XYZ".index(line[2])
+        # (mine - theirs) % 3 is 0 for a draw, 1 for a win and 2 for a loss
+        part1 += column + 1 + 3 * ((column - theirs + 1) % 3)
+        part2 += (theirs + column - 1) % 3 + 1 + 3 * column
+    return {1: part1, 2: part2}
+
+
+@generator(2022, 3)
+def day03(rng: np.random.Generator, scale: int) -> str:
+    letters = list(string.ascii_letters)
+    rucksacks = []
+    for _ in range(count(2, scale)):
+        badge = str(rng.choice(letters))
+        others = [c for c in letters if c != badge]
+        # Every other item is kept out of one of the three rucksacks, so the
+        # badge is the only item they all share
+        missing_from = rng.integers(0, 3, len(others))
+        for elf in range(3):
+            allowed = [c for c, m in zip(others, missing_from) if m != elf]
+            shared = str(rng.choice(allowed + [badge]))
+            rest = [c for c in allowed + [badge] if c != shared]
+            in_first = rng.random(len(rest)) < 0.5
+            first = [c for c, f in zip(rest, in_first) if f]
+            second = [c for c, f in zip(rest, in_first) if not f]
+            size = int(rng.integers(4, 17))
+            halves = []
+            for pool in (first, second):
+                items = [shared]
+                if badge in pool:
+                    items.append(badge)
+                items += rng.choice(pool, size - len(items)).tolist() if pool else []
+                items += [shared] * (size - len(items))
+                halves.append("".join(rng.permutation(items)))
+            rucksacks.append("".join(halves))
+    return _lines(rucksacks)
+
+
+def _priority(item: str) -> int:
+    return string.ascii_letters.index(item) + 1
+
+
+@oracle(2022, 3)
+def day03_answers(text: str) -> dict[int, int]:
+    rucksacks = text.split()
+    part1 = 0
+    for items in rucksacks:
+        (shared,) = set(items[: len(items) // 2]) & set(items[len(items) // 2 :])
+        part1 += _priority(shared)
+    part2 = 0
+    for i in range(0, len(rucksacks), 3):
+        (badge,) = set.intersection(*map(set, rucksacks[i : i + 3]))
+        part2 += _priority(badge)
+    return {1: part1, 2: part2}
+
+
+@generator(2022, 4)
+def day04(rng: np.random.Generator, scale: int) -> str:
+    sections = np.sort(rng.integers(1, 100, (count(6, scale), 2, 2)), axis=2)
+    return _lines(f"{a}-{b},{c}-{d}" for (a, b), (c, d) in sections.tolist())
+
+
+@oracle(2022, 4)
+def day04_answers(text: str) -> dict[int, int]:
+    part1 = part2 = 0
+    for line in text.split():
+        a, b, c, d = map(int, re.split("[-,]", line))
+        part1 += (a <= c and d <= b) or (c <= a and b <= d)
+        part2 += a <= d and c <= b
+    return {1: part1, 2: part2}
+
+
+@generator(2022, 5)
+def day05(rng: np.random.Generator, scale: int) -> str:
+    # Nine stacks so the labels stay single digits, they get taller and the
+    # manifest longer with the scale but each move is still a handful of crates
+    heights = rng.integers(2, 8 * scale + 2, 9)
+    stacks = [
+        rng.choice(list(string.ascii_uppercase), height).tolist()
+        for height in heights.tolist()
+    ]
+    drawing = [
+        " ".join(f"[{s[level]}]" if level < len(s) else "   " for s in stacks)
+        for level in reversed(range(max(heights)))
+    ]
+    drawing.append(" " + "   ".join(str(i) for i in range(1, 10)) + " ")
+    moves = []
+    sizes = heights.tolist()
+    for _ in range(count(50, scale)):
+        # Always leave a crate behind so every stack has a top at the end
+        source = int(rng.choice([i for i, size in enumerate(sizes) if size > 1]))
+        target = int(rng.choice([i for i in range(9) if i != source]))
+        crates = int(rng.integers(1, min(sizes[source] - 1, 30) + 1))
+        sizes[source] -= crates
+        sizes[target] += crates
+        moves.append(f"move {crates} from {source + 1} to {target + 1}")
+    return _lines(drawing) + "\n" + _lines(moves)
+
+
+@oracle(2022, 5)
+def day05_answers(text: str) -> dict[int, str]:
+    drawing, manifest = text.rstrip("\n").split("\n\n")
+    *rows, labels = drawing.split("\n")
+    tops = {}
+    for reverse in (True, False):
+        stacks: list[list[str]] = [[] for _ in labels.split()]
+        for row in reversed(rows):
+            for i, stack in enumerate(stacks):
+                if 4 * i + 1 < len(row) and row[4 * i + 1] != " ":
+                    stack.append(row[4 * i + 1])
+        for crates, source, target in MOVE_PATTERN.findall(manifest):
+            crates = int(crates)
+            moved = stacks[int(source) - 1][-crates:]
+            del stacks[int(source) - 1][-crates:]
+            stacks[int(target) - 1].extend(reversed(moved) if reverse else moved)
+        tops[1 if reverse else 2] = "".join(stack[-1] for stack in stacks)
+    return tops
+
+
+@generator(2022, 6)
+def day06(rng: np.random.Generator, scale: int) -> str:
+    # Keep to three letters, then thirteen, so neither marker turns up until
+    # it is put there on purpose near each end
+    length = count(30, scale)
+    letters = rng.permutation(ALPHABET)
+    start = int(0.4 * length)
+    middle = max(length - start - 4 - 14, 0)
+    stream = np.concatenate(
+        (
+            rng.choice(letters[:3], start),
+            rng.permutation(letters[:4]),
+            rng.choice(letters[:13], middle),
+            rng.permutation(letters[:14]),
+        )
+    )
+    return "".join(stream) + "\n"
+
+
+def _first_marker(stream: str, size: int) -> int:
+    window: Counter = Counter()
+    for i, character in enumerate(stream):
+        window[character] += 1
+        if i >= size:
+            window[stream[i - size]] -= 1
+            if not window[stream[i - size]]:
+                del window[stream[i - size]]
+        if len(window) == size:
+            return i + 1
+    raise ValueError(f"No marker of {size} different characters")
+
+
+@oracle(2022, 6)
+def day06_answers(text: str) -> dict[int, int]:
+    stream = text.strip()
+    return {1: _first_marker(stream, 4), 2: _first_marker(stream, 14)}
+
+
+def _name(rng: np.random.Generator) -> str:
+    return "".join(rng.choice(ALPHABET, int(rng.integers(3, 9))))
+
+
+@generator(2022, 7)
+def day07(rng: np.random.Generator, scale: int) -> str:
+    n_dirs, n_files = count(4, scale), count(10, scale)
+    children: list[list[int]] = [[] for _ in range(n_dirs)]
+    for d in range(1, n_dirs):
+        children[int(rng.integers(0, d))].append(d)
+    files: list[list[int]] = [[] for _ in range(n_dirs)]
+    for f, d in enumerate(rng.integers(0, n_dirs, n_files).tolist()):
+        files[d].append(f)
+    # Sizes spread over orders of magnitude so there are small folders too,
+    # adding up to enough that something has to be deleted
+    weights = 10 ** rng.uniform(0, 6, n_files)
+    total = int(rng.integers(45_000_000, 69_000_000))
+    sizes = np.maximum(1, (weights / weights.sum() * total).astype(np.int64)).tolist()
+
+    names: list[str] = [""] * n_dirs
+    file_names: list[str] = [""] * n_files
+    for d in range(n_dirs):
+        taken = set()
+        for child in children[d]:
+            while (name := _name(rng)) in taken:
+                pass
+            taken.add(name)
+            names[child] = name
+        for f in files[d]:
+            while (name := f"{_name(rng)}.{_name(rng)[:3]}") in taken:
+                pass
+            taken.add(name)
+            file_names[f] = name
+
+    lines = ["$ cd /"]
+    to_visit: list[tuple[int, bool]] = [(0, False)]
+    while to_visit:
+        d, leaving = to_visit.pop()
+        if leaving:
+            lines.append("$ cd ..")
+            continue
+        if d:
+            lines.append(f"$ cd {names[d]}")
+            to_visit.append((d, True))
+        lines.append("$ ls")
+        listing = [(names[c], f"dir {names[c]}") for c in children[d]]
+        listing += [(file_names[f], f"{sizes[f]} {file_names[f]}") for f in files[d]]
+        lines.extend(entry for _, entry in sorted(listing))
+        to_visit.extend((c, False) for c in reversed(children[d]))
+    return _lines(lines)
+
+
+@oracle(2022, 7)
+def day07_answers(text: str) -> dict[int, int]:
+    totals = []
+    path = [0]
+    for line in text.splitlines():
+        if line == "$ cd /" or line == "$ ls" or line.startswith("dir "):
+            continue
+        if line == "$ cd ..":
+            size = path.pop()
+            totals.append(size)
+            path[-1] += size
+        elif line.startswith("$ cd "):
+            path.append(0)
+        else:
+            path[-1] += int(line.split()[0])
+    while len(path) > 1:
+        size = path.pop()
+        totals.append(size)
+        path[-1] += size
+    used = path[0]
+    totals.append(used)
+    needed = 30_000_000 - (70_000_000 - used)
+    return {
+        1: sum(t for t in totals if t <= 100_000),
+        2: min(t for t in totals if t >= needed),
+    }
+
+
+@generator(2022, 8)
+def day08(rng: np.random.Generator, scale: int) -> str:
+    size = side(5, scale)
+    grid = rng.integers(0, 10, (size, size), dtype=np.uint8) + ord("0")
+    return _lines(row.tobytes().decode() for row in grid)
+
+
+def _visible_from_left(heights: np.ndarray) -> np.ndarray:
+    tallest_before = np.maximum.accumulate(heights, axis=1)[:, :-1]
+    return np.concatenate(
+        (np.ones((len(heights), 1), dtype=bool), heights[:, 1:] > tallest_before),
+        axis=1,
+    )
+
+
+def _view_left(heights: np.ndarray) -> np.ndarray:
+    """
+    How many trees each tree can see to its left, sweeping across the columns
+    with the last column each height (or taller) was seen in.
+    """
+    rows, cols = heights.shape
+    last_at_least = np.zeros((rows, 10), dtype=np.int64)
+    view = np.zeros((rows, cols), dtype=np.int64)
+    row_index = np.arange(rows)
+    for col in range(cols):
+        view[:, col] = col - last_at_least[row_index, heights[:, col]]
+        last_at_least[np.arange(10) <= heights[:, col, None]] = col
+    return view
+
+
+@oracle(2022, 8)
+def day08_answers(text: str) -> dict[int, int]:
+    heights = np.array([list(map(int, line)) for line in text.split()])
+    # Looking from the right, top and bottom is looking from the left of the
+    # flipped or transposed grid
+    views = [
+        (lambda g: g, lambda g: g),
+        (lambda g: g[:, ::-1], lambda g: g[:, ::-1]),
+        (lambda g: g.T, lambda g: g.T),
+        (lambda g: g.T[:, ::-1], lambda g: g[:, ::-1].T),
+    ]
+    visible = np.zeros(heights.shape, dtype=bool)
+    score = np.ones(heights.shape, dtype=np.int64)
+    for forward, back in views:
+        oriented = np.ascontiguousarray(forward(heights))
+        visible |= back(_visible_from_left(oriented))
+        score *= back(_view_left(oriented))
+    return {1: int(visible.sum()), 2: int(score.max())}
+
+
+@generator(2022, 9)
+def day09(rng: np.random.Generator, scale: int) -> str:
+    n = count(8, scale)
+    return _lines(
+        f"{d} {s}"
+        for d, s in zip(rng.choice(list("UDLR"), n), rng.integers(1, 20, n).tolist())
+    )
+
+
+@oracle(2022, 9)
+def day09_answers(text: str) -> dict[int, int]:
+    directions = {"U": (0, 1), "D": (0, -1), "L": (-1, 0), "R": (1, 0)}
+    knots = [[0, 0] for _ in range(10)]
+    second, last = {(0, 0)}, {(0, 0)}
+    for line in text.splitlines():
+        direction, steps = line.split()
+        dx, dy = directions[direction]
+        for _ in range(int(steps)):
+            knots[0][0] += dx
+            knots[0][1] += dy
+            for ahead, behind in zip(knots, knots[1:]):
+                x, y = ahead[0] - behind[0], ahead[1] - behind[1]
+                if abs(x) > 1 or abs(y) > 1:
+                    behind[0] += (x > 0) - (x < 0)
+                    behind[1] += (y > 0) - (y < 0)
+            second.add(tuple(knots[1]))
+            last.add(tuple(knots[9]))
+    return {1: len(second), 2: len(last)}
+
+
+@generator(2022, 10)
+def day10(rng: np.random.Generator, scale: int) -> str:
+    # The example is exactly the 240 cycles of one screen, bigger programs
+    # draw more rows of 40. Every addx jumps X to a new column between 1 and
+    # 38 so the whole sprite stays on the screen
+    cycles = 240 * scale
+    is_addx = rng.random(cycles) < 0.7
+    xs = 1 + np.cumsum(rng.integers(1, 38, int(is_addx.sum()))) % 38
+    values = iter(np.diff(xs, prepend=1).tolist())
+    ends = np.cumsum(np.where(is_addx, 2, 1))
+    last = int(np.searchsorted(ends, cycles))
+    lines = [
+        f"addx {next(values)}" if addx else "noop"
+        for addx in is_addx[: last + 1].tolist()
+    ]
+    if ends[last] > cycles:
+        # An addx running over the end is swapped for a noop
+        lines[-1] = "noop"
+    return _lines(lines)
+
+
+@oracle(2022, 10)
+def day10_answers(text: str) -> dict[int, int | str]:
+    during = []
+    x = 1
+    for line in text.splitlines():
+        during.append(x)
+        if line.startswith("addx"):
+            during.append(x)
+            x += int(line.split()[1])
+    part1 = sum(c * during[c - 1] for c in range(20, len(during) + 1, 40))
+    pixels = "".join(
+        "#" if abs(during[c] - c % 40) <= 1 else "." for c in range(len(during))
+    )
+    rows = [pixels[i : i + 40] for i in range(0, len(pixels), 40)]
+    return {1: part1, 2: "\n".join(rows)}
+
+
+@generator(2022, 11)
+def day11(rng: np.random.Generator, scale: int) -> str:
+    # Eight monkeys like the real input, with more items as the scale goes
+    # up. The old * old monkey only ever throws into a group that never throws
+    # back to it, the worry levels would grow without limit in part 1 otherwise
+    monkeys = 8
+    divisors = rng.permutation([2, 3, 5, 7, 11, 13, 17, 19, 23])[:monkeys]
+    order = rng.permutation(monkeys).tolist()
+    # order[1:3] are free to throw to anyone, the squarer included
+    squarer, closed = order[0], order[3:]
+    operations = ["old + " + str(rng.integers(1, 9)) for _ in range(monkeys)]
+    operations[squarer] = "old * old"
+    operations[int(rng.choice(closed))] = "old * " + str(rng.integers(2, 20))
+    blocks = []
+    for monkey in range(monkeys):
+        group = closed if monkey == squarer or monkey in closed else range(monkeys)
+        targets = rng.choice([m for m in group if m != monkey], 2, replace=False)
+        items = rng.integers(50, 100, int(rng.integers(1, 9)) * scale)
+        blocks.append(
+            f"Monkey {monkey}:\n"
+            f"  Starting items: {', '.join(map(str, items.tolist()))}\n"
+            f"  Operation: new = {operations[monkey]}\n"
+            f"  Test: divisible by {divisors[monkey]}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}"
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+@oracle(2022, 11)
+def day11_answers(text: str) -> dict[int, int]:
+    # Only part 1, part 2 has no shortcut past simulating all 10000 rounds
+    monkeys = []
+    for block in text.strip().split("\n\n"):
+        lines = block.splitlines()
+        monkeys.append(
+            {
+                "items": deque(map(int, re.findall(r"\d+", lines[1]))),
+                "operation": lines[2].split("= ")[1].split(),
+                "divisor": int(lines[3].split()[-1]),
+                "targets": (int(lines[4].split()[-1]), int(lines[5].split()[-1])),
+                "inspected": 0,
+            }
+        )
+    for _ in range(20):
+        for monkey in monkeys:
+            _, op, value = monkey["operation"]
+            while monkey["items"]:
+                old = monkey["items"].popleft()
+                other = old if value == "old" else int(value)
+                worry = (old * other if op == "*" else old + other) // 3
+                target = monkey["targets"][worry % monkey["divisor"] != 0]
+                monkeys[target]["items"].append(worry)
+                monkey["inspected"] += 1
+    first, second = heapq.nlargest(2, (m["inspected"] for m in monkeys))
+    return {1: first * second}
+
+
+@generator(2022, 12)
+def day12(rng: np.random.Generator, scale: int) -> str:
+    # The ground climbs one letter at a time from the left edge to the right,
+    # some squares are dug out or built up. The start row and the right hand
+    # column are left alone so there is always a way from S to E
+    rows, cols = side(5, scale), max(26, side(8, scale))
+    heights = np.broadcast_to(np.arange(cols) * 26 // cols, (rows, cols)).copy()
+    start, end = rng.integers(0, rows, 2).tolist()
+    noise = rng.random((rows, cols))
+    dug = noise < 0.3
+    heights[dug] = (heights[dug] * rng.random(int(dug.sum()))).astype(np.int64)
+    built = noise > 0.9
+    heights[built] += rng.integers(2, 6, int(built.sum()))
+    np.minimum(heights, 25, out=heights)
+    heights[start] = np.arange(cols) * 26 // cols
+    heights[:, -1] = 25
+    grid = (heights + ord("a")).astype(np.uint8)
+    grid[start, 0], grid[end, -1] = ord("S"), ord("E")
+    return _lines(row.tobytes().decode() for row in grid)
+
+
+@oracle(2022, 12)
+def day12_answers(text: str) -> dict[int, int]:
+    rows = text.split()
+    cols = len(rows[0])
+    cells = "".join(rows)
+    start, end = cells.index("S"), cells.index("E")
+    heights = [ord(c) - ord("a") for c in cells.replace("S", "a").replace("E", "z")]
+    # Walk backwards from E, a step down can be any size but a step up only one
+    distance = {end: 0}
+    queue = deque([end])
+    while queue:
+        cell = queue.popleft()
+        r, c = divmod(cell, cols)
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            neighbour = nr * cols + nc
+            if (
+                0 <= nr < len(rows)
+                and 0 <= nc < cols
+                and neighbour not in distance
+                and heights[cell] <= heights[neighbour] + 1
+            ):
+                distance[neighbour] = distance[cell] + 1
+                queue.append(neighbour)
+    return {
+        1: distance[start],
+        2: min(d for cell, d in distance.items() if heights[cell] == 0),
+    }
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: y2024.py
+Project: advent-of-code
+File Created: Sunday, 18th October 2026 12:00:21 am
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Sunday, 18th October 2026 12:00:21 am
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Generators and oracles for the 2024 puzzles.
+"""
+
+from collections import Counter
+import re
+
+import numpy as np
+
+from . import count, generator, oracle, side
+
+MUL_PATTERN = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+# None of these end in a partial mul( or start with a digit, so gluing them
+# together can never make a valid instruction by accident
+CORRUPTED = [
+    "mul[3,7]", "mul(32,64]", "mul ( 2 , 4 )", "mul(4*", "mul(6,9!", "?(12,34)"
+]
+NOISE = [
+    "why()", "what()", "how()", "where()", "select()", "from()", "when(", "mul",
+    "mul(", "do", "don't", ")", "'", "<", ">", "[", "]", "{", "}", "!", "@", "#",
+    "$", "%", "^", "&", "*", "+", "-", "~", ":", ";", "/", "?", ",", " ",
+]
+
+
+def _lines(rows) -> str:
+    return "\n".join(rows) + "\n"
+
+
+@generator(2024, 1)
+def day01(rng: np.random.Generator, scale: int) -> str:
+    n = count(6, scale)
+    left = rng.integers(10_000, 100_000, n)
+    # Half of the right list comes from the left so the similarity is not 0
+    right = np.where(
+        rng.random(n) < 0.5, rng.choice(left, n), rng.integers(10_000, 100_000, n)
+    )
+    return _lines(f"{a}   {b}" for a, b in zip(left.tolist(), right.tolist()))
+
+
+@oracle(2024, 1)
+def day01_answers(text: str) -> dict[int, int]:
+    numbers = list(map(int, text.split()))
+    left, right = numbers[::2], numbers[1::2]
+    right_counts = Counter(right)
+    return {
+        1: sum(abs(a - b) for a, b in zip(sorted(left), sorted(right))),
+        2: sum(a * right_counts[a] for a in left),
+    }
+
+
+@generator(2024, 2)
+def day02(rng: np.random.Generator, scale: int) -> str:
+    reports = []
+    for _ in range(count(6, scale)):
+        length = int(rng.integers(5, 9))
+        steps = rng.integers(1, 4, length - 1)
+        climb = np.concatenate(([0], np.cumsum(steps)))
+        if rng.random() < 0.5:
+            levels = int(rng.integers(1, 30)) + climb
+        else:
+            levels = int(rng.integers(70, 100)) - climb
+        # Roughly a third stay safe, the rest get one or two bad levels
+        for _ in range(int(rng.choice([0, 1, 2], p=[0.35, 0.45, 0.2]))):
+            levels[rng.integers(0, length)] = rng.integers(1, 100)
+        reports.append(" ".join(map(str, levels.tolist())))
+    return _lines(reports)
+
+
+def _is_safe(levels: list[int]) -> bool:
+    differences = [b - a for a, b in zip(levels, levels[1:])]
+    return all(1 <= d <= 3 for d in differences) or all(
+        -3 <= d <= -1 for d in differences
+    )
+
+
+@oracle(2024, 2)
+def day02_answers(text: str) -> dict[int, int]:
+    reports = [list(map(int, line.split())) for line in text.splitlines()]
+    return {
+        1: sum(_is_safe(levels) for levels in reports),
+        2: sum(
+            any(_is_safe(levels[:i] + levels[i + 1 :]) for i in range(len(levels)))
+            for levels in reports
+        ),
+    }
+
+
+@generator(2024, 3)
+def day03(rng: np.random.Generator, scale: int) -> str:
+    pieces = []
+    for _ in range(count(4, scale)):
+        x, y = rng.integers(1, 1000, 2).tolist()
+        pieces.append(f"mul({x},{y})")
+        for _ in range(int(rng.integers(0, 8))):
+            choice = rng.random()
+            if choice < 0.1:
+                pieces.append(str(rng.choice(CORRUPTED)))
+            elif choice < 0.2:
+                pieces.append(str(rng.choice(["do()", "don't()"])))
+            else:
+                pieces.append(str(rng.choice(NOISE)))
+    # Break the memory into lines a few thousand characters long like the real one
+    breaks = np.flatnonzero(rng.random(len(pieces)) < 1 / 300).tolist()
+    for i in reversed(breaks):
+        pieces.insert(i + 1, "\n")
+    return "".join(pieces) + "\n"
+
+
+@oracle(2024, 3)
+def day03_answers(text: str) -> dict[int, int]:
+    part1 = part2 = 0
+    enabled = True
+    for match in MUL_PATTERN.finditer(text):
+        if match.group(0) in ("do()", "don't()"):
+            enabled = match.group(0) == "do()"
+            continue
+        product = int(match.group(1)) * int(match.group(2))
+        part1 += product
+        part2 += product if enabled else 0
+    return {1: part1, 2: part2}
+
+
+@generator(2024, 4)
+def day04(rng: np.random.Generator, scale: int) -> str:
+    size = side(10, scale)
+    letters = np.frombuffer(b"XMAS", dtype=np.uint8)
+    grid = rng.choice(letters, (size, size))
+    return _lines(row.tobytes().decode() for row in grid)
+
+
+@oracle(2024, 4)
+def day04_answers(text: str) -> dict[int, int]:
+    grid = np.array([list(line.encode()) for line in text.split()], dtype=np.uint8)
+    rows, cols = grid.shape
+    flipped = grid[:, ::-1]
+    # Every row, column and diagonal as a string, XMAS cannot overlap itself
+    # so str.count finds them all, reading each line both ways
+    lines = [row.tobytes() for row in grid] + [col.tobytes() for col in grid.T]
+    lines += [grid.diagonal(k).tobytes() for k in range(-rows + 1, cols)]
+    lines += [flipped.diagonal(k).tobytes() for k in range(-rows + 1, cols)]
+    part1 = sum(line.count(b"XMAS") + line.count(b"SAMX") for line in lines)
+    m, a, s = (ord(c) for c in "MAS")
+
+    def mas(one: np.ndarray, other: np.ndarray) -> np.ndarray:
+        return ((one == m) & (other == s)) | ((one == s) & (other == m))
+
+    crosses = (
+        (grid[1:-1, 1:-1] == a)
+        & mas(grid[:-2, :-2], grid[2:, 2:])
+        & mas(grid[:-2, 2:], grid[2:, :-2])
+    )
+    part2 = int(crosses.sum())
+    return {1: part1, 2: part2}
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: y2025.py
+Project: advent-of-code
+File Created: Sunday, 18th October 2026 12:00:21 am
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Sunday, 18th October 2026 12:00:21 am
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Generators and oracles for the 2025 puzzles.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+import math
+
+import numpy as np
+
+from . import count, generator, oracle, side
+
+
+def _lines(rows) -> str:
+    return "\n".join(rows) + "\n"
+
+
+@generator(2025, 1)
+def day01(rng: np.random.Generator, scale: int) -> str:
+    # Mostly less than a full turn, with some that go round a few times
+    n = count(10, scale)
+    amounts = np.where(
+        rng.random(n) < 0.7, rng.integers(1, 100, n), rng.integers(100, 1000, n)
+    )
+    directions = rng.choice(np.array(["L", "R"]), n)
+    return _lines(f"{d}{a}" for d, a in zip(directions, amounts.tolist()))
+
+
+@oracle(2025, 1)
+def day01_answers(text: str) -> dict[int, int]:
+    lines = text.split()
+    amounts = np.array([int(line[1:]) for line in lines], dtype=np.int64)
+    right = np.array([line[0] == "R" for line in lines])
+    after = (50 + np.cumsum(np.where(right, amounts, -amounts))) % 100
+    before = np.concatenate(([50], after[:-1]))
+    # Count the clicks landing on 0, turning left from p that is clicks p,
+    # p + 100, ... and from 0 itself only every full turn
+    left_passes = np.where(
+        before == 0,
+        amounts // 100,
+        np.where(amounts >= before, (amounts - before) // 100 + 1, 0),
+    )
+    passes = np.where(right, (before + amounts) // 100, left_passes)
+    return {1: int((after == 0).sum()), 2: int(passes.sum())}
+
+
+@generator(2025, 2)
+def day02(rng: np.random.Generator, scale: int) -> str:
+    n = count(11, scale)
+    digits = rng.integers(1, 11, n)
+    starts = [int(rng.integers(10 ** (d - 1), 10**d)) for d in digits.tolist()]
+    widths = [int(rng.integers(0, 10 ** min(d - 1, 5) + 1)) for d in digits.tolist()]
+    # The ranges never overlap in the real inputs
+    ranges = []
+    previous_end = 0
+    for start, width in sorted(zip(starts, widths)):
+        start = max(start, previous_end + 1)
+        end = max(start + width, previous_end + 1)
+        ranges.append(f"{start}-{end}")
+        previous_end = end
+    return ",".join(ranges[i] for i in rng.permutation(len(ranges)))
+
+
+def _repeated_ids(start: int, end: int, halves_only: bool) -> set[int]:
+    """
+    Every id in the range made of a block of digits repeated, found by trying
+    every block that fits rather than every id.
+    """
+    found = set()
+    for length in range(len(str(start)), len(str(end)) + 1):
+        for size in range(1, length // 2 + 1):
+            if length % size or (halves_only and size * 2 != length):
+                continue
+            # e.g. 1010101 for a block of 2 repeated 4 times
+            repeat = int(("0" * (size - 1) + "1") * (length // size))
+            low = max(10 ** (size - 1), -(-start // repeat))
+            high = min(10**size - 1, end // repeat)
+            found.update(block * repeat for block in range(low, high + 1))
+    return found
+
+
+@oracle(2025, 2)
+def day02_answers(text: str) -> dict[int, int]:
+    ranges = [tuple(map(int, r.split("-"))) for r in text.strip().split(",")]
+    return {
+        1: sum(sum(_repeated_ids(a, b, halves_only=True)) for a, b in ranges),
+        2: sum(sum(_repeated_ids(a, b, halves_only=False)) for a, b in ranges),
+    }
+
+
+@generator(2025, 3)
+def day03(rng: np.random.Generator, scale: int) -> str:
+    # Banks as long as the real ones, 100 batteries rated 1 to 9
+    banks = rng.integers(1, 10, (count(4, scale), 100), dtype=np.uint8) + ord("0")
+    return _lines(row.tobytes().decode() for row in banks)
+
+
+def _joltage(bank: str, batteries: int) -> int:
+    digits = []
+    start = 0
+    for remaining in range(batteries, 0, -1):
+        window = bank[start : len(bank) - remaining + 1]
+        best = max(window)
+        start += window.index(best) + 1
+        digits.append(best)
+    return int("".join(digits))
+
+
+@oracle(2025, 3)
+def day03_answers(text: str) -> dict[int, int]:
+    banks = text.split()
+    return {
+        1: sum(_joltage(bank, 2) for bank in banks),
+        2: sum(_joltage(bank, 12) for bank in banks),
+    }
+
+
+@generator(2025, 4)
+def day04(rng: np.random.Generator, scale: int) -> str:
+    size = side(10, scale)
+    grid = np.where(rng.random((size, size)) < 0.65, ord("@"), ord(".")).astype(
+        np.uint8
+    )
+    return _lines(row.tobytes().decode() for row in grid)
+
+
+def _neighbour_counts(rolls: np.ndarray) -> np.ndarray:
+    padded = np.pad(rolls.astype(np.int8), 1)
+    rows, cols = rolls.shape
+    return sum(
+        padded[1 + i : 1 + i + rows, 1 + j : 1 + j + cols]
+        for i in (-1, 0, 1)
+        for j in (-1, 0, 1)
+        if i or j
+    )
+
+
+@oracle(2025, 4)
+def day04_answers(text: str) -> dict[int, int]:
+    rolls = np.array([list(line) for line in text.split()]) == "@"
+    accessible = rolls & (_neighbour_counts(rolls) < 4)
+    part1 = int(accessible.sum())
+    # Removing rolls only ever frees more up, so taking away everything that
+    # is accessible each round ends in the same place as one at a time
+    remaining = rolls.copy()
+    while accessible.any():
+        remaining &= ~accessible
+        accessible = remaining & (_neighbour_counts(remaining) < 4)
+    return {1: part1, 2: int(rolls.sum() - remaining.sum())}
+
+
+@generator(2025, 5)
+def day05(rng: np.random.Generator, scale: int) -> str:
+    n_ranges, n_ids = count(4, scale), count(6, scale)
+    starts = rng.integers(1, 500_000_000_000_000, n_ranges)
+    widths = (10 ** rng.uniform(0, 13, n_ranges)).astype(np.int64)
+    # Half of the ids are picked from inside a range so plenty are fresh
+    inside = rng.integers(0, n_ranges, n_ids)
+    ids = np.where(
+        rng.random(n_ids) < 0.5,
+        starts[inside] + (rng.random(n_ids) * (widths[inside] + 1)).astype(np.int64),
+        rng.integers(1, 500_000_000_000_000, n_ids),
+    )
+    return (
+        _lines(f"{a}-{a + w}" for a, w in zip(starts.tolist(), widths.tolist()))
+        + "\n"
+        + _lines(map(str, ids.tolist()))
+    )
+
+
+@oracle(2025, 5)
+def day05_answers(text: str) -> dict[int, int]:
+    fresh, available = text.strip().split("\n\n")
+    merged: list[list[int]] = []
+    for start, end in sorted(tuple(map(int, r.split("-"))) for r in fresh.split()):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    starts = [start for start, _ in merged]
+    part1 = 0
+    for ingredient in map(int, available.split()):
+        i = bisect_right(starts, ingredient) - 1
+        part1 += i >= 0 and ingredient <= merged[i][1]
+    return {1: part1, 2: sum(end - start + 1 for start, end in merged)}
+
+
+@generator(2025, 6)
+def day06(rng: np.random.Generator, scale: int) -> str:
+    # Four rows of up to four digit numbers like the real worksheet, each
+    # problem lines its numbers up on either the left or the right. The lengths
+    # rise and then fall down the rows so the digits of every column touch
+    rows: list[list[str]] = [[] for _ in range(5)]
+    for _ in range(count(4, scale)):
+        ordered = np.sort(rng.integers(1, 5, 4))
+        rising = rng.random(4) < 0.5
+        lengths = np.concatenate((ordered[rising], ordered[~rising][::-1]))
+        width = int(lengths.max())
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, length in zip(rows, lengths.tolist()):
+            number = str(int(rng.integers(10 ** (length - 1), 10**length)))
+            row.append(align(number, width))
+        rows[-1].append(str(rng.choice(["+", "*"])).ljust(width))
+    return _lines(" ".join(row) for row in rows)
+
+
+@oracle(2025, 6)
+def day06_answers(text: str) -> dict[int, int]:
+    *rows, operators = text.rstrip("\n").split("\n")
+    part1 = part2 = 0
+    starts = [i for i, c in enumerate(operators) if c != " "]
+    for start, end in zip(starts, starts[1:] + [len(operators) + 1]):
+        block = [row[start : end - 1] for row in rows]
+        by_row = [int(number) for number in block]
+        by_column = [
+            int("".join(row[col] for row in block).strip())
+            for col in range(end - 1 - start)
+        ]
+        reduce = sum if operators[start] == "+" else math.prod
+        part1 += reduce(by_row)
+        part2 += reduce(by_column)
+    return {1: part1, 2: part2}
+
+
+@generator(2025, 7)
+def day07(rng: np.random.Generator, scale: int) -> str:
+    # Like the example, the splitter rows fan out from S in a triangle so a
+    # beam never leaves the manifold
+    levels = side(7, scale)
+    width = 2 * levels + 1
+    rows = [bytearray(b"." * width) for _ in range(2 * levels + 2)]
+    rows[0][levels] = ord("S")
+    for level in range(1, levels + 1):
+        columns = np.arange(levels - level + 1, levels + level, 2)
+        # The first splitter is always there or the beam never splits
+        placed = (rng.random(len(columns)) < 0.6) | (level == 1)
+        for col in columns[placed].tolist():
+            rows[2 * level][col] = ord("^")
+    return _lines(row.decode() for row in rows)
+
+
+@oracle(2025, 7)
+def day07_answers(text: str) -> dict[int, int]:
+    rows = text.split()
+    beams = {rows[0].index("S"): 1}
+    splits = 0
+    for row in rows[1:]:
+        following: dict[int, int] = defaultdict(int)
+        for col, timelines in beams.items():
+            if row[col] == "^":
+                splits += 1
+                following[col - 1] += timelines
+                following[col + 1] += timelines
+            else:
+                following[col] += timelines
+        beams = following
+    return {1: splits, 2: sum(beams.values())}
+
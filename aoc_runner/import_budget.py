@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: import_budget.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 6:03:37 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 6:03:37 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Importing a solution should only define functions, a batch run imports every
+module so anything done at import time (opening log files, reading inputs,
+loading the scraper config) is paid for over and over. This measures the import
+time of every solution module in a clean interpreter and checks that no log
+file was opened while doing so.
+
+Third party packages are imported before the clock starts as numpy alone takes
+longer than the whole budget, that is not something the solutions can fix.
+
+    python -m aoc_runner.import_budget
+"""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+try:
+    from .registry import REPO_ROOT, discover
+except (ImportError, ValueError):
+    from registry import REPO_ROOT, discover
+
+IMPORT_BUDGET_SECONDS = 0.05
+PRELOADED_PACKAGES = ("numpy", "logging", "re", "ast", "enum", "collections")
+
+_MEASURE_SCRIPT = """
+import importlib, json, logging, sys, time
+sys.path.insert(0, {repo_root!r})
+for package in {preload!r}:
+    try:
+        importlib.import_module(package)
+    except ImportError:
+        pass
+from aoc_runner.runner import load_module
+
+results = {{}}
+for path in {paths!r}:
+    start = time.perf_counter()
+    try:
+        load_module(path)
+        error = None
+    except BaseException as e:
+        error = f"{{type(e).__name__}}: {{e}}"
+    seconds = time.perf_counter() - start
+    open_logs = [
+        h.baseFilename
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+        for h in logger.handlers
+        if isinstance(h, logging.FileHandler) and h.stream is not None
+    ]
+    results[path] = {{"seconds": seconds, "error": error, "open_logs": open_logs}}
+print(json.dumps(results))
+"""
+
+
+def measure_imports(paths: list[Path] | None = None) -> dict[str, dict]:
+    """
+    Import each solution module in a fresh interpreter and time it.
+
+    Parameters
+    ----------
+    paths : list[Path] | None, optional
+        The modules to import, by default every discovered solution file.
+
+    Returns
+    -------
+    dict[str, dict]
+        Keyed by path, with the import "seconds", any import "error" and the
+        log files left "open_logs" after the import.
+    """
+    if paths is None:
+        paths = sorted({spec.path for spec in discover()})
+    script = _MEASURE_SCRIPT.format(
+        repo_root=str(REPO_ROOT),
+        preload=PRELOADED_PACKAGES,
+        paths=[str(p) for p in paths],
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def over_budget(
+    results: dict[str, dict], budget: float = IMPORT_BUDGET_SECONDS
+) -> list[str]:
+    """
+    List the modules that failed to import, went over the time budget or
+    opened a log file while importing.
+    """
+    return [
+        path
+        for path, result in results.items()
+        if result["error"] or result["open_logs"] or result["seconds"] > budget
+    ]
+
+
+if __name__ == "__main__":
+    results = measure_imports()
+    for path, result in results.items():
+        status = result["error"] or ", ".join(result["open_logs"]) or "ok"
+        print(
+            f"{result['seconds'] * 1000:8.2f} ms  {Path(path).relative_to(REPO_ROOT)}  {status}"
+        )
+    failures = over_budget(results)
+    print(
+        f"{len(failures)} of {len(results)} modules over the "
+        f"{IMPORT_BUDGET_SECONDS * 1000:.0f} ms import budget"
+    )
+    raise SystemExit(1 if failures else 0)
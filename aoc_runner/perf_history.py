@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: perf_history.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 11:59:40 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 11:59:40 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+A record of how fast every solution has run over time, so an "optimisation"
+that quietly slows a day down gets noticed. Each benchmark run is appended to a
+small sqlite database (next to the answer cache) along with the git commit, the
+python version and the hash of the input it ran on.
+
+Regressions are found by comparing the latest median of every solution with a
+baseline, either the run before it or the latest run at a given commit. Only
+timings on the same input are compared, so a new input never looks like a
+regression.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import platform
+import sqlite3
+import subprocess
+import time
+
+try:
+    from .answer_cache import input_hash
+    from .benchmark import BenchmarkResult
+    from .registry import REPO_ROOT
+except (ImportError, ValueError):
+    from answer_cache import input_hash
+    from benchmark import BenchmarkResult
+    from registry import REPO_ROOT
+
+DEFAULT_HISTORY_FILE: Path = REPO_ROOT / ".aoc_cache" / "benchmarks.sqlite3"
+DEFAULT_THRESHOLD = 0.1
+
+
+def git_commit(repo: Path = REPO_ROOT) -> str | None:
+    """
+    The current commit, with "-dirty" added if there are uncommitted changes,
+    or None outside a git checkout.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + "-dirty" if status else commit
+
+
+def resolve_commit(ref: str, repo: Path = REPO_ROOT) -> str:
+    """
+    Turn a branch, tag or short hash into the full commit hash, anything git
+    does not know is returned as it is.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ref
+
+
+@dataclass(frozen=True)
+class Regression:
+    """
+    A solution whose median time has gone up by more than the threshold.
+
+    Attributes
+    ----------
+    key : str
+        The solution key, year/day/part/implementation.
+    baseline : float
+        The baseline median in seconds.
+    current : float
+        The latest median in seconds.
+    baseline_commit : str | None
+        The commit the baseline was measured at.
+    current_commit : str | None
+        The commit the latest timing was measured at.
+    """
+
+    key: str
+    baseline: float
+    current: float
+    baseline_commit: str | None
+    current_commit: str | None
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+class PerformanceHistory:
+    """
+    An append only store of benchmark runs backed by sqlite.
+
+    Parameters
+    ----------
+    history_file : Path, optional
+        The database file, created along with its folder if it is missing.
+    """
+
+    def __init__(self, history_file: Path = DEFAULT_HISTORY_FILE):
+        self.history_file = Path(history_file)
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.history_file)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created REAL NOT NULL,
+                git_commit TEXT,
+                python_version TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS timings (
+                run_id INTEGER NOT NULL REFERENCES runs(id),
+                key TEXT NOT NULL,
+                input_hash TEXT NOT NULL,
+                rounds INTEGER NOT NULL,
+                min REAL NOT NULL,
+                median REAL NOT NULL,
+                p95 REAL NOT NULL,
+                answer TEXT
+            );
+            CREATE INDEX IF NOT EXISTS timings_key ON timings (key, input_hash);
+            """
+        )
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def record(
+        self,
+        results: list[BenchmarkResult],
+        use_examples: bool = False,
+        commit: str | None = None,
+        python_version: str | None = None,
+    ) -> int:
+        """
+        Append a benchmark run, only the results with timings are stored.
+
+        Parameters
+        ----------
+        results : list[BenchmarkResult]
+            The results from run_benchmarks.
+        use_examples : bool, optional
+            Whether the benchmarks ran on the worked examples, by default False
+        commit : str | None, optional
+            The git commit, by default the current checkout.
+        python_version : str | None, optional
+            The python version, by default this interpreter.
+
+        Returns
+        -------
+        int
+            The id of the new run.
+        """
+        cursor = self._connection.execute(
+            "INSERT INTO runs (created, git_commit, python_version) VALUES (?, ?, ?)",
+            (
+                time.time(),
+                git_commit() if commit is None else commit,
+                python_version or platform.python_version(),
+            ),
+        )
+        run_id = cursor.lastrowid
+        self._connection.executemany(
+            "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    run_id,
+                    r.spec.key,
+                    input_hash(r.spec, use_examples),
+                    r.stats.rounds,
+                    r.stats.min,
+                    r.stats.median,
+                    r.stats.p95,
+                    r.answer,
+                )
+                for r in results
+                if r.stats is not None
+            ],
+        )
+        self._connection.commit()
+        return run_id
+
+    def timeline(self, key: str) -> list[tuple[float, str | None, float]]:
+        """
+        Every recorded (time, commit, median) for a solution, oldest first.
+        """
+        return self._connection.execute(
+            """
+            SELECT runs.created, runs.git_commit, timings.median
+            FROM timings JOIN runs ON runs.id = timings.run_id
+            WHERE timings.key = ?
+            ORDER BY runs.id
+            """,
+            (key,),
+        ).fetchall()
+
+    def regressions(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        baseline: str | None = None,
+        run_id: int | None = None,
+    ) -> list[Regression]:
+        """
+        Find the solutions timed in a run whose median is slower than the
+        baseline by more than the threshold.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            The allowed slow down as a fraction, by default 0.1 (10%)
+        baseline : str | None, optional
+            A commit (or the start of one) to compare against, see
+            resolve_commit for branch names. By default each
+            solution is compared with the run before.
+        run_id : int | None, optional
+            The run to check, as returned by record, by default the latest.
+            Only the solutions timed in it are checked, so a regression in an
+            older run is not reported again.
+
+        Returns
+        -------
+        list[Regression]
+            The regressions, worst first.
+        """
+        if run_id is None:
+            (run_id,) = self._connection.execute("SELECT MAX(id) FROM runs").fetchone()
+            if run_id is None:
+                return []
+        rows = self._connection.execute(
+            """
+            SELECT timings.key, timings.input_hash, timings.median, runs.git_commit,
+                runs.id
+            FROM timings JOIN runs ON runs.id = timings.run_id
+            WHERE runs.id <= ?
+            ORDER BY runs.id
+            """,
+            (run_id,),
+        ).fetchall()
+        history: dict[tuple[str, str], list[tuple[float, str | None]]] = {}
+        current: dict[tuple[str, str], tuple[float, str | None]] = {}
+        for key, input_sha, median, commit, timing_run in rows:
+            if timing_run == run_id:
+                current[(key, input_sha)] = (median, commit)
+            else:
+                history.setdefault((key, input_sha), []).append((median, commit))
+
+        regressions = []
+        for (key, input_sha), (median, current_commit) in current.items():
+            earlier = history.get((key, input_sha), [])
+            if baseline is not None:
+                earlier = [
+                    t for t in earlier if t[1] is not None and t[1].startswith(baseline)
+                ]
+            if not earlier:
+                continue
+            baseline_median, baseline_commit = earlier[-1]
+            if median > baseline_median * (1 + threshold):
+                regressions.append(
+                    Regression(
+                        key, baseline_median, median, baseline_commit, current_commit
+                    )
+                )
+        return sorted(regressions, key=lambda r: r.ratio, reverse=True)
+
+
+def format_regressions(regressions: list[Regression], threshold: float) -> str:
+    """
+    Build a plain text report of the regressions.
+    """
+    if not regressions:
+        return f"No solutions slowed down by more than {threshold:.0%}"
+    key_width = max(len(r.key) for r in regressions)
+    lines = [
+        f"{len(regressions)} solutions slowed down by more than {threshold:.0%}:",
+        f"{'solution':<{key_width}} {'baseline':>10} {'current':>10} {'change':>8}",
+    ]
+    for r in regressions:
+        lines.append(
+            f"{r.key:<{key_width}} {r.baseline:>10.6f} {r.current:>10.6f} "
+            f"{r.ratio - 1:>+8.0%}  ({(r.baseline_commit or '?')[:10]} -> "
+            f"{(r.current_commit or '?')[:10]})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: registry.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 4:02:18 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 4:02:18 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Every year has been laid out slightly differently as my habits have changed, so
+the registry has to understand all of them:
+
+    y2025/puzzle_solutions/dayNN.py          -> functions named dayNN_partN[_variant]
+    2024/puzzle_solutions/dayNN.py           -> functions named dayNN_partN[_variant]
+    2022/puzzle_solutions/dayN.py            -> scripts, both parts in one __main__
+    2020/puzzle_solutions/dayNN/problemNN.py -> scripts, one file per part
+
+The solution files are only parsed with `ast` here and never imported, so
+discovering the whole archive does not run any of their module level code.
+"""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+import re
+
+REPO_ROOT: Path = Path(__file__).resolve().parent.parent
+
+YEAR_FOLDER_PATTERN = re.compile(r"^y?(\d{4})$")
+DAY_PATTERN = re.compile(r"day(\d+)")
+PART_FUNCTION_PATTERN = re.compile(r"^day\d+_part(\d+)(?:_(\w+))?$")
+PROBLEM_PATTERN = re.compile(r"^problem(\d+)$")
+
+
+@dataclass(frozen=True, order=True)
+class SolutionSpec:
+    """
+    Everything needed to find and run a single solution, this has to stay
+    picklable as it is sent to the worker processes.
+
+    Attributes
+    ----------
+    year : int
+        The puzzle year.
+    day : int
+        The puzzle day.
+    part : int | None
+        The puzzle part, None for scripts that solve both parts in one go.
+    name : str
+        The function name, or the file stem for scripts.
+    path : Path
+        The path to the python file holding the solution.
+    kind : str
+        "function" for a callable taking the input string, or "script" for a
+        file that is executed as __main__.
+    """
+
+    year: int
+    day: int
+    part: int | None
+    name: str
+    path: Path
+    kind: str = "function"
+
+    @property
+    def key(self) -> str:
+        part = "-" if self.part is None else str(self.part)
+        return f"{self.year}/{self.day:02d}/{part}/{self.name}"
+
+    @property
+    def year_root(self) -> Path:
+        for parent in self.path.parents:
+            if parent.name == "puzzle_solutions":
+                return parent.parent
+        raise ValueError(f"{self.path} is not inside a puzzle_solutions folder.")
+
+    @property
+    def input_path(self) -> Path | None:
+        """
+        The input file for this day, the older years did not zero pad the file
+        names so both are checked.
+        """
+        inputs = self.year_root / "inputs"
+        for file_name in (f"day{self.day:02d}.txt", f"day{self.day}.txt"):
+            if (inputs / file_name).exists():
+                return inputs / file_name
+        return None
+
+
+def _has_main_block(tree: ast.Module) -> bool:
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name)
+            and node.test.left.id == "__name__"
+        ):
+            return True
+    return False
+
+
+def _specs_for_file(year: int, path: Path) -> list[SolutionSpec]:
+    day_match = DAY_PATTERN.search(path.stem) or DAY_PATTERN.search(path.parent.name)
+    if not day_match:
+        return []
+    day = int(day_match.group(1))
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    # I have not always got the day number right in the function names (see
+    # y2025 day04 `day00_part2`), so the day always comes from the file name
+    specs = [
+        SolutionSpec(year, day, int(match.group(1)), node.name, path)
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef)
+        and (match := PART_FUNCTION_PATTERN.match(node.name))
+    ]
+    if specs:
+        return specs
+    problem_match = PROBLEM_PATTERN.match(path.stem)
+    if problem_match:
+        return [
+            SolutionSpec(
+                year, day, int(problem_match.group(1)), path.stem, path, kind="script"
+            )
+        ]
+    if _has_main_block(tree):
+        return [SolutionSpec(year, day, None, path.stem, path, kind="script")]
+    return []
+
+
+def discover(root: Path | None = None) -> list[SolutionSpec]:
+    """
+    Find every solution in the repository.
+
+    Parameters
+    ----------
+    root : Path | None, optional
+        The repository root, by default the folder containing this package.
+
+    Returns
+    -------
+    list[SolutionSpec]
+        All discovered solutions, sorted by year, day, part and name.
+    """
+    root = Path(root) if root else REPO_ROOT
+    specs: list[SolutionSpec] = []
+    for year_folder in sorted(root.iterdir()):
+        year_match = YEAR_FOLDER_PATTERN.match(year_folder.name)
+        solutions_folder = year_folder / "puzzle_solutions"
+        if not year_match or not solutions_folder.is_dir():
+            continue
+        year = int(year_match.group(1))
+        for path in sorted(solutions_folder.glob("**/*.py")):
+            specs.extend(_specs_for_file(year, path))
+    return sorted(specs, key=lambda s: (s.year, s.day, s.part or 0, s.name))
+
+
+def select(
+    specs: list[SolutionSpec],
+    years: list[int] | None = None,
+    days: list[int] | None = None,
+    parts: list[int] | None = None,
+    name: str | None = None,
+) -> list[SolutionSpec]:
+    """
+    Filter the discovered solutions, any filter left as None matches everything.
+
+    Parameters
+    ----------
+    specs : list[SolutionSpec]
+        The solutions to filter.
+    years : list[int] | None, optional
+        The years to keep.
+    days : list[int] | None, optional
+        The days to keep.
+    parts : list[int] | None, optional
+        The parts to keep, scripts solving both parts are always kept.
+    name : str | None, optional
+        A regex that must match somewhere in the solution name.
+
+    Returns
+    -------
+    list[SolutionSpec]
+        The matching solutions.
+    """
+    name_pattern = re.compile(name) if name else None
+    return [
+        s
+        for s in specs
+        if (not years or s.year in years)
+        and (not days or s.day in days)
+        and (not parts or s.part is None or s.part in parts)
+        and (not name_pattern or name_pattern.search(s.name))
+    ]
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: runner.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 4:31:52 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 4:31:52 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+Runs any selection of registered solutions across a process pool. The days are
+independent CPU bound jobs so they spread nicely across the cores, the report
+shows the sum of the individual timings alongside the wall clock time.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+from dataclasses import dataclass
+import importlib
+import importlib.util
+import io
+import os
+from pathlib import Path
+import runpy
+import sys
+import time
+
+try:
+    from .answer_cache import AnswerCache, cache_key
+    from .registry import REPO_ROOT, SolutionSpec
+except (ImportError, ValueError):
+    from answer_cache import AnswerCache, cache_key
+    from registry import REPO_ROOT, SolutionSpec
+
+
+@dataclass
+class SolutionResult:
+    """
+    The outcome of running a single solution.
+
+    Attributes
+    ----------
+    spec : SolutionSpec
+        The solution that was run.
+    status : str
+        "ok", "cached", "error" or "skipped".
+    answer : str | None
+        The returned answer, or the last line printed for scripts.
+    seconds : float
+        The time spent running the solution, excluding the import. For cached
+        answers this is the time the original run took.
+    error : str | None
+        The error message if the solution failed or was skipped.
+    """
+
+    spec: SolutionSpec
+    status: str
+    answer: str | None = None
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def load_module(path: Path):
+    """
+    Import a solution module from its path.
+
+    Files inside a package (y2025) are imported by their dotted name so the
+    relative imports work, anything else is loaded by file location with its
+    folder on sys.path for the `from common_utils import ...` style imports.
+    """
+    path = Path(path).resolve()
+    package_root = path.parent
+    while (package_root / "__init__.py").exists():
+        package_root = package_root.parent
+    if package_root != path.parent:
+        if str(package_root) not in sys.path:
+            sys.path.insert(0, str(package_root))
+        dotted_name = ".".join(path.relative_to(package_root).with_suffix("").parts)
+        return importlib.import_module(dotted_name)
+
+    relative = path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+    module_name = "_aoc_" + "_".join(
+        part for part in relative.with_suffix("").parts if part != relative.anchor
+    )
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    module_spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[module_name] = module
+    try:
+        module_spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def _last_line(text: str) -> str | None:
+    lines = [line for line in text.splitlines() if line.strip()]
+    return lines[-1].strip() if lines else None
+
+
+def execute(spec: SolutionSpec, use_examples: bool = False) -> SolutionResult:
+    """
+    Run a single solution, this is the function sent to the worker processes.
+
+    Parameters
+    ----------
+    spec : SolutionSpec
+        The solution to run.
+    use_examples : bool, optional
+        Call function solutions without arguments so they run on their worked
+        example default, by default False
+
+    Returns
+    -------
+    SolutionResult
+        The answer and timing, errors are captured rather than raised so one
+        broken day does not stop the rest of the run.
+    """
+    # The older years open their inputs relative to the working directory
+    previous_cwd = os.getcwd()
+    stdout = io.StringIO()
+    try:
+        os.chdir(spec.year_root)
+        with contextlib.redirect_stdout(stdout):
+            if spec.kind == "script":
+                if str(spec.path.parent) not in sys.path:
+                    sys.path.insert(0, str(spec.path.parent))
+                start = time.perf_counter()
+                runpy.run_path(str(spec.path), run_name="__main__")
+                seconds = time.perf_counter() - start
+                return SolutionResult(spec, "ok", _last_line(stdout.getvalue()), seconds)
+
+            args = ()
+            if not use_examples:
+                if spec.input_path is None:
+                    return SolutionResult(
+                        spec, "skipped", error=f"No input file for day {spec.day}"
+                    )
+                args = (spec.input_path.read_text(),)
+            solution = getattr(load_module(spec.path), spec.name)
+            start = time.perf_counter()
+            answer = solution(*args)
+            seconds = time.perf_counter() - start
+            return SolutionResult(spec, "ok", str(answer), seconds)
+    except BaseException as e:  # SystemExit from the older scripts too
+        if isinstance(e, KeyboardInterrupt):
+            raise
+        return SolutionResult(spec, "error", error=f"{type(e).__name__}: {e}")
+    finally:
+        os.chdir(previous_cwd)
+
+
+def run_solutions(
+    specs: list[SolutionSpec],
+    max_workers: int | None = None,
+    use_examples: bool = False,
+    cache: AnswerCache | None = None,
+) -> list[SolutionResult]:
+    """
+    Run the given solutions across a process pool.
+
+    Parameters
+    ----------
+    specs : list[SolutionSpec]
+        The solutions to run.
+    max_workers : int | None, optional
+        The size of the process pool, by default one per CPU. A value of 1 runs
+        everything in this process which is handy when debugging.
+    use_examples : bool, optional
+        Run the worked examples instead of the real inputs, by default False
+    cache : AnswerCache | None, optional
+        Answers already in the cache are returned without running anything and
+        new answers are stored, by default no caching.
+
+    Returns
+    -------
+    list[SolutionResult]
+        The results in the same order as `specs`.
+    """
+    results: list[SolutionResult | None] = [None] * len(specs)
+    keys: list[str | None] = [None] * len(specs)
+    if cache is not None:
+        for i, spec in enumerate(specs):
+            keys[i] = cache_key(spec, use_examples)
+            hit = cache.get(keys[i])
+            if hit is not None:
+                answer, seconds = hit
+                results[i] = SolutionResult(spec, "cached", answer, seconds)
+    to_run = [i for i, result in enumerate(results) if result is None]
+
+    if max_workers == 1:
+        for i in to_run:
+            results[i] = execute(specs[i], use_examples)
+    elif to_run:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                i: executor.submit(execute, specs[i], use_examples) for i in to_run
+            }
+            for i, future in futures.items():
+                results[i] = future.result()
+
+    if cache is not None:
+        for i in to_run:
+            if results[i].status == "ok" and results[i].answer is not None:
+                cache.put(keys[i], specs[i].key, results[i].answer, results[i].seconds)
+    return results
+
+
+def format_report(results: list[SolutionResult], wall_time: float | None = None) -> str:
+    """
+    Build a plain text table of the answers and timings.
+
+    Parameters
+    ----------
+    results : list[SolutionResult]
+        The results to report.
+    wall_time : float | None, optional
+        The wall clock time of the whole run, added to the summary when given.
+
+    Returns
+    -------
+    str
+        The report.
+    """
+    name_width = max([len(r.spec.name) for r in results] + [4])
+    header = f"{'year':>4} {'day':>3} {'part':>4} {'name':<{name_width}} {'status':<7} {'seconds':>9}  answer"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        part = "-" if r.spec.part is None else str(r.spec.part)
+        answer = r.answer if r.status == "ok" else r.error
+        lines.append(
+            f"{r.spec.year:>4} {r.spec.day:>3} {part:>4} {r.spec.name:<{name_width}} "
+            f"{r.status:<7} {r.seconds:>9.4f}  {answer}"
+        )
+    total = sum(r.seconds for r in results)
+    counts = {
+        status: sum(r.status == status for r in results)
+        for status in ("ok", "cached", "error", "skipped")
+    }
+    summary = (
+        f"{len(results)} solutions: {counts['ok']} ok, {counts['cached']} cached, "
+        f"{counts['error']} errors, "
+        f"{counts['skipped']} skipped. Solve time {total:.4f} seconds"
+    )
+    if wall_time is not None:
+        summary += f", wall time {wall_time:.4f} seconds"
+    lines.extend(["-" * len(header), summary])
+    return "\n".join(lines)
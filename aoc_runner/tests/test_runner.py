@@ -0,0 +1,351 @@
+import io
+import logging
+import unittest
+import sys
+import os
+from contextlib import redirect_stdout
+from pathlib import Path
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from aoc_runner.__main__ import main
+from aoc_runner.answer_cache import AnswerCache, cache_key
+from aoc_runner.benchmark import (
+    Benchmark,
+    BenchmarkResult,
+    BenchmarkStats,
+    compare,
+    format_comparison,
+    run_benchmarks,
+)
+from aoc_runner.generators import GENERATORS, ORACLES, available, generate
+from aoc_runner.generators.__main__ import mismatches
+from aoc_runner.import_budget import measure_imports, over_budget
+from aoc_runner.perf_history import PerformanceHistory
+from aoc_runner.registry import discover, select
+from aoc_runner.runner import execute, format_report, load_module, run_solutions
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.specs = discover()
+
+    def test_discovers_every_year(self):
+        self.assertTrue({2020, 2022, 2024, 2025} <= {s.year for s in self.specs})
+
+    def test_function_variants_registered(self):
+        names = {s.name for s in select(self.specs, years=[2025], days=[1])}
+        self.assertIn("day01_part1_for_loop_method", names)
+        self.assertIn("day01_part1_vectorized", names)
+        self.assertIn("day01_part2_for_loop_method", names)
+
+    def test_day_comes_from_file_name(self):
+        # day04 part 2 is misnamed day00_part2
+        (spec,) = select(
+            self.specs, years=[2025], days=[4], parts=[2], name="day00_part2"
+        )
+        self.assertEqual(spec.name, "day00_part2")
+        self.assertEqual(spec.day, 4)
+
+    def test_2020_scripts_have_parts(self):
+        parts = [s.part for s in select(self.specs, years=[2020], days=[7])]
+        self.assertEqual(parts, [1, 2])
+        self.assertTrue(all(s.kind == "script" for s in self.specs if s.year == 2020))
+
+    def test_select_by_name(self):
+        specs = select(self.specs, years=[2025], name="vectorized")
+        self.assertTrue(specs)
+        self.assertTrue(all("vectorized" in s.name for s in specs))
+
+
+class TestRunner(unittest.TestCase):
+    def test_examples_in_process(self):
+        specs = select(discover(), years=[2025], days=[2])
+        results = run_solutions(specs, max_workers=1, use_examples=True)
+        self.assertEqual(
+            [r.answer for r in results],
+            ["1227775554", "1227775554", "4174379265", "4174379265"],
+        )
+
+    def test_examples_in_process_pool(self):
+        specs = select(discover(), years=[2024, 2025], days=[1])
+        results = run_solutions(specs, max_workers=2, use_examples=True)
+        self.assertEqual([r.spec for r in results], specs)
+        self.assertTrue(all(r.status == "ok" for r in results))
+        self.assertIn("solutions:", format_report(results, wall_time=1.0))
+
+    def test_errors_are_captured(self):
+        (spec,) = select(
+            discover(), years=[2025], days=[3], parts=[1], name="day03_part1$"
+        )
+        broken = spec.__class__(
+            spec.year, spec.day, spec.part, "day03_missing", spec.path
+        )
+        result = execute(broken, use_examples=True)
+        self.assertEqual(result.status, "error")
+        self.assertIn("AttributeError", result.error)
+
+    def test_each_year_logs_to_its_own_folder(self):
+        for spec in select(discover(), years=[2024, 2025], days=[1], parts=[1]):
+            logger = load_module(spec.path).LOGGER
+            (log_file,) = [
+                Path(handler.baseFilename)
+                for handler in logger.handlers
+                if isinstance(handler, logging.FileHandler)
+            ]
+            self.assertEqual(log_file.parent, spec.year_root / "logs")
+
+
+SOLUTION_TEMPLATE = """
+def helper(x):
+    return x
+
+
+def day01_part1(input_str="1"):
+    return {part1}
+
+
+def day01_part2(input_str="1"):
+    return {part2}
+"""
+
+
+class TestAnswerCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "y2099" / "puzzle_solutions").mkdir(parents=True)
+        (self.root / "y2099" / "inputs").mkdir()
+        self.solution = self.root / "y2099" / "puzzle_solutions" / "day01.py"
+        self.input = self.root / "y2099" / "inputs" / "day01.txt"
+        self.write_solution("helper(1)", "2")
+        self.input.write_text("1 2 3")
+        self.cache = AnswerCache(self.root / "cache.sqlite3")
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def write_solution(self, part1, part2, comment=""):
+        self.solution.write_text(
+            comment + SOLUTION_TEMPLATE.format(part1=part1, part2=part2)
+        )
+
+    def keys(self):
+        return [cache_key(spec) for spec in discover(self.root)]
+
+    def test_repeat_run_is_cached(self):
+        specs = discover(self.root)
+        first = run_solutions(specs, max_workers=1, cache=self.cache)
+        second = run_solutions(specs, max_workers=1, cache=self.cache)
+        self.assertEqual([r.status for r in first], ["ok", "ok"])
+        self.assertEqual([r.status for r in second], ["cached", "cached"])
+        self.assertEqual([r.answer for r in second], ["1", "2"])
+
+    def test_input_change_invalidates(self):
+        before = self.keys()
+        self.input.write_text("4 5 6")
+        after = self.keys()
+        self.assertNotEqual(before[0], after[0])
+        self.assertNotEqual(before[1], after[1])
+
+    def test_code_change_invalidates_only_that_part(self):
+        before = self.keys()
+        self.write_solution("helper(1)", "3")
+        after = self.keys()
+        self.assertEqual(before[0], after[0])
+        self.assertNotEqual(before[1], after[1])
+
+    def test_shared_helper_change_invalidates_every_part(self):
+        before = self.keys()
+        self.solution.write_text(
+            SOLUTION_TEMPLATE.format(part1="helper(1)", part2="2").replace(
+                "return x", "return x + 1"
+            )
+        )
+        after = self.keys()
+        self.assertNotEqual(before, after)
+
+    def test_comments_do_not_invalidate(self):
+        before = self.keys()
+        self.write_solution("helper(1)", "2", comment="# a new comment\n")
+        self.assertEqual(before, self.keys())
+
+    def test_lru_eviction(self):
+        cache = AnswerCache(self.root / "small.sqlite3", max_entries=2)
+        cache.put("a", "a", "1", 0.1)
+        cache.put("b", "b", "2", 0.1)
+        cache.get("a")
+        cache.put("c", "c", "3", 0.1)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        cache.close()
+
+    def test_size_cap_eviction(self):
+        cache = AnswerCache(self.root / "small.sqlite3", max_bytes=10)
+        cache.put("a", "a", "x" * 6, 0.1)
+        cache.put("b", "b", "y" * 6, 0.1)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("a"))
+        cache.close()
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_stats(self):
+        stats = BenchmarkStats([4_000, 1_000, 3_000, 2_000, 100_000])
+        self.assertEqual(stats.rounds, 5)
+        self.assertEqual(stats.min, 1e-6)
+        self.assertEqual(stats.median, 3e-6)
+        self.assertEqual(stats.p95, 1e-4)
+
+    def test_rounds_and_warmup(self):
+        calls = []
+        bench = Benchmark(rounds=3, warmup=2)
+        self.assertEqual(bench(lambda x: calls.append(x) or x * 2, 21), 42)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(bench.stats.rounds, 3)
+
+    def test_decorator_is_unwrapped(self):
+        (spec,) = select(discover(), years=[2025], days=[3], name="day03_part1$")
+        solution = getattr(load_module(spec.path), spec.name)
+        self.assertEqual(solution.__name__, "day03_part1")
+        self.assertTrue(hasattr(solution, "__wrapped__"))
+
+    def test_variants_ranked(self):
+        specs = select(discover(), years=[2025], days=[1], parts=[1])
+        results = run_benchmarks(specs, rounds=2, warmup=0, use_examples=True)
+        self.assertTrue(all(r.status == "ok" for r in results))
+        (group,) = compare(results).values()
+        medians = [r.stats.median for r in group]
+        self.assertEqual(medians, sorted(medians))
+        record = results[0].to_record()
+        self.assertEqual(
+            (record["year"], record["day"], record["part"]), (2025, 1, 1)
+        )
+        self.assertEqual(record["implementation"], specs[0].name)
+        self.assertIn("p95", record)
+        self.assertIn("vs best", format_comparison(results))
+
+
+class TestPerformanceHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = PerformanceHistory(Path(self.tmp.name) / "history.sqlite3")
+        self.specs = select(discover(), years=[2025], days=[1], parts=[1])
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    def record(self, commit, *medians_ns):
+        results = [
+            BenchmarkResult(spec, "ok", "3", BenchmarkStats([median] * 3))
+            for spec, median in zip(self.specs, medians_ns)
+        ]
+        return self.history.record(results, use_examples=True, commit=commit)
+
+    def test_record(self):
+        self.record("aaa", 1000, 2000)
+        self.record("bbb", 1100, 2100)
+        self.assertEqual(len(self.history), 2)
+        timeline = self.history.timeline(self.specs[0].key)
+        self.assertEqual([(c, m) for _, c, m in timeline], [("aaa", 1e-6), ("bbb", 1.1e-6)])
+
+    def test_regression_against_previous_run(self):
+        self.record("aaa", 1000, 2000)
+        self.record("bbb", 1050, 3000)
+        (regression,) = self.history.regressions(threshold=0.1)
+        self.assertEqual(regression.key, self.specs[1].key)
+        self.assertAlmostEqual(regression.ratio, 1.5)
+        self.assertEqual(self.history.regressions(threshold=0.6), [])
+
+    def test_regression_against_baseline_commit(self):
+        self.record("aaa", 1000, 2000)
+        self.record("bbb", 1500, 2000)
+        self.record("ccc", 1500, 2000)
+        # Compared with the run before nothing changed, but since aaa it has
+        self.assertEqual(self.history.regressions(), [])
+        (regression,) = self.history.regressions(baseline="aa")
+        self.assertEqual(regression.key, self.specs[0].key)
+        self.assertEqual(regression.baseline_commit, "aaa")
+
+    def test_only_the_checked_run_is_compared(self):
+        self.record("aaa", 1000, 2000)
+        second = self.record("bbb", 1050, 3000)
+        # The third run does not time the second solution at all
+        self.record("ccc", 1050)
+        self.assertEqual(self.history.regressions(threshold=0.1), [])
+        (regression,) = self.history.regressions(threshold=0.1, run_id=second)
+        self.assertEqual(regression.key, self.specs[1].key)
+
+    def test_first_run_has_no_baseline(self):
+        self.record("aaa", 1000, 2000)
+        self.assertEqual(self.history.regressions(), [])
+
+    def test_benchmark_regressions_checks_the_new_run(self):
+        argv = ["--year", "2025", "--day", "1", "--part", "1", "--examples"]
+        argv += ["--benchmark", "--rounds", "1", "--regressions", "--threshold", "1000"]
+        argv += ["--history-file", str(self.history.history_file)]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(argv), 0)
+        # Without --record the timings still have to be kept to be compared
+        self.assertEqual(len(self.history), 1)
+
+
+class TestGenerators(unittest.TestCase):
+    def test_every_function_day_has_a_generator(self):
+        days = {(s.year, s.day) for s in discover() if s.year in (2024, 2025)}
+        self.assertTrue(days <= set(available()))
+        self.assertTrue(all(key in ORACLES for key in GENERATORS))
+
+    def test_seeded(self):
+        first = generate(2025, 5, scale=3, seed=1)
+        self.assertEqual(first.text, generate(2025, 5, scale=3, seed=1).text)
+        self.assertNotEqual(first.text, generate(2025, 5, scale=3, seed=2).text)
+        self.assertGreater(len(first.text), len(generate(2025, 5, seed=1).text))
+
+    def test_oracles_solve_the_examples(self):
+        examples = {
+            (2025, 1): ("L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82", 3, 6),
+            (2025, 5): ("3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32", 3, 14),
+            (2024, 1): ("3   4\n4   3\n2   5\n1   3\n3   9\n3   3", 11, 31),
+            (2022, 4): ("2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8", 2, 4),
+        }
+        for key, (text, part1, part2) in examples.items():
+            self.assertEqual(ORACLES[key](text), {1: part1, 2: part2})
+
+    def test_solutions_match_the_oracles(self):
+        specs = discover()
+        for year, day in available([2024, 2025]):
+            generated = generate(year, day, scale=2, seed=3)
+            results = run_benchmarks(
+                select(specs, [year], [day], name="^(?!.*brute_force)"),
+                rounds=1,
+                warmup=0,
+                input_str=generated.text,
+            )
+            self.assertTrue(all(r.status == "ok" for r in results))
+            self.assertEqual(mismatches(results, generated.answers), [])
+
+    def test_scripts_are_skipped(self):
+        specs = select(discover(), years=[2022], days=[4])
+        (result,) = run_benchmarks(specs, rounds=1, input_str="2-4,6-8")
+        self.assertEqual(result.status, "skipped")
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = generate(2022, 6, seed=4).write(tmp)
+            self.assertEqual(path, Path(tmp) / "2022" / "inputs" / "day6.txt")
+            self.assertTrue(path.with_suffix(".json").exists())
+
+
+class TestImportBudget(unittest.TestCase):
+    def test_imports_have_no_side_effects(self):
+        results = measure_imports()
+        self.assertEqual(over_budget(results), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
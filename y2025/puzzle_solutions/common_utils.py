@@ -6,7 +6,7 @@ Project: advent-of-code
 File Created: Tuesday, 2nd December 2025 9:49:46 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Saturday, 6th December 2025 2:43:53 pm
+Last Modified: Saturday, 17th October 2026 11:59:02 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
@@ -14,6 +14,7 @@ Date      	By	Comments
 ----------	---	---------------------------------------------------------
 """
 
+import functools
 import logging
 from pathlib import Path
 import time
@@ -39,13 +40,21 @@ def set_up_logger(
     logging.Logger
         The configured logger.
     """
-    LOGGER: logging.Logger = logging.getLogger(f"day{day:02d}")
+    # Prefix the year folder, both years have a day01 logger and the runner can
+    # import them into the same process
+    year = Path(__file__).resolve().parent.parent.name
+    LOGGER: logging.Logger = logging.getLogger(f"{year}.day{day:02d}")
     LOGGER.setLevel(level)
-    # Create a file handler
+    if LOGGER.handlers:
+        # Already configured, e.g. the module was imported under another name
+        return LOGGER
+    # Create a file handler, delay means the log file is not opened until the
+    # first record is written so importing a solution stays cheap
     file_handler = logging.FileHandler(
         Path(folder) / f"day{day:02d}.log"
         if folder
-        else Path(".") / "logs" / f"day{day:02d}.log"
+        else Path(".") / "logs" / f"day{day:02d}.log",
+        delay=True,
     )
     file_handler.setLevel(logging.INFO)
     stream_handler = logging.StreamHandler()
@@ -94,7 +103,9 @@ def read_day_input(day: int, folder: Path | None = None) -> str:
 
 def log_execution_time(func=None, *, logger=None):
     """
-    Decorator that logs the execution time of a function.
+    Decorator that logs the execution time of a function. This is a single
+    call, for proper timings use the benchmarks in aoc_runner.benchmark, which
+    call the undecorated function through __wrapped__.
 
     Parameters
     ----------
@@ -115,13 +126,12 @@ def log_execution_time(func=None, *, logger=None):
     if logger is None:
         logger = logging.getLogger()
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        logger.info(
-            f"Function {func.__name__} executed in {end_time - start_time:.4f} seconds"
-        )
+        seconds = (time.perf_counter_ns() - start_time) / 1e9
+        logger.info(f"Function {func.__name__} executed in {seconds:.4f} seconds")
         return result
 
     return wrapper
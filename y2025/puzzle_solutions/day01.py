@@ -6,13 +6,21 @@ Project: advent-of-code
 File Created: Tuesday, 2nd December 2025 9:49:33 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Wednesday, 3rd December 2025 11:04:54 pm
+Last Modified: Saturday, 17th October 2026 8:21:37 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
 
+17-10-2026	TD	Came back to vectorizing part 2. My (end // 100 - start // 100)
+idea was right for turns to the right, the flaw was the left turns. Turning left
+from a to b passes the multiples of 100 in [b, a - 1] rather than (a, b], so
+shifting both ends down by one before the floor division fixes it:
+(a - 1) // 100 - (b - 1) // 100. Using the unwrapped cumulative positions this is
+one np.where over the whole array. The input is read in chunks with the position
+carried between them so very long rotation logs do not have to fit in memory.
+
 03-12-2025	TD	Slow start this year, I got stuck on part 2 for a while and took
 a break between parts, but was really pleased with my solution in the end.
 I went down a bit of a rabbit hole thinking I could calculate the number of 0
@@ -36,8 +44,11 @@ that I have understood the problem, however it is computationally slow! So I
 absolutely do want to vectorize the problem ... maybe a form of np cumulative sum
 """
 
+import io
+from itertools import islice
 import logging
 from pathlib import Path
+from typing import Iterator, TextIO
 
 import numpy as np
 
@@ -170,6 +181,74 @@ def day01_part2_for_loop_method(
     return zero_count
 
 
+def rotation_chunks(
+    source: str | TextIO, chunk_lines: int = 1 << 20
+) -> Iterator[np.ndarray]:
+    """
+    Parse the rotations into int64 arrays a chunk of lines at a time, turns to
+    the left are negative.
+
+    Parameters
+    ----------
+    source : str | TextIO
+        The puzzle input, or an open file (anything yielding lines) to stream.
+    chunk_lines : int, optional
+        The number of lines parsed at once, by default 1 << 20
+
+    Yields
+    ------
+    np.ndarray
+        The signed rotations of the next chunk.
+    """
+    lines = io.StringIO(source) if isinstance(source, str) else source
+    while chunk := "".join(islice(lines, chunk_lines)):
+        moves = chunk.replace("L", "-").replace("R", "").split()
+        if moves:
+            yield np.array(moves, dtype=np.int64)
+
+
+@log_execution_time(logger=LOGGER)
+def day01_part2_vectorized(
+    input_str: str | TextIO = "L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82",
+    chunk_lines: int = 1 << 20,
+) -> int:
+    """
+    A vectorized solution to part 2 using floor division of the unwrapped
+    cumulative positions.
+
+    Parameters
+    ----------
+    input_str : str | TextIO, optional
+        Puzzle input or an open file to stream, by default "L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82"
+    chunk_lines : int, optional
+        The number of rotations held in memory at once, by default 1 << 20
+
+    Returns
+    -------
+    int
+        The number of times the dial passes 0.
+    """
+    current_position = 50
+    zero_count = 0
+    for rotations in rotation_chunks(input_str, chunk_lines):
+        ends = current_position + np.cumsum(rotations)
+        starts = np.empty_like(ends)
+        starts[0] = current_position
+        starts[1:] = ends[:-1]
+        # Right turns pass the multiples of 100 in (start, end], left turns
+        # those in [end, start - 1]
+        passes = np.where(
+            rotations > 0,
+            ends // 100 - starts // 100,
+            (starts - 1) // 100 - (ends - 1) // 100,
+        )
+        zero_count += int(passes.sum())
+        # Only the position on the dial needs carrying into the next chunk
+        current_position = int(ends[-1] % 100)
+    LOGGER.debug("Vectorized: %d zeros", zero_count)
+    return zero_count
+
+
 if __name__ == "__main__":
     expected_solution: int = day01_part1_for_loop_method()
     if expected_solution != 3:
@@ -212,3 +291,12 @@ if __name__ == "__main__":
 
     # The runetime for part 2 is fairly significant, 0.0057 seconds
     # However I struggle to see how this one can be vectorized with the logic involved
+
+    expected_solution = day01_part2_vectorized()
+    if expected_solution != 6:
+        LOGGER.error(
+            f"Problem with solution to part 2! Did not get the expected answer of 6 for the provided worked example. Instead got: {expected_solution}"
+        )
+
+    part2_solution: int = day01_part2_vectorized(input_str)
+    LOGGER.info(f"Part 2 solution: {part2_solution}")
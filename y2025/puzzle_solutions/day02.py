@@ -6,16 +6,28 @@ Project: advent-of-code
 File Created: Thursday, 4th December 2025 9:01:43 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Thursday, 4th December 2025 10:50:21 pm
+Last Modified: Saturday, 17th October 2026 7:48:10 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
+
+17-10-2026	TD	The block divisor I found for part 2 works both ways, rather than
+testing every n in a range for n % block_divisor == 0 the invalid IDs are exactly
+m * block_divisor for every k digit m. So the IDs in a range can be listed (or
+summed as an arithmetic series) straight from the bounds on m, the cost no longer
+depends on how wide the range is. Part 2 numbers can repeat with more than one
+block length (e.g. 111111 is 1, 11 and 111 repeated) so the block lengths are
+combined with inclusion-exclusion using the mobius function of L // k. The brute
+force loops are kept as the _brute_force variants to benchmark against.
 """
 
+from functools import cache
+import heapq
 import logging
 from pathlib import Path
+from typing import Iterator
 
 
 try:
@@ -29,9 +41,144 @@ LOGGER: logging.Logger = set_up_logger(
 )
 
 
+EXAMPLE = "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124"
+
+
+def parse_ranges(input_str: str) -> Iterator[tuple[int, int]]:
+    """
+    Yield the (start, end) of each comma separated range, logging and skipping
+    any that are malformed or backwards.
+    """
+    for i, rng in enumerate(input_str.split(",")):
+        try:
+            start, end = rng.split("-")
+            start, end = int(start), int(end)
+        except ValueError:
+            LOGGER.error("Invalid range format at index %d: %s", i + 1, rng)
+            continue
+        if start > end:
+            LOGGER.warning("Start greater than end in range %d: %s", i + 1, rng)
+            continue
+        yield start, end
+
+
+@cache
+def mobius(n: int) -> int:
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def block_lengths(n_digits: int, halves_only: bool = False) -> list[int]:
+    """
+    The block lengths k an n_digits long ID can be made by repeating, for part 1
+    the block has to be repeated exactly twice.
+    """
+    if halves_only:
+        return [n_digits // 2] if n_digits % 2 == 0 else []
+    return [k for k in range(1, (n_digits // 2) + 1) if n_digits % k == 0]
+
+
+def _digit_spans(start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    # Split [start, end] into pieces that share a digit count
+    for n_digits in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (n_digits - 1))
+        high = min(end, 10**n_digits - 1)
+        if low <= high:
+            yield n_digits, low, high
+
+
+def _multiplier_bounds(
+    low: int, high: int, n_digits: int, block: int
+) -> tuple[int, int, int]:
+    # The invalid IDs are m * block_divisor for the k digit values of m
+    block_divisor = (10**n_digits - 1) // (10**block - 1)
+    m_low = max(-(-low // block_divisor), 10 ** (block - 1))
+    m_high = min(high // block_divisor, 10**block - 1)
+    return block_divisor, m_low, m_high
+
+
+def repeated_id_sum(start: int, end: int, halves_only: bool = False) -> int:
+    """
+    Sum every ID in [start, end] made of a repeated block of digits without
+    visiting the IDs themselves.
+
+    Parameters
+    ----------
+    start : int
+        The first ID in the range.
+    end : int
+        The last ID in the range, inclusive.
+    halves_only : bool, optional
+        Only count IDs that are a block repeated exactly twice (part 1), by
+        default False
+
+    Returns
+    -------
+    int
+        The sum of the invalid IDs.
+    """
+    total = 0
+    for n_digits, low, high in _digit_spans(start, end):
+        for block in block_lengths(n_digits, halves_only):
+            sign = 1 if halves_only else -mobius(n_digits // block)
+            if sign == 0:
+                continue
+            block_divisor, m_low, m_high = _multiplier_bounds(
+                low, high, n_digits, block
+            )
+            if m_low <= m_high:
+                # arithmetic series of the multipliers
+                total += sign * block_divisor * (m_low + m_high) * (m_high - m_low + 1) // 2
+    return total
+
+
+def repeated_ids(start: int, end: int, halves_only: bool = False) -> Iterator[int]:
+    """
+    Yield every ID in [start, end] made of a repeated block of digits in
+    ascending order, the work done is proportional to the number of IDs found.
+    """
+    for n_digits, low, high in _digit_spans(start, end):
+        candidates = []
+        for block in block_lengths(n_digits, halves_only):
+            block_divisor, m_low, m_high = _multiplier_bounds(
+                low, high, n_digits, block
+            )
+            candidates.append(
+                range(m_low * block_divisor, m_high * block_divisor + 1, block_divisor)
+            )
+        previous = None
+        # Each block length is already sorted, merge them and drop the IDs
+        # that repeat with more than one block length
+        for n in heapq.merge(*candidates):
+            if n != previous:
+                yield n
+            previous = n
+
+
 @log_execution_time(logger=LOGGER)
-def day02_part1(
-    input_str: str = "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124",
+def day02_part1(input_str: str = EXAMPLE) -> int:
+    return sum(
+        repeated_id_sum(start, end, halves_only=True)
+        for start, end in parse_ranges(input_str)
+    )
+
+
+@log_execution_time(logger=LOGGER)
+def day02_part2(input_str: str = EXAMPLE) -> int:
+    return sum(repeated_id_sum(start, end) for start, end in parse_ranges(input_str))
+
+
+@log_execution_time(logger=LOGGER)
+def day02_part1_brute_force(
+    input_str: str = EXAMPLE,
 ) -> int:
     input_ranges = input_str.split(",")
     total = 0
@@ -55,8 +202,8 @@ def day02_part1(
 
 
 @log_execution_time(logger=LOGGER)
-def day02_part2(
-    input_str: str = "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124",
+def day02_part2_brute_force(
+    input_str: str = EXAMPLE,
 ):
     input_ranges = input_str.split(",")
     total = 0
@@ -138,3 +285,13 @@ if __name__ == "__main__":
 
     part2_solution: int = day02_part2(input_str)
     LOGGER.info(f"Part 2 solution: {part2_solution}")
+
+    # The closed form methods manage ranges far too wide for the brute force
+    # loops, those are only checked against them on small ranges in the tests
+    wide_range = "1-99999999999999"
+    LOGGER.info(
+        "Wide range %s: part 1 %d, part 2 %d",
+        wide_range,
+        day02_part1(wide_range),
+        day02_part2(wide_range),
+    )
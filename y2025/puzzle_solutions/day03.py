@@ -6,18 +6,26 @@ Project: advent-of-code
 File Created: Friday, 5th December 2025 9:23:08 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Friday, 5th December 2025 10:31:16 pm
+Last Modified: Saturday, 17th October 2026 11:20:43 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
+
+17-10-2026	TD	find_joltage slices and scans the remaining digits once per digit
+picked, O(n * k). max_joltage does the same selection with a monotonic stack in
+O(n) for any k: a digit knocks smaller ones off the top of the stack while there
+are still digits to spare. For lots of banks at once batch_joltage works on the
+whole input as one uint8 matrix of the raw bytes, picking digit m for every bank
+with a single argmax over the window that digit can come from.
 """
 
 import logging
 import math
 from pathlib import Path
 
+import numpy as np
 
 try:
     from .common_utils import log_execution_time, set_up_logger, read_day_input
@@ -100,6 +108,126 @@ def find_joltage(digits: list[int], num_maxs=2) -> int:
     return output
 
 
+def max_joltage(bank: str | bytes | list[int], num_maxs: int = 2) -> int:
+    """
+    The same as find_joltage but in a single pass with a monotonic stack.
+
+    Each digit pops any smaller digits off the top of the stack while there are
+    still digits that can be dropped, leaving the largest possible number as the
+    first `num_maxs` digits of the stack.
+
+    Parameters
+    ----------
+    bank : str | bytes | list[int]
+        The digits of the bank, either as text or a list of integers.
+    num_maxs : int, optional
+        The number of digits to select, by default 2
+
+    Returns
+    -------
+    int
+        The largest number formed by the selected digits.
+
+    Raises
+    ------
+    ValueError
+        If the bank has fewer than `num_maxs` digits.
+    """
+    if not bank:
+        return 0
+    if isinstance(bank, str):
+        bank = bank.encode()
+    offset = ord("0") if isinstance(bank, (bytes, bytearray)) else 0
+    can_drop = len(bank) - num_maxs
+    if can_drop < 0:
+        raise ValueError("No digits left to select maxima from.")
+    stack = []
+    for digit in bank:
+        while can_drop and stack and stack[-1] < digit:
+            stack.pop()
+            can_drop -= 1
+        stack.append(digit)
+    output = 0
+    for digit in stack[:num_maxs]:
+        output = output * 10 + digit - offset
+    return output
+
+
+def parse_banks(input_str: str) -> np.ndarray:
+    """
+    Read the banks into a (banks, digits) uint8 matrix of their ASCII codes.
+
+    The digits are kept as bytes rather than decoded so that 0 is free to pad
+    shorter banks on the left, where it can never be picked over a real digit.
+
+    Parameters
+    ----------
+    input_str : str
+        The puzzle input, one bank per line.
+
+    Returns
+    -------
+    np.ndarray
+        The uint8 matrix, each row right aligned.
+    """
+    banks = input_str.split()
+    if not banks:
+        return np.zeros((0, 0), dtype=np.uint8)
+    width = max(map(len, banks))
+    text = "".join(bank.rjust(width, "\0") for bank in banks).encode()
+    return np.frombuffer(text, dtype=np.uint8).reshape(len(banks), width)
+
+
+def batch_joltage(banks: np.ndarray, num_maxs: int = 2) -> np.ndarray:
+    """
+    The largest `num_maxs` digit number for every bank in the matrix at once.
+
+    Digit m has to leave num_maxs - m - 1 digits after it, so it comes from the
+    columns between the last pick and that limit. np.argmax gives the first of
+    the largest in the window for every row together, then everything up to the
+    pick is zeroed so it cannot be chosen again.
+
+    Parameters
+    ----------
+    banks : np.ndarray
+        The uint8 matrix from parse_banks.
+    num_maxs : int, optional
+        The number of digits to select from each bank, by default 2
+
+    Returns
+    -------
+    np.ndarray
+        The joltage of each bank.
+
+    Raises
+    ------
+    ValueError
+        If a bank has fewer than `num_maxs` digits.
+    """
+    n_banks, width = banks.shape
+    output = np.zeros(n_banks, dtype=np.int64 if num_maxs <= 18 else object)
+    if not n_banks:
+        return output
+    if width < num_maxs or (banks[:, width - num_maxs] == 0).any():
+        raise ValueError("No digits left to select maxima from.")
+    work = banks.copy()
+    rows = np.arange(n_banks)
+    cleared = np.zeros(n_banks, dtype=np.int64)
+    for m in range(num_maxs):
+        window_end = width - num_maxs + m + 1
+        # Columns before every bank's last pick are all zero, so skip them
+        first = int(cleared.min())
+        window = work[:, first:window_end]
+        picks = window.argmax(axis=1) + first
+        output = output * 10 + (work[rows, picks] - ord("0"))
+        # Zero from the end of the last cleared prefix up to and including the
+        # pick, the picks are all inside the window so only it needs masking
+        cols = np.arange(first, window_end)
+        window[(cols >= cleared[:, None]) & (cols <= picks[:, None])] = 0
+        cleared = picks + 1
+    return output
+
+
 @log_execution_time(logger=LOGGER)
 def day03_part1(
     input_str: str = "987654321111111\n811111111111119\n234234234234278\n818181911112111",
@@ -128,6 +256,34 @@ def day03_part2(
     return joltage
 
 
+@log_execution_time(logger=LOGGER)
+def day03_part1_monotonic_stack(
+    input_str: str = "987654321111111\n811111111111119\n234234234234278\n818181911112111",
+) -> int:
+    return sum(max_joltage(bank) for bank in input_str.encode().split())
+
+
+@log_execution_time(logger=LOGGER)
+def day03_part2_monotonic_stack(
+    input_str: str = "987654321111111\n811111111111119\n234234234234278\n818181911112111",
+) -> int:
+    return sum(max_joltage(bank, num_maxs=12) for bank in input_str.encode().split())
+
+
+@log_execution_time(logger=LOGGER)
+def day03_part1_vectorized(
+    input_str: str = "987654321111111\n811111111111119\n234234234234278\n818181911112111",
+) -> int:
+    return int(batch_joltage(parse_banks(input_str)).sum())
+
+
+@log_execution_time(logger=LOGGER)
+def day03_part2_vectorized(
+    input_str: str = "987654321111111\n811111111111119\n234234234234278\n818181911112111",
+) -> int:
+    return int(batch_joltage(parse_banks(input_str), num_maxs=12).sum())
+
+
 if __name__ == "__main__":
     input_str = read_day_input(
         day=3, folder=Path(__file__).resolve().parent.parent / "inputs"
@@ -138,3 +294,8 @@ if __name__ == "__main__":
 
     part2_solution: int = day03_part2(input_str)
     LOGGER.info(f"Part 2 solution: {part2_solution}")
+
+    part1_solution = day03_part1_vectorized(input_str)
+    LOGGER.info(f"Part 1 (vectorized) solution: {part1_solution}")
+    part2_solution = day03_part2_vectorized(input_str)
+    LOGGER.info(f"Part 2 (vectorized) solution: {part2_solution}")
@@ -6,17 +6,25 @@ Project: advent-of-code
 File Created: Saturday, 6th December 2025 11:33:44 am
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Saturday, 6th December 2025 11:56:26 am
+Last Modified: Saturday, 17th October 2026 9:41:37 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
+
+17-10-2026	TD	Revisited as promised. The grid is now a numpy bool array and the
+neighbour counts for every cell come from summing the 8 shifted slices of a
+padded copy. For part 2 the removals are driven by a worklist: when a roll is
+removed only its 8 neighbours lose one from their count, so each round only
+looks at the neighbours of the rolls removed in the round before, and the work
+is proportional to the number of removals rather than iterations x grid size.
 """
 
 import logging
 from pathlib import Path
 
+import numpy as np
 
 try:
     from .common_utils import log_execution_time, set_up_logger, read_day_input
@@ -28,6 +36,98 @@ LOGGER: logging.Logger = set_up_logger(
     folder=str(Path(__file__).resolve().parent.parent / "logs"),
 )
 
+EXAMPLE = (
+    "..@@.@@@@.\n@@@.@.@.@@\n@@@@@.@.@@\n@.@@@@..@.\n@@.@@@@.@@"
+    "\n.@@@@@@@.@\n.@.@.@.@@@\n@.@@@.@@@@\n.@@@@@@@@.\n@.@.@@@.@."
+)
+# The (row, col) offsets of the 8 neighbours
+NEIGHBOUR_OFFSETS = [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1) if i or j]
+# A roll can be reached by the forklift with fewer than this many neighbours
+MAX_NEIGHBOURS = 4
+
+
+def parse_grid(input_str: str) -> np.ndarray:
+    """
+    Read the grid into a bool array, True where there is a roll of paper (@).
+
+    Parameters
+    ----------
+    input_str : str
+        The puzzle input, one row of the grid per line.
+
+    Returns
+    -------
+    np.ndarray
+        A 2D bool array with the shape of the grid.
+    """
+    rows = input_str.split()
+    if not rows:
+        return np.zeros((0, 0), dtype=bool)
+    chars = np.frombuffer("".join(rows).encode(), dtype=np.uint8)
+    return (chars == ord("@")).reshape(len(rows), len(rows[0]))
+
+
+def neighbour_counts(grid: np.ndarray) -> np.ndarray:
+    """
+    Count the rolls in the 8 cells around every cell of the grid.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The bool grid from parse_grid.
+
+    Returns
+    -------
+    np.ndarray
+        An int array with the same shape as the grid.
+    """
+    rows, cols = grid.shape
+    padded = np.pad(grid, 1).astype(np.int8)
+    counts = np.zeros(grid.shape, dtype=np.int8)
+    for i, j in NEIGHBOUR_OFFSETS:
+        counts += padded[1 + i : 1 + i + rows, 1 + j : 1 + j + cols]
+    return counts
+
+
+def removal_rounds(grid: np.ndarray):
+    """
+    Keep removing every roll with fewer than 4 neighbours until none are left,
+    yielding the number removed in each round.
+
+    Rather than rescanning the grid each round, only the neighbours of the rolls
+    removed in the last round can have become accessible, so those are the only
+    cells looked at again.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The bool grid from parse_grid, it is not modified.
+
+    Yields
+    ------
+    int
+        The number of rolls removed in the round.
+    """
+    rows, cols = grid.shape
+    width = cols + 2
+    # Work on flat indexes into the padded grid, so neighbours are a fixed
+    # offset away and the border cells (always empty) stop anything going out
+    # of bounds
+    present = np.pad(grid, 1).ravel()
+    counts = np.pad(neighbour_counts(grid), 1).ravel()
+    offsets = np.array([i * width + j for i, j in NEIGHBOUR_OFFSETS])
+    worklist = np.flatnonzero(present & (counts < MAX_NEIGHBOURS))
+    while len(worklist):
+        present[worklist] = False
+        yield len(worklist)
+        neighbours = (worklist[:, None] + offsets).ravel()
+        # A neighbour next to several removed rolls loses one for each
+        np.subtract.at(counts, neighbours, 1)
+        neighbours = np.unique(neighbours)
+        worklist = neighbours[
+            present[neighbours] & (counts[neighbours] < MAX_NEIGHBOURS)
+        ]
+
 
 @log_execution_time(logger=LOGGER)
 def day04_part1(
@@ -129,6 +229,45 @@ def day00_part2(
     return len(accessible)
 
 
+@log_execution_time(logger=LOGGER)
+def day04_part1_vectorized(input_str: str = EXAMPLE) -> int:
+    """
+    The numpy version of part 1, counting the rolls with fewer than 4
+    neighbouring rolls.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The puzzle input, by default the worked example.
+
+    Returns
+    -------
+    int
+        The number of rolls the forklifts can reach.
+    """
+    grid = parse_grid(input_str)
+    return int(np.count_nonzero(grid & (neighbour_counts(grid) < MAX_NEIGHBOURS)))
+
+
+@log_execution_time(logger=LOGGER)
+def day04_part2_vectorized(input_str: str = EXAMPLE) -> int:
+    """
+    The numpy version of part 2, removing the reachable rolls round by round
+    with removal_rounds.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The puzzle input, by default the worked example.
+
+    Returns
+    -------
+    int
+        The total number of rolls that can be removed.
+    """
+    return sum(removal_rounds(parse_grid(input_str)))
+
+
 if __name__ == "__main__":
     expected_solution = 13
     got_solution = day04_part1()
@@ -152,3 +291,8 @@ if __name__ == "__main__":
 
     part2_solution: int = day00_part2(input_str)
     LOGGER.info(f"Part 2 solution: {part2_solution}")
+
+    part1_solution = day04_part1_vectorized(input_str)
+    LOGGER.info(f"Part 1 (vectorized) solution: {part1_solution}")
+    part2_solution = day04_part2_vectorized(input_str)
+    LOGGER.info(f"Part 2 (vectorized) solution: {part2_solution}")
@@ -6,18 +6,26 @@ Project: advent-of-code
 File Created: Saturday, 6th December 2025 12:11:04 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Saturday, 6th December 2025 2:47:07 pm
+Last Modified: Saturday, 17th October 2026 8:55:12 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
+
+17-10-2026	TD	Finally wrote the numpy version of part 1 I mentioned below. Once
+the ranges are consolidated (the same merge as part 2, now pulled out into
+consolidate_ranges) the starts are sorted and never overlap, so each ID only has
+one candidate range: the last start <= the ID, found with np.searchsorted. That
+makes a batch of M IDs O(M log N) rather than checking every range per ID.
 """
 
 import logging
 from pathlib import Path
 import re
 
+import numpy as np
+
 
 try:
     from .common_utils import log_execution_time, set_up_logger, read_day_input
@@ -30,6 +38,103 @@ LOGGER: logging.Logger = set_up_logger(
 )
 
 
+def parse_ranges(fresh_range: str) -> list[tuple[int, int]]:
+    return [
+        tuple(map(int, re.findall(r"\d+", line))) for line in fresh_range.splitlines()
+    ]
+
+
+def consolidate_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Sort the inclusive ranges and merge any that overlap.
+
+    Parameters
+    ----------
+    ranges : list[tuple[int, int]]
+        The (start, stop) ranges, in any order.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted, non overlapping ranges covering the same IDs.
+    """
+    if not ranges:
+        return []
+    ranges = sorted(ranges)
+    consolidated_ranges = []
+    current_start, current_stop = ranges[0]
+    for start, stop in ranges[1:]:
+        if start <= current_stop:
+            # This one is overlapping another
+            current_stop = max(current_stop, stop)
+        else:
+            consolidated_ranges.append((current_start, current_stop))
+            current_start, current_stop = start, stop
+    consolidated_ranges.append((current_start, current_stop))
+    return consolidated_ranges
+
+
+class IntervalIndex:
+    """
+    A set of inclusive integer ranges kept consolidated as sorted numpy arrays
+    of starts and stops, for answering lots of membership queries at once.
+
+    Parameters
+    ----------
+    ranges : list[tuple[int, int]], optional
+        The initial (start, stop) ranges, they may overlap.
+    """
+
+    def __init__(self, ranges: list[tuple[int, int]] | None = None):
+        consolidated = consolidate_ranges(list(ranges or []))
+        self.starts = np.array([r[0] for r in consolidated], dtype=np.int64)
+        self.stops = np.array([r[1] for r in consolidated], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, start: int, stop: int):
+        """
+        Insert a range, merging it with any ranges it overlaps.
+        """
+        # The ranges from first to last (exclusive) overlap the new one
+        first = int(np.searchsorted(self.stops, start, side="left"))
+        last = int(np.searchsorted(self.starts, stop, side="right"))
+        if first < last:
+            start = min(start, int(self.starts[first]))
+            stop = max(stop, int(self.stops[last - 1]))
+        self.starts = np.concatenate(
+            (self.starts[:first], [start], self.starts[last:])
+        ).astype(np.int64)
+        self.stops = np.concatenate(
+            (self.stops[:first], [stop], self.stops[last:])
+        ).astype(np.int64)
+
+    def contains(self, ids) -> np.ndarray:
+        """
+        Check a batch of IDs against the ranges.
+
+        Parameters
+        ----------
+        ids : array_like
+            The IDs to look up.
+
+        Returns
+        -------
+        np.ndarray
+            A bool array, True where the ID falls inside one of the ranges.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(self) == 0:
+            return np.zeros(ids.shape, dtype=bool)
+        # The only range that can hold an ID is the last one starting at or before it
+        candidate = np.searchsorted(self.starts, ids, side="right") - 1
+        return (candidate >= 0) & (ids <= self.stops[np.maximum(candidate, 0)])
+
+    def total_size(self) -> int:
+        return int((self.stops + 1 - self.starts).sum())
+
+
 @log_execution_time(logger=LOGGER)
 def day05_part1(
     input_str: str = "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32",
@@ -69,9 +174,7 @@ def day05_part1(
 
     """
     fresh_range, to_check = input_str.split("\n\n")
-    fresh_stop_starts = [
-        tuple(map(int, re.findall(r"\d+", line))) for line in fresh_range.splitlines()
-    ]
+    fresh_stop_starts = parse_ranges(fresh_range)
     fresh_count = 0
     # I made the mistake of first creating a flattened list of integers here
     # without looking at the size of the numbers in the input ...
@@ -133,27 +236,39 @@ def day05_part2(
     #
     # Ah, I did not consider overlaps!
     fresh_range, to_check = input_str.split("\n\n")
-    fresh_stop_starts = [
-        tuple(map(int, re.findall(r"\d+", line))) for line in fresh_range.splitlines()
-    ]
+    fresh_stop_starts = parse_ranges(fresh_range)
     # first I need to loop through and consolidate any overlapping ranges
-    fresh_stop_starts.sort()
-    consolidated_ranges = []
-    current_start, current_stop = fresh_stop_starts[0]
-    for start, stop in fresh_stop_starts[1:]:
-        if start <= current_stop:
-            # This one is overlapping another
-            current_stop = max(current_stop, stop)
-        else:
-            consolidated_ranges.append((current_start, current_stop))
-            current_start, current_stop = start, stop
-    consolidated_ranges.append((current_start, current_stop))
+    consolidated_ranges = consolidate_ranges(fresh_stop_starts)
     total = 0
     for rng in consolidated_ranges:
         total += rng[1] + 1 - rng[0]
     return total
 
 
+@log_execution_time(logger=LOGGER)
+def day05_part1_vectorized(
+    input_str: str = "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32",
+) -> int:
+    """
+    The numpy version of part 1, the IDs are checked in one batch against an
+    IntervalIndex of the fresh ranges.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The puzzle input containing fresh ID ranges and available ingredient IDs, separated by a blank line.
+
+    Returns
+    -------
+    int
+        The number of available ingredient IDs that are fresh.
+    """
+    fresh_range, to_check = input_str.split("\n\n")
+    index = IntervalIndex(parse_ranges(fresh_range))
+    ids = np.array(to_check.split(), dtype=np.int64)
+    return int(np.count_nonzero(index.contains(ids)))
+
+
 if __name__ == "__main__":
     expected_solution = 3
     got_solution = day05_part1()
@@ -168,6 +283,15 @@ if __name__ == "__main__":
     part1_solution: int = day05_part1(input_str)
     LOGGER.info(f"Part 1 solution: {part1_solution}")
 
+    expected_solution = 3
+    got_solution = day05_part1_vectorized()
+    if expected_solution != got_solution:
+        LOGGER.error(
+            f"Problem with solution to part 1! Did not get the expected answer of {expected_solution} for the provided worked example. Instead got: {got_solution}"
+        )
+    part1_solution: int = day05_part1_vectorized(input_str)
+    LOGGER.info(f"Part 1 (vectorized) solution: {part1_solution}")
+
     expected_solution = 14
     got_solution = day05_part2()
     if expected_solution != got_solution:
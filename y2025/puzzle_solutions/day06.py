@@ -6,18 +6,28 @@ Project: advent-of-code
 File Created: Saturday, 6th December 2025 12:34:12 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Saturday, 6th December 2025 2:43:10 pm
+Last Modified: Saturday, 17th October 2026 10:47:51 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
+
+17-10-2026	TD	Added numpy versions of both parts. The worksheet is loaded once as
+a uint8 character matrix and the problems are found from the operator row alone,
+every operator marks the first column of a problem. Digits are decoded with
+arithmetic on the whole matrix rather than building strings: part 1 weights each
+digit by 10 ** (digits after it in the same row and problem), part 2 runs Horner's
+method down the rows for every column at once. Each problem is then reduced with
+np.add / np.multiply.reduceat. If the products could overflow int64 the numbers
+are kept as python ints instead.
 """
 
 import logging
 from pathlib import Path
 import re
 
+import numpy as np
 
 try:
     from .common_utils import log_execution_time, set_up_logger, read_day_input
@@ -30,6 +40,82 @@ LOGGER: logging.Logger = set_up_logger(
     level=logging.INFO,
 )
 
+EXAMPLE = "123 328  51 64 \n 45 64  387 23 \n  6 98  215 314\n*   +   *   +  "
+SPACE, ZERO, NINE, PLUS = (ord(c) for c in " 09+")
+# int64 holds any number of up to this many digits
+INT64_DIGITS = 18
+
+
+def load_worksheet(input_str: str) -> np.ndarray:
+    """
+    Load the worksheet as a uint8 character matrix, padding short rows with spaces.
+
+    Parameters
+    ----------
+    input_str : str
+        The cephalopod math worksheet.
+
+    Returns
+    -------
+    np.ndarray
+        A (rows, columns) uint8 array of the characters, the operators on the last row.
+    """
+    rows = input_str.splitlines()
+    width = max(map(len, rows))
+    text = "".join(row.ljust(width) for row in rows).encode()
+    return np.frombuffer(text, dtype=np.uint8).reshape(len(rows), width)
+
+
+def problem_starts(worksheet: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find where each problem starts from the operator row.
+
+    Parameters
+    ----------
+    worksheet : np.ndarray
+        The matrix from load_worksheet.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The first column of every problem and a bool array, True for the
+        problems that are products.
+    """
+    starts = np.flatnonzero(worksheet[-1] != SPACE)
+    return starts, worksheet[-1, starts] != PLUS
+
+
+def _number_dtype(digits: int):
+    return np.int64 if digits <= INT64_DIGITS else object
+
+
+def _reduce_problems(
+    numbers: np.ndarray, starts: np.ndarray, products: np.ndarray, present: np.ndarray
+) -> int:
+    """
+    Add or multiply the numbers in each problem and return the grand total.
+
+    numbers is a 1D array laid out in problem order, starts indexes the first
+    number of each problem and present is False for any padding entries, which
+    are swapped for the identity of their problem's operator.
+    """
+    # Which problem each entry belongs to
+    first = np.zeros(len(numbers), dtype=np.int64)
+    first[starts] = 1
+    is_product = products[np.cumsum(first) - 1]
+    sums = np.add.reduceat(np.where(present, numbers, 0), starts)
+    prods = np.multiply.reduceat(
+        np.where(present | ~is_product, numbers, 1).astype(numbers.dtype), starts
+    )
+    # The answers themselves can fit while their total does not
+    return int(np.where(products, prods, sums).astype(object).sum())
+
+
+def _digits(worksheet: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    grid = worksheet[:-1]
+    is_digit = (grid >= ZERO) & (grid <= NINE)
+    return np.where(is_digit, grid - ZERO, 0).astype(np.int64), is_digit
+
 
 @log_execution_time(logger=LOGGER)
 def day06_part1(
@@ -164,6 +250,77 @@ def day06_part2(
     return answer
 
 
+@log_execution_time(logger=LOGGER)
+def day06_part1_vectorized(input_str: str = EXAMPLE) -> int:
+    """
+    The numpy version of part 1, where the numbers are read along the rows of
+    each problem.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The cephalopod math worksheet, by default the worked example.
+
+    Returns
+    -------
+    int
+        The grand total found by adding together all answers.
+    """
+    worksheet = load_worksheet(input_str)
+    starts, products = problem_starts(worksheet)
+    digits, is_digit = _digits(worksheet)
+    n_rows, width = digits.shape
+    longest = int(np.add.reduceat(is_digit, starts, axis=1).max())
+    # A product of n_rows numbers has at most n_rows * longest digits
+    dtype = _number_dtype(longest * n_rows)
+    # The number of digits after each cell in its own row of its own problem
+    seen = np.cumsum(is_digit, axis=1)
+    problem_ends = np.append(starts[1:], width) - 1
+    ends = np.repeat(problem_ends, np.diff(np.append(starts, width)))
+    after = seen[:, ends] - seen
+    place_values = np.array([10**i for i in range(longest)], dtype=dtype)[after]
+    numbers = np.add.reduceat((digits * place_values).astype(dtype), starts, axis=1)
+    # Every row holds one number per problem, so each problem is a column of
+    # numbers, lay them out problem by problem for the reduction
+    problem_starts_flat = np.arange(len(starts)) * n_rows
+    return _reduce_problems(
+        numbers.T.ravel(),
+        problem_starts_flat,
+        products,
+        np.ones(numbers.size, dtype=bool),
+    )
+
+
+@log_execution_time(logger=LOGGER)
+def day06_part2_vectorized(input_str: str = EXAMPLE) -> int:
+    """
+    The numpy version of part 2, where each column is a number read top to bottom.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The cephalopod math worksheet, by default the worked example.
+
+    Returns
+    -------
+    int
+        The grand total found by adding together all answers.
+    """
+    worksheet = load_worksheet(input_str)
+    starts, products = problem_starts(worksheet)
+    digits, is_digit = _digits(worksheet)
+    n_rows, width = digits.shape
+    # Columns without any digits are the gaps between problems
+    present = is_digit.any(axis=0)
+    most = int(np.add.reduceat(present, starts).max())
+    dtype = _number_dtype(most * n_rows)
+    # Horner's method down the rows, spaces are skipped rather than read as 0
+    numbers = np.zeros(width, dtype=dtype)
+    for row_digits, row_is_digit in zip(digits.astype(dtype), is_digit):
+        numbers = np.where(row_is_digit, numbers * 10 + row_digits, numbers)
+    return _reduce_problems(numbers, starts, products, present)
+
+
 if __name__ == "__main__":
     expected_solution = 4277556
     got_solution = day06_part1()
@@ -187,3 +344,8 @@ if __name__ == "__main__":
 
     part2_solution: int = day06_part2(input_str)
     LOGGER.info(f"Part 2 solution: {part2_solution}")
+
+    part1_solution = day06_part1_vectorized(input_str)
+    LOGGER.info(f"Part 1 (vectorized) solution: {part1_solution}")
+    part2_solution = day06_part2_vectorized(input_str)
+    LOGGER.info(f"Part 2 (vectorized) solution: {part2_solution}")
@@ -6,17 +6,27 @@ Project: advent-of-code
 File Created: Sunday, 7th December 2025 7:34:55 pm
 Author: tdarnell (tdarnell@users.noreply.github.com)
 -----
-Last Modified: Sunday, 7th December 2025 8:56:11 pm
+Last Modified: Saturday, 17th October 2026 10:12:05 pm
 Modified By: tdarnell (tdarnell@users.noreply.github.com>)
 -----
 HISTORY:
 Date      	By	Comments
 ----------	---	---------------------------------------------------------
+
+17-10-2026	TD	Added a numpy version of both parts. The splitter columns for every
+row are found once up front from the raw bytes, then the beams are carried down
+the manifold as one vector of timeline counts (a count > 0 means a beam is in
+that column, so part 1 falls out of the same pass). Each row with splitters is a
+few fancy indexing operations on just those columns, rows without any are
+skipped. The counts start as int64 and switch to python ints (object arrays) if
+they could overflow. Drawing the beams is now opt in with render=True as it was
+building a string per row even when nothing was logged.
 """
 
 import logging
 from pathlib import Path
 
+import numpy as np
 
 try:
     from .common_utils import log_execution_time, set_up_logger, read_day_input
@@ -28,6 +38,116 @@ LOGGER: logging.Logger = set_up_logger(
     folder=str(Path(__file__).resolve().parent.parent / "logs"),
 )
 
+EXAMPLE = (
+    ".......S.......\n...............\n.......^.......\n...............\n"
+    "......^.^......\n...............\n.....^.^.^.....\n...............\n"
+    "....^.^...^....\n...............\n...^.^...^.^...\n...............\n"
+    "..^...^.....^..\n...............\n.^.^.^.^.^...^.\n...............\n"
+)
+# Above this the counts are moved to python ints rather than risk int64 overflow
+INT64_SAFE_LIMIT = 2**62
+
+
+def parse_manifold(input_str: str) -> tuple[int, int, list[tuple[int, np.ndarray]]]:
+    """
+    Find the start and the splitter columns of every row in one pass over the bytes.
+
+    Parameters
+    ----------
+    input_str : str
+        The tachyon manifold grid.
+
+    Returns
+    -------
+    tuple[int, int, list[tuple[int, np.ndarray]]]
+        The start column, the width of the manifold and a (row number, sorted
+        splitter columns) pair for each row that has any splitters.
+    """
+    data = np.frombuffer(input_str.encode(), dtype=np.uint8)
+    newlines = np.flatnonzero(data == ord("\n"))
+    positions = np.flatnonzero(data == ord("^"))
+    width = int(newlines[0]) if len(newlines) else len(data)
+    start = input_str.find("S")
+    if not 0 <= start < width:
+        LOGGER.error("No starting point 'S' found in the input!")
+        raise ValueError("No starting point 'S' found in the input!")
+    row_numbers = np.searchsorted(newlines, positions)
+    row_starts = np.concatenate(([0], newlines + 1))
+    columns = positions - row_starts[row_numbers]
+    if not len(positions):
+        return start, width, []
+    # positions are in order, so each row's splitters are one contiguous block
+    breaks = np.flatnonzero(np.diff(row_numbers)) + 1
+    first_of_row = np.concatenate(([0], breaks))
+    splitters = list(
+        zip(row_numbers[first_of_row].tolist(), np.split(columns, breaks))
+    )
+    return start, width, splitters
+
+
+def render_row(row: str, counts: np.ndarray) -> str:
+    """
+    Draw the beams (|) onto a row of the manifold, counts is the padded vector
+    used in propagate_beams.
+    """
+    return "".join(
+        "|" if count and char == "." else char for char, count in zip(row, counts[1:])
+    )
+
+
+def propagate_beams(input_str: str, render: bool = False) -> tuple[int, int]:
+    """
+    Send the beam down the manifold, counting the splitters hit and the
+    timelines reaching the bottom.
+
+    Parameters
+    ----------
+    input_str : str
+        The tachyon manifold grid.
+    render : bool, optional
+        Log each row with the beams drawn in at debug level, by default False.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of splitters hit (part 1) and the number of timelines (part 2).
+    """
+    start, width, splitters = parse_manifold(input_str)
+    # One spare column each side catches beams split off the edge
+    counts = np.zeros(width + 2, dtype=np.int64)
+    counts[start + 1] = 1
+    # Nothing but a split adds timelines, and a split adds as many as it hits,
+    # so this stays above the total of the vector (and so every count in it)
+    upper_bound = 1
+    splits = 0
+    render = render and LOGGER.isEnabledFor(logging.DEBUG)
+    rows = input_str.splitlines() if render else []
+    next_row = 0
+    for row_number, columns in splitters:
+        for skipped in rows[next_row:row_number]:
+            LOGGER.debug(render_row(skipped, counts))
+        columns = columns + 1
+        hit = counts[columns]
+        split = hit != 0
+        if not split.any():
+            continue
+        splits += int(np.count_nonzero(split))
+        if counts.dtype != object:
+            upper_bound += int(hit.sum())
+            if upper_bound >= INT64_SAFE_LIMIT:
+                counts = counts.astype(object)
+                hit = hit.astype(object)
+        counts[columns] = 0
+        # Splitters are sorted and unique, so neither of these repeats an index
+        counts[columns - 1] += hit
+        counts[columns + 1] += hit
+        if render:
+            LOGGER.debug(render_row(rows[row_number], counts))
+            next_row = row_number + 1
+    for skipped in rows[next_row:]:
+        LOGGER.debug(render_row(skipped, counts))
+    return splits, int(counts[1:-1].sum())
+
 
 @log_execution_time(logger=LOGGER)
 def day07_part1(
@@ -130,6 +250,42 @@ def day07_part2(
     return sum(timelines)
 
 
+@log_execution_time(logger=LOGGER)
+def day07_part1_vectorized(input_str: str = EXAMPLE) -> int:
+    """
+    The numpy version of part 1, see propagate_beams.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The tachyon manifold grid, by default the provided example.
+
+    Returns
+    -------
+    int
+        The total number of times the beam is split.
+    """
+    return propagate_beams(input_str)[0]
+
+
+@log_execution_time(logger=LOGGER)
+def day07_part2_vectorized(input_str: str = EXAMPLE) -> int:
+    """
+    The numpy version of part 2, see propagate_beams.
+
+    Parameters
+    ----------
+    input_str : str, optional
+        The quantum tachyon manifold grid, by default the provided example.
+
+    Returns
+    -------
+    int
+        The total number of timelines active after all possible journeys.
+    """
+    return propagate_beams(input_str)[1]
+
+
 if __name__ == "__main__":
     expected_solution = 21
     got_solution = day07_part1()
@@ -153,3 +309,8 @@ if __name__ == "__main__":
 
     part2_solution: int = day07_part2(input_str)
     LOGGER.info(f"Part 2 solution: {part2_solution}")
+
+    part1_solution = day07_part1_vectorized(input_str)
+    LOGGER.info(f"Part 1 (vectorized) solution: {part1_solution}")
+    part2_solution = day07_part2_vectorized(input_str)
+    LOGGER.info(f"Part 2 (vectorized) solution: {part2_solution}")
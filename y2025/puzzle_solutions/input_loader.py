@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+File: input_loader.py
+Project: advent-of-code
+File Created: Saturday, 17th October 2026 11:59:51 pm
+Author: tdarnell (tdarnell@users.noreply.github.com)
+-----
+Last Modified: Saturday, 17th October 2026 11:59:51 pm
+Modified By: tdarnell (tdarnell@users.noreply.github.com>)
+-----
+HISTORY:
+Date      	By	Comments
+----------	---	---------------------------------------------------------
+
+read_day_input reads the whole file into a str and then every solution splits
+it up again with splitlines / split / re.findall / int, building a python object
+for every line and number on the way. That is fine for the real inputs but not
+for the huge stress test ones. Here the input file is memory mapped as a numpy
+uint8 array instead and the parsers work straight on the bytes:
+
+    data = map_day_input(5)
+    ranges, ids = blocks(data)
+    range_pairs(ranges)         # (n, 2) int64 array of the a-b ranges
+    ints(ids)                   # int64 array of every number
+    int_columns(data)           # (lines, numbers per line) int64 array
+    ragged_ints(data)           # every number plus the offset of each line
+    char_grid(data)             # (rows, columns) uint8 view of a grid
+
+The parsers also accept a str or bytes so the worked examples can go through
+them too. Integers are limited to int64 (18 digits).
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+NEWLINE, MINUS, ZERO, NINE = (ord(c) for c in "\n-09")
+MAX_DIGITS = 18
+POWERS_OF_TEN = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+
+
+def map_input(input_file: Path | str) -> np.ndarray:
+    """
+    Memory map a file as a read only uint8 array, nothing is read until it is used.
+
+    Parameters
+    ----------
+    input_file : Path | str
+        The file to map.
+
+    Returns
+    -------
+    np.ndarray
+        The bytes of the file.
+    """
+    input_file = Path(input_file)
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file {input_file} not found.")
+    if input_file.stat().st_size == 0:
+        # mmap refuses empty files
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(input_file, dtype=np.uint8, mode="r")
+
+
+def map_day_input(day: int, folder: Path | str | None = None) -> np.ndarray:
+    """
+    The memory mapped version of read_day_input.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    folder : Path | str | None, optional
+        The folder holding the inputs, by default ./inputs
+
+    Returns
+    -------
+    np.ndarray
+        The bytes of the input file.
+    """
+    folder = Path(folder) if folder else Path(".") / "inputs"
+    return map_input(folder / f"day{day:02d}.txt")
+
+
+def as_bytes(data: np.ndarray | bytes | str) -> np.ndarray:
+    """
+    View the input as a uint8 array, str and bytes are converted.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(data, dtype=np.uint8)
+    return np.asarray(data, dtype=np.uint8)
+
+
+def _strip_newlines(data: np.ndarray) -> np.ndarray:
+    # Trailing and leading blank lines only, the rows themselves are untouched
+    start, end = 0, len(data)
+    while end > start and data[end - 1] == NEWLINE:
+        end -= 1
+    while start < end and data[start] == NEWLINE:
+        start += 1
+    return data[start:end]
+
+
+def line_starts(data: np.ndarray | bytes | str) -> np.ndarray:
+    """
+    The offset of the first byte of every line, a trailing newline does not
+    start a new line.
+    """
+    data = _strip_newlines(as_bytes(data))
+    if not len(data):
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(([0], np.flatnonzero(data == NEWLINE) + 1))
+
+
+def _number_spans(data: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find every run of digits, returning the digit mask along with the start
+    (inclusive) and end (exclusive) of each run.
+    """
+    # uint8 wraps around, so anything below "0" ends up above 9 too
+    is_digit = (data - ZERO) <= 9
+    edges = np.flatnonzero(
+        np.concatenate(([False], is_digit)) != np.concatenate((is_digit, [False]))
+    )
+    return is_digit, edges[::2], edges[1::2]
+
+
+def _decode(
+    data: np.ndarray, is_digit: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    """
+    Decode the digit runs into int64, a minus sign directly before a run that
+    does not follow a digit (so not the - in 3-5) makes it negative.
+    """
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        raise ValueError(f"Numbers longer than {MAX_DIGITS} digits do not fit int64")
+    # Add the digits in one place at a time from the right, each pass gathers a
+    # single digit of every number long enough to have one
+    last = ends - 1
+    values = (data[last] - ZERO).astype(np.int64)
+    for place in range(1, int(lengths.max())):
+        longer = lengths > place
+        if longer.all():
+            values += (data[last - place] - ZERO) * POWERS_OF_TEN[place]
+        else:
+            longer = np.flatnonzero(longer)
+            digits = data[last[longer] - place] - ZERO
+            values[longer] += digits * POWERS_OF_TEN[place]
+    sign = starts - 1
+    negative = sign >= 0
+    negative[negative] = data[sign[negative]] == MINUS
+    check = negative & (sign >= 1)
+    negative[check] = ~is_digit[sign[check] - 1]
+    return np.where(negative, -values, values)
+
+
+def ints(data: np.ndarray | bytes | str) -> np.ndarray:
+    """
+    Every integer in the input, in order.
+
+    Parameters
+    ----------
+    data : np.ndarray | bytes | str
+        The input, e.g. from map_day_input.
+
+    Returns
+    -------
+    np.ndarray
+        A 1D int64 array.
+    """
+    data = as_bytes(data)
+    return _decode(data, *_number_spans(data))
+
+
+def ragged_ints(data: np.ndarray | bytes | str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Every integer in the input along with where each line's numbers start, for
+    inputs where the lines hold different amounts of numbers.
+
+    Parameters
+    ----------
+    data : np.ndarray | bytes | str
+        The input, e.g. from map_day_input.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The int64 values, and the offsets (one more than the number of lines)
+        so line i is values[offsets[i]:offsets[i + 1]].
+    """
+    data = _strip_newlines(as_bytes(data))
+    is_digit, starts, ends = _number_spans(data)
+    values = _decode(data, is_digit, starts, ends)
+    lines = line_starts(data)
+    line_of_number = np.searchsorted(lines, starts, side="right") - 1
+    counts = np.bincount(line_of_number, minlength=len(lines))
+    return values, np.concatenate(([0], np.cumsum(counts)))
+
+
+def int_columns(data: np.ndarray | bytes | str) -> np.ndarray:
+    """
+    The integers of an input with the same amount on every line, as columns.
+
+    Parameters
+    ----------
+    data : np.ndarray | bytes | str
+        The input, e.g. from map_day_input.
+
+    Returns
+    -------
+    np.ndarray
+        A (lines, numbers per line) int64 array, use .T to unpack the columns.
+
+    Raises
+    ------
+    ValueError
+        If the lines do not all hold the same amount of numbers.
+    """
+    data = _strip_newlines(as_bytes(data))
+    is_digit, starts, ends = _number_spans(data)
+    values = _decode(data, is_digit, starts, ends)
+    lines = line_starts(data)
+    if not len(lines):
+        return values.reshape(0, 0)
+    per_line = int(np.searchsorted(starts, lines[1])) if len(lines) > 1 else len(starts)
+    # With the same amount on every line, number i * per_line is the first one
+    # on line i and the one before it is still on the line before
+    firsts = starts[::per_line] if per_line else starts[:0]
+    if (
+        len(values) != per_line * len(lines)
+        or (firsts < lines).any()
+        or (per_line and (starts[per_line - 1 :: per_line][:-1] >= lines[1:]).any())
+    ):
+        raise ValueError("The lines do not all have the same number of integers")
+    return values.reshape(len(lines), per_line)
+
+
+def range_pairs(data: np.ndarray | bytes | str) -> np.ndarray:
+    """
+    The a-b ranges of the input, however they are separated.
+
+    Parameters
+    ----------
+    data : np.ndarray | bytes | str
+        The input, e.g. from map_day_input.
+
+    Returns
+    -------
+    np.ndarray
+        A (ranges, 2) int64 array of the starts and ends.
+    """
+    values = ints(data)
+    if len(values) % 2:
+        raise ValueError("The ranges are not all a-b pairs")
+    return values.reshape(-1, 2)
+
+
+def char_grid(data: np.ndarray | bytes | str) -> np.ndarray:
+    """
+    The input as a (rows, columns) uint8 matrix of its characters. For a
+    rectangular grid this is a view of the input with the newlines stepped over,
+    so a memory mapped grid is never copied.
+
+    Parameters
+    ----------
+    data : np.ndarray | bytes | str
+        The input, e.g. from map_day_input.
+
+    Returns
+    -------
+    np.ndarray
+        The characters, compare with ord("#") and friends.
+
+    Raises
+    ------
+    ValueError
+        If the rows are not all the same length.
+    """
+    data = _strip_newlines(as_bytes(data))
+    if not len(data):
+        return data.reshape(0, 0)
+    starts = line_starts(data)
+    width = int(starts[1] - 1) if len(starts) > 1 else len(data)
+    if len(data) != len(starts) * (width + 1) - 1 or (
+        len(starts) > 1 and (data[starts[1:] - 1] != NEWLINE).any()
+    ):
+        raise ValueError("The rows of the grid are not all the same length")
+    return np.lib.stride_tricks.as_strided(
+        data, shape=(len(starts), width), strides=(width + 1, 1), writeable=False
+    )
+
+
+def blocks(data: np.ndarray | bytes | str) -> list[np.ndarray]:
+    """
+    Split the input on blank lines, each block is a view of the input.
+
+    Parameters
+    ----------
+    data : np.ndarray | bytes | str
+        The input, e.g. from map_day_input.
+
+    Returns
+    -------
+    list[np.ndarray]
+        The uint8 blocks, ready for any of the other parsers.
+    """
+    data = _strip_newlines(as_bytes(data))
+    if not len(data):
+        return []
+    newline = data == NEWLINE
+    # A blank line is a newline straight after another one
+    breaks = np.flatnonzero(newline[1:] & newline[:-1]) + 1
+    result = []
+    start = 0
+    for end in breaks:
+        if end - 1 > start:
+            result.append(_strip_newlines(data[start : end - 1]))
+        start = end + 1
+    result.append(_strip_newlines(data[start:]))
+    return [block for block in result if len(block)]
@@ -1,4 +1,6 @@
 import unittest
+import io
+import random
 import sys
 import os
 
@@ -8,6 +10,7 @@ from puzzle_solutions.day01 import (
     day01_part1_for_loop_method,
     day01_part1_vectorized,
     day01_part2_for_loop_method,
+    day01_part2_vectorized,
 )
 
 
@@ -35,18 +38,50 @@ class TestDay01Methods(unittest.TestCase):
     def test_part2_example_returns_6(self):
         # default example from the function should return 6
         self.assertEqual(day01_part2_for_loop_method(), 6)
+        self.assertEqual(day01_part2_vectorized(), 6)
 
     def test_part2_empty_input_returns_0(self):
         # empty input should return 0
         self.assertEqual(day01_part2_for_loop_method(""), 0)
+        self.assertEqual(day01_part2_vectorized(""), 0)
 
     def test_part2_single_rotation_wraps_to_zero(self):
         # Start at 50, R50 -> (50 + 50) == 100, so one wrap
         self.assertEqual(day01_part2_for_loop_method("R50"), 1)
+        self.assertEqual(day01_part2_vectorized("R50"), 1)
 
     def test_part2_multiple_wraps(self):
         # Start at 50, R50 -> 100 (1 wrap), R100 -> 200 (2 wraps)
         self.assertEqual(day01_part2_for_loop_method("R50\nR100"), 2)
+        self.assertEqual(day01_part2_vectorized("R50\nR100"), 2)
+
+    def test_part2_left_turns_from_zero(self):
+        # Leaving 0 to the left does not pass it again, L50 -> 0 then L5 -> 95
+        self.assertEqual(day01_part2_for_loop_method("L50\nL5\nL200"), 3)
+        self.assertEqual(day01_part2_vectorized("L50\nL5\nL200"), 3)
+
+    def test_part2_vectorized_matches_loop(self):
+        rng = random.Random(2025)
+        for _ in range(20):
+            input_str = "\n".join(
+                f"{rng.choice('LR')}{rng.randint(0, 450)}"
+                for _ in range(rng.randint(1, 500))
+            )
+            self.assertEqual(
+                day01_part2_vectorized(input_str),
+                day01_part2_for_loop_method(input_str),
+            )
+
+    def test_part2_vectorized_streams_in_chunks(self):
+        rng = random.Random(1)
+        input_str = "\n".join(
+            f"{rng.choice('LR')}{rng.randint(0, 999)}" for _ in range(5000)
+        )
+        expected = day01_part2_for_loop_method(input_str)
+        self.assertEqual(day01_part2_vectorized(input_str, chunk_lines=7), expected)
+        self.assertEqual(
+            day01_part2_vectorized(io.StringIO(input_str), chunk_lines=1000), expected
+        )
 
 
 if __name__ == "__main__":
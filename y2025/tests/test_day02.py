@@ -4,7 +4,13 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from puzzle_solutions.day02 import day02_part1, day02_part2
+from puzzle_solutions.day02 import (
+    day02_part1,
+    day02_part1_brute_force,
+    day02_part2,
+    day02_part2_brute_force,
+    repeated_ids,
+)
 
 
 class TestDay02Methods(unittest.TestCase):
@@ -29,6 +35,30 @@ class TestDay02Methods(unittest.TestCase):
         self.assertEqual(day02_part2("5-3"), 0)
         self.assertEqual(day02_part2("notarange"), 0)
 
+    def test_matches_brute_force(self):
+        for rng in (
+            "1-20000",
+            "95-1012",
+            "99990-101000",
+            "121000-130000",
+            "1188511880-1188511890",
+        ):
+            self.assertEqual(day02_part1(rng), day02_part1_brute_force(rng))
+            self.assertEqual(day02_part2(rng), day02_part2_brute_force(rng))
+
+    def test_repeated_ids_listed_once_in_order(self):
+        # 111111 repeats with block lengths 1, 2 and 3 but is only listed once
+        self.assertEqual(list(repeated_ids(111100, 111200)), [111111])
+        self.assertEqual(list(repeated_ids(1, 30)), [11, 22])
+        self.assertEqual(list(repeated_ids(1, 1000, halves_only=True))[-1], 99)
+        ids = list(repeated_ids(1, 10**6))
+        self.assertEqual(ids, sorted(set(ids)))
+
+    def test_wide_range(self):
+        # Far too wide for the brute force loops
+        self.assertEqual(day02_part1("1-9999999999"), 495495949990950)
+        self.assertEqual(day02_part2("1-9999999999"), sum(repeated_ids(1, 9999999999)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,22 @@
 import unittest
+import random
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from puzzle_solutions.day03 import day03_part1, day03_part2
+from puzzle_solutions.day03 import (
+    batch_joltage,
+    day03_part1,
+    day03_part1_monotonic_stack,
+    day03_part1_vectorized,
+    day03_part2,
+    day03_part2_monotonic_stack,
+    day03_part2_vectorized,
+    find_joltage,
+    max_joltage,
+    parse_banks,
+)
 
 
 class TestDay03Methods(unittest.TestCase):
@@ -38,6 +50,49 @@ class TestDay03Methods(unittest.TestCase):
         # empty input should return 0 or appropriate value
         self.assertEqual(day03_part2(""), 0)
 
+    def test_variants_example(self):
+        self.assertEqual(day03_part1_monotonic_stack(), 357)
+        self.assertEqual(day03_part1_vectorized(), 357)
+        self.assertEqual(day03_part2_monotonic_stack(), 3121910778619)
+        self.assertEqual(day03_part2_vectorized(), 3121910778619)
+
+    def test_variants_empty_input(self):
+        self.assertEqual(day03_part2_monotonic_stack(""), 0)
+        self.assertEqual(day03_part2_vectorized(""), 0)
+
+
+class TestJoltageSelection(unittest.TestCase):
+    def test_matches_find_joltage(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            num_maxs = rng.randint(1, 14)
+            # Fewer distinct digits gives lots of ties
+            alphabet = "0123456789"[: rng.randint(1, 10)]
+            banks = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(num_maxs, 40)))
+                for _ in range(rng.randint(1, 5))
+            ]
+            expected = [find_joltage([int(d) for d in b], num_maxs) for b in banks]
+            self.assertEqual([max_joltage(b, num_maxs) for b in banks], expected)
+            self.assertEqual(
+                batch_joltage(parse_banks("\n".join(banks)), num_maxs).tolist(),
+                expected,
+            )
+
+    def test_max_joltage_accepts_int_lists(self):
+        self.assertEqual(max_joltage([8, 1, 8, 1, 9], 3), 889)
+
+    def test_ragged_banks(self):
+        banks = parse_banks("12345\n91\n")
+        self.assertEqual(banks.shape, (2, 5))
+        self.assertEqual(batch_joltage(banks).tolist(), [45, 91])
+
+    def test_too_few_digits(self):
+        with self.assertRaises(ValueError):
+            max_joltage("123", 4)
+        with self.assertRaises(ValueError):
+            batch_joltage(parse_banks("12345\n123"), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from puzzle_solutions.day04 import (
+    EXAMPLE,
+    day00_part2,
+    day04_part1,
+    day04_part1_vectorized,
+    day04_part2_vectorized,
+    neighbour_counts,
+    parse_grid,
+    removal_rounds,
+)
+
+
+def random_grid(rng, rows, cols, density):
+    return "\n".join(
+        "".join("@" if rng.random() < density else "." for _ in range(cols))
+        for _ in range(rows)
+    )
+
+
+class TestDay04Methods(unittest.TestCase):
+    def test_part1_example(self):
+        self.assertEqual(day04_part1(), 13)
+        self.assertEqual(day04_part1_vectorized(), 13)
+
+    def test_part2_example(self):
+        self.assertEqual(day00_part2(), 43)
+        self.assertEqual(day04_part2_vectorized(), 43)
+
+    def test_vectorized_matches_loops(self):
+        rng = random.Random(4)
+        for _ in range(20):
+            grid = random_grid(
+                rng, rng.randint(1, 20), rng.randint(1, 20), rng.random()
+            )
+            self.assertEqual(day04_part1_vectorized(grid), day04_part1(grid))
+            self.assertEqual(day04_part2_vectorized(grid), day00_part2(grid))
+
+
+class TestGridHelpers(unittest.TestCase):
+    def test_neighbour_counts(self):
+        counts = neighbour_counts(parse_grid("@@@\n@.@\n@@@"))
+        self.assertEqual(counts.tolist(), [[2, 4, 2], [4, 8, 4], [2, 4, 2]])
+
+    def test_rounds_match_example(self):
+        # The first round removes exactly the part 1 answer
+        rounds = list(removal_rounds(parse_grid(EXAMPLE)))
+        self.assertEqual(rounds[0], 13)
+        self.assertEqual(sum(rounds), 43)
+
+    def test_empty(self):
+        self.assertEqual(day04_part1_vectorized(""), 0)
+        self.assertEqual(day04_part2_vectorized(""), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
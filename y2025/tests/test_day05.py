@@ -0,0 +1,65 @@
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from puzzle_solutions.day05 import (
+    IntervalIndex,
+    day05_part1,
+    day05_part1_vectorized,
+    day05_part2,
+)
+
+
+class TestDay05Methods(unittest.TestCase):
+    def test_part1_example(self):
+        self.assertEqual(day05_part1(), 3)
+        self.assertEqual(day05_part1_vectorized(), 3)
+
+    def test_part2_example(self):
+        self.assertEqual(day05_part2(), 14)
+
+    def test_part1_vectorized_matches_loop(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            ranges = []
+            for _ in range(rng.randint(1, 30)):
+                start = rng.randint(0, 10**12)
+                ranges.append(f"{start}-{start + rng.randint(0, 10**10)}")
+            ids = [str(rng.randint(0, 10**12)) for _ in range(200)]
+            # Make sure some range ends are checked too
+            ids.extend(r.split("-")[rng.randint(0, 1)] for r in ranges)
+            input_str = "\n".join(ranges) + "\n\n" + "\n".join(ids)
+            self.assertEqual(day05_part1_vectorized(input_str), day05_part1(input_str))
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_contains(self):
+        index = IntervalIndex([(3, 5), (10, 14), (16, 20), (12, 18)])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(
+            index.contains([1, 3, 5, 6, 9, 10, 15, 20, 21]).tolist(),
+            [False, True, True, False, False, True, True, True, False],
+        )
+        self.assertEqual(index.total_size(), 14)
+
+    def test_empty(self):
+        self.assertEqual(IntervalIndex().contains([1, 2]).tolist(), [False, False])
+
+    def test_add_matches_rebuild(self):
+        rng = random.Random(7)
+        ranges = []
+        index = IntervalIndex()
+        for _ in range(200):
+            start = rng.randint(0, 1000)
+            ranges.append((start, start + rng.randint(0, 30)))
+            index.add(*ranges[-1])
+            rebuilt = IntervalIndex(ranges)
+            self.assertEqual(index.starts.tolist(), rebuilt.starts.tolist())
+            self.assertEqual(index.stops.tolist(), rebuilt.stops.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from puzzle_solutions.day06 import (
+    EXAMPLE,
+    day06_part1,
+    day06_part1_vectorized,
+    day06_part2,
+    day06_part2_vectorized,
+    load_worksheet,
+    problem_starts,
+)
+
+
+def random_worksheet(rng, problems, rows, max_digits):
+    columns, operators = [], []
+    for _ in range(problems):
+        numbers = [
+            str(rng.randint(1, 10 ** rng.randint(1, max_digits) - 1))
+            for _ in range(rows)
+        ]
+        width = max(map(len, numbers))
+        # Numbers in a problem are all aligned to the same side
+        align = str.rjust if rng.random() < 0.5 else str.ljust
+        columns.append([align(n, width) for n in numbers])
+        operators.append(rng.choice("+*").ljust(width))
+    lines = [" ".join(c[r] for c in columns) for r in range(rows)]
+    return "\n".join(lines + [" ".join(operators)])
+
+
+class TestDay06Methods(unittest.TestCase):
+    def test_part1_example(self):
+        self.assertEqual(day06_part1(), 4277556)
+        self.assertEqual(day06_part1_vectorized(), 4277556)
+
+    def test_part2_example(self):
+        self.assertEqual(day06_part2(), 3263827)
+        self.assertEqual(day06_part2_vectorized(), 3263827)
+
+    def test_vectorized_matches_loops(self):
+        rng = random.Random(6)
+        for _ in range(100):
+            worksheet = random_worksheet(
+                rng, rng.randint(1, 10), rng.randint(1, 5), rng.randint(1, 6)
+            )
+            self.assertEqual(
+                day06_part1_vectorized(worksheet), day06_part1(worksheet)
+            )
+            # The loop version cannot read a column with a gap part way down
+            try:
+                expected = day06_part2(worksheet)
+            except ValueError:
+                continue
+            self.assertEqual(day06_part2_vectorized(worksheet), expected)
+
+    def test_large_products_do_not_overflow(self):
+        worksheet = "\n".join(["9" * 10] * 4 + ["*" + " " * 9])
+        self.assertEqual(day06_part1_vectorized(worksheet), (10**10 - 1) ** 4)
+        self.assertEqual(day06_part2_vectorized(worksheet), 9999**10)
+
+
+class TestWorksheet(unittest.TestCase):
+    def test_load_pads_short_rows(self):
+        worksheet = load_worksheet("12\n3\n+ ")
+        self.assertEqual(worksheet.shape, (3, 2))
+        self.assertEqual(bytes(worksheet[1]), b"3 ")
+
+    def test_problem_starts(self):
+        starts, products = problem_starts(load_worksheet(EXAMPLE))
+        self.assertEqual(starts.tolist(), [0, 4, 8, 12])
+        self.assertEqual(products.tolist(), [True, False, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
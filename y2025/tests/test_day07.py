@@ -0,0 +1,100 @@
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from puzzle_solutions.day07 import (
+    day07_part1,
+    day07_part1_vectorized,
+    day07_part2,
+    day07_part2_vectorized,
+    parse_manifold,
+    propagate_beams,
+)
+
+
+def random_manifold(rng, width, height, density):
+    start = rng.randint(1, width - 1)
+    rows = ["." * start + "S" + "." * (width - start - 1)]
+    for _ in range(height):
+        row = ["."] * width
+        for j in range(width):
+            # The puzzle never puts two splitters side by side
+            if rng.random() < density and (j == 0 or row[j - 1] != "^"):
+                row[j] = "^"
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
+
+
+class TestDay07Methods(unittest.TestCase):
+    def test_part1_example(self):
+        self.assertEqual(day07_part1(), 21)
+        self.assertEqual(day07_part1_vectorized(), 21)
+
+    def test_part2_example(self):
+        self.assertEqual(day07_part2(), 40)
+        self.assertEqual(day07_part2_vectorized(), 40)
+
+    def test_vectorized_matches_loops(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            manifold = random_manifold(
+                rng, rng.randint(3, 30), rng.randint(1, 30), rng.random() / 2
+            )
+            self.assertEqual(
+                propagate_beams(manifold),
+                (day07_part1(manifold), day07_part2(manifold)),
+            )
+
+    def test_counts_beyond_int64(self):
+        # Every row doubles the timelines, 70 rows is well past 2**63
+        width = 141
+        start = width // 2
+        rows = ["." * start + "S" + "." * (width - start - 1)]
+        for i in range(70):
+            rows.append(
+                "".join("^" if j % 2 == (start + i) % 2 else "." for j in range(width))
+            )
+        manifold = "\n".join(rows)
+        self.assertEqual(propagate_beams(manifold), (sum(range(1, 71)), 2**70))
+
+    def test_total_beyond_int64(self):
+        # The worked example's triangle carried on, no single count gets near
+        # int64 but the total does, 2**63 timelines after 63 rows of splitters
+        for levels in (63, 64):
+            width = 2 * levels + 3
+            start = levels + 1
+            rows = ["." * start + "S" + "." * (width - start - 1), "." * width]
+            for level in range(levels):
+                row = ["."] * width
+                for col in range(start - level, start + level + 1, 2):
+                    row[col] = "^"
+                rows += ["".join(row), "." * width]
+            manifold = "\n".join(rows)
+            self.assertEqual(
+                propagate_beams(manifold), (levels * (levels + 1) // 2, 2**levels)
+            )
+            self.assertEqual(day07_part2(manifold), 2**levels)
+
+
+class TestParseManifold(unittest.TestCase):
+    def test_splitter_columns(self):
+        start, width, splitters = parse_manifold("..S..\n.....\n.^.^.\n..^..\n")
+        self.assertEqual((start, width), (2, 5))
+        self.assertEqual(
+            [(row, cols.tolist()) for row, cols in splitters], [(2, [1, 3]), (3, [2])]
+        )
+
+    def test_single_line(self):
+        self.assertEqual(parse_manifold("..S.."), (2, 5, []))
+        self.assertEqual(propagate_beams("..S.."), (0, 1))
+
+    def test_missing_start(self):
+        with self.assertRaises(ValueError):
+            parse_manifold(".....\n..^..\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import random
+import re
+import sys
+import os
+from pathlib import Path
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from puzzle_solutions.input_loader import (
+    blocks,
+    char_grid,
+    int_columns,
+    ints,
+    map_input,
+    ragged_ints,
+    range_pairs,
+)
+
+
+class TestIntegerParsers(unittest.TestCase):
+    def test_ints(self):
+        self.assertEqual(ints("3-5\n-10 x-4 7--8").tolist(), [3, 5, -10, -4, 7, -8])
+        self.assertEqual(ints("").tolist(), [])
+
+    def test_ints_match_regex(self):
+        rng = random.Random(19)
+        for _ in range(300):
+            text = "".join(
+                rng.choice("0123456789- \n,x") for _ in range(rng.randint(0, 60))
+            )
+            if any(len(m) > 18 for m in re.findall(r"[0-9]+", text)):
+                continue
+            expected = [int(m) for m in re.findall(r"(?<![0-9])-?[0-9]+", text)]
+            self.assertEqual(ints(text).tolist(), expected)
+
+    def test_too_many_digits(self):
+        with self.assertRaises(ValueError):
+            ints("1" * 19)
+
+    def test_range_pairs(self):
+        self.assertEqual(
+            range_pairs("11-22,95-115\n998-1012").tolist(),
+            [[11, 22], [95, 115], [998, 1012]],
+        )
+        with self.assertRaises(ValueError):
+            range_pairs("1-2,3")
+
+    def test_int_columns(self):
+        left, right = int_columns("3   4\n4   3\n2   5\n").T
+        self.assertEqual(left.tolist(), [3, 4, 2])
+        self.assertEqual(right.tolist(), [4, 3, 5])
+        for ragged in ["1 2\n3\n4 5", "1\n2 3\n4", "1 2 3\n4 5\n6"]:
+            with self.assertRaises(ValueError):
+                int_columns(ragged)
+
+    def test_ragged_ints(self):
+        values, offsets = ragged_ints("7 6 4 2 1\n1 2\n\n9\n")
+        self.assertEqual(values.tolist(), [7, 6, 4, 2, 1, 1, 2, 9])
+        self.assertEqual(offsets.tolist(), [0, 5, 7, 7, 8])
+
+
+class TestLayoutParsers(unittest.TestCase):
+    def test_char_grid_is_a_view(self):
+        data = np.frombuffer(b"..@\n@@.\n", dtype=np.uint8)
+        grid = char_grid(data)
+        self.assertEqual(grid.shape, (2, 3))
+        self.assertTrue(np.shares_memory(grid, data))
+        self.assertEqual((grid == ord("@")).sum(), 3)
+        with self.assertRaises(ValueError):
+            char_grid("...\n..\n...")
+
+    def test_blocks(self):
+        ranges, ids = blocks("3-5\n10-14\n\n1\n5\n")
+        self.assertEqual(range_pairs(ranges).tolist(), [[3, 5], [10, 14]])
+        self.assertEqual(ints(ids).tolist(), [1, 5])
+        self.assertEqual(blocks("\n\n"), [])
+
+
+class TestMapInput(unittest.TestCase):
+    def test_map_input(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "day01.txt"
+            path.write_text("L68\nR48\n")
+            data = map_input(path)
+            self.assertEqual(ints(data).tolist(), [68, 48])
+            del data
+            path.write_text("")
+            self.assertEqual(len(map_input(path)), 0)
+            with self.assertRaises(FileNotFoundError):
+                map_input(Path(tmp) / "missing.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()